@@ -0,0 +1,38 @@
+"""Add search facet indexes
+
+Revision ID: 2f7a9c4d1e63
+Revises: 9d41c2e7b8a5
+Create Date: 2026-10-19 15:24:08.417392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2f7a9c4d1e63"
+down_revision: Union[str, None] = "9d41c2e7b8a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Search matches on the indexed column; posts tables that predate the
+    # initial migration were adopted without it
+    op.execute(
+        """
+        ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', title || ' ' || content)) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_fts ON posts USING gin (search_vector)"
+    )
+    # Tag filters go from tag to posts; the primary key leads with post_id
+    op.create_index("idx_post_tags_tag_id", "post_tags", ["tag_id", "post_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_post_tags_tag_id", table_name="post_tags")
+    # search_vector and idx_posts_fts belong to the initial migration
@@ -0,0 +1,38 @@
+"""Add timeline keyset indexes
+
+Revision ID: 46c62cb5e35c
+Revises: 7cd6b67cbd69
+Create Date: 2026-10-19 12:05:41.207339
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "46c62cb5e35c"
+down_revision: Union[str, None] = "7cd6b67cbd69"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the timeline's ORDER BY created_at DESC, id DESC keyset scans
+    op.create_index(
+        "idx_posts_published_created_at",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("published"),
+    )
+    op.create_index(
+        "idx_feed_posts_created_at_id",
+        "feed_posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_feed_posts_created_at_id", table_name="feed_posts")
+    op.drop_index("idx_posts_published_created_at", table_name="posts")
@@ -0,0 +1,51 @@
+"""Add suggest trigram indexes
+
+Revision ID: 5e0b8f3a91c2
+Revises: 46c62cb5e35c
+Create Date: 2026-10-19 13:02:17.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0b8f3a91c2"
+down_revision: Union[str, None] = "46c62cb5e35c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Typo-tolerant matches on titles and tag names (% and <% operators)
+    op.execute(
+        """
+        CREATE INDEX idx_posts_title_trgm ON posts
+        USING gin (lower(title) gin_trgm_ops)
+        WHERE published
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_tags_name_trgm ON tags
+        USING gin (lower(name) gin_trgm_ops)
+        """
+    )
+    # Prefix matches on whole title words (to_tsquery 'word:*')
+    op.execute(
+        """
+        CREATE INDEX idx_posts_title_tsv ON posts
+        USING gin (to_tsvector('simple', title))
+        WHERE published
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_posts_title_tsv", table_name="posts")
+    op.drop_index("idx_tags_name_trgm", table_name="tags")
+    op.drop_index("idx_posts_title_trgm", table_name="posts")
+    # The extension stays; other objects may rely on it
@@ -0,0 +1,50 @@
+"""Add derived post fields
+
+Revision ID: 73b81a4ccd8b
+Revises: be4785de3ff0
+Create Date: 2026-10-19 10:02:47.915330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "73b81a4ccd8b"
+down_revision: Union[str, None] = "be4785de3ff0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows get empty values; `python -m qubit backfill-derived` fills them
+    op.add_column(
+        "posts", sa.Column("excerpt", sa.Text(), server_default="", nullable=False)
+    )
+    op.add_column(
+        "posts",
+        sa.Column("word_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "posts",
+        sa.Column("reading_time", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "posts",
+        sa.Column(
+            "toc",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "toc")
+    op.drop_column("posts", "reading_time")
+    op.drop_column("posts", "word_count")
+    op.drop_column("posts", "excerpt")
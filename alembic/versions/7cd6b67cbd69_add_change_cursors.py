@@ -0,0 +1,105 @@
+"""Add change cursors
+
+Revision ID: 7cd6b67cbd69
+Revises: 73b81a4ccd8b
+Create Date: 2026-10-19 11:20:04.512876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7cd6b67cbd69"
+down_revision: Union[str, None] = "73b81a4ccd8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CURSOR_TABLES = ("posts", "feed_posts")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tombstones",
+        sa.Column("table_name", sa.String(length=50), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("table_name", "id"),
+    )
+    op.create_index(
+        "idx_tombstones_deleted_at", "tombstones", ["table_name", "deleted_at"]
+    )
+    for table in CURSOR_TABLES:
+        op.create_index(f"idx_{table}_updated_at", table, ["updated_at"])
+
+    # Writes that don't set updated_at themselves still move the cursor
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION qubit_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := clock_timestamp();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # Deleted rows, and posts taken out of the public list, leave a tombstone.
+    # clock_timestamp() keeps rows removed in one transaction distinct for cursors.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION qubit_record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO tombstones (table_name, id, deleted_at)
+            VALUES (TG_TABLE_NAME, OLD.id, clock_timestamp())
+            ON CONFLICT (table_name, id)
+            DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    for table in CURSOR_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_touch_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION qubit_touch_updated_at();
+
+            CREATE TRIGGER {table}_record_tombstone
+            AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION qubit_record_tombstone();
+            """
+        )
+    op.execute(
+        """
+        CREATE TRIGGER posts_record_unpublish
+        AFTER UPDATE OF published ON posts
+        FOR EACH ROW WHEN (OLD.published AND NOT NEW.published)
+        EXECUTE FUNCTION qubit_record_tombstone();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS posts_record_unpublish ON posts")
+    for table in CURSOR_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_record_tombstone ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+        op.drop_index(f"idx_{table}_updated_at", table_name=table)
+    op.execute("DROP FUNCTION IF EXISTS qubit_record_tombstone()")
+    op.execute("DROP FUNCTION IF EXISTS qubit_touch_updated_at()")
+    op.drop_index("idx_tombstones_deleted_at", table_name="tombstones")
+    op.drop_table("tombstones")
@@ -0,0 +1,79 @@
+"""Add post embeddings
+
+Revision ID: 9d41c2e7b8a5
+Revises: 5e0b8f3a91c2
+Create Date: 2026-10-19 14:11:52.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d41c2e7b8a5"
+down_revision: Union[str, None] = "5e0b8f3a91c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match EMBEDDING_DIMS in qubit/services/related.py
+EMBEDDING_DIMS = 64
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    # Kept out of posts so writing embeddings doesn't move change cursors
+    op.create_table(
+        "post_embeddings",
+        sa.Column("post_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("embedding", Vector(EMBEDDING_DIMS), nullable=False),
+        sa.Column(
+            "related_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+    op.create_index(
+        "idx_post_embeddings_hnsw",
+        "post_embeddings",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+    # The fitted TF-IDF weights and SVD projection; a single row
+    op.create_table(
+        "embedding_model",
+        sa.Column("id", sa.SmallInteger(), nullable=False),
+        sa.Column("idf", sa.LargeBinary(), nullable=False),
+        sa.Column("components", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "fitted_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("id = 1", name="embedding_model_single_row"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_model")
+    op.drop_index("idx_post_embeddings_hnsw", table_name="post_embeddings")
+    op.drop_table("post_embeddings")
+    # The extension stays; other objects may rely on it
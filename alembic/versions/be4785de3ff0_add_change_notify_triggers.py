@@ -0,0 +1,84 @@
+"""Add change notification triggers
+
+Revision ID: be4785de3ff0
+Revises: cc37424d4e9b
+Create Date: 2026-10-19 09:12:31.418204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "be4785de3ff0"
+down_revision: Union[str, None] = "cc37424d4e9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFY_TABLES = ("posts", "post_tags", "feed_posts")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION qubit_notify_change() RETURNS trigger AS $$
+        DECLARE
+            rec RECORD;
+            changed_id TEXT;
+            new_slug TEXT := NULL;
+            old_slug TEXT := NULL;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                rec := OLD;
+            ELSE
+                rec := NEW;
+            END IF;
+
+            IF TG_TABLE_NAME = 'post_tags' THEN
+                changed_id := rec.post_id::text;
+            ELSE
+                changed_id := rec.id::text;
+            END IF;
+
+            IF TG_TABLE_NAME = 'posts' THEN
+                IF TG_OP <> 'DELETE' THEN
+                    new_slug := NEW.slug;
+                END IF;
+                IF TG_OP <> 'INSERT' THEN
+                    old_slug := OLD.slug;
+                END IF;
+            END IF;
+
+            PERFORM pg_notify(
+                'qubit_changes',
+                json_build_object(
+                    'table', TG_TABLE_NAME,
+                    'op', TG_OP,
+                    'id', changed_id,
+                    'slug', new_slug,
+                    'old_slug', old_slug
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    for table in NOTIFY_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION qubit_notify_change();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in NOTIFY_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_change ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS qubit_notify_change()")
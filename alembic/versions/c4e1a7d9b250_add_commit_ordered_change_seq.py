@@ -0,0 +1,179 @@
+"""Add commit-ordered change sequence
+
+Revision ID: c4e1a7d9b250
+Revises: 2f7a9c4d1e63
+Create Date: 2026-10-19 16:05:41.270583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e1a7d9b250"
+down_revision: Union[str, None] = "2f7a9c4d1e63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CURSOR_TABLES = ("posts", "feed_posts")
+# Advisory lock key serializing change stamps
+CHANGE_LOCK = 7251
+
+
+def upgrade() -> None:
+    # The old trigger only filled in updated_at; stamping takes over below
+    for table in CURSOR_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS qubit_touch_updated_at()")
+
+    op.execute("CREATE SEQUENCE qubit_change_seq")
+    for table in (*CURSOR_TABLES, "tombstones"):
+        op.add_column(table, sa.Column("change_seq", sa.BigInteger(), nullable=True))
+
+    # Number existing rows in the order their timestamps gave them, without
+    # notifying listeners about every row
+    for table in CURSOR_TABLES:
+        op.execute(f"ALTER TABLE {table} DISABLE TRIGGER {table}_notify_change")
+    op.execute(
+        """
+        CREATE TEMP TABLE change_order AS
+        SELECT source, table_name, id,
+               row_number() OVER (ORDER BY at NULLS FIRST, id) AS seq
+        FROM (
+            SELECT 'posts' AS source, 'posts' AS table_name, id, updated_at AS at
+            FROM posts
+            UNION ALL
+            SELECT 'feed_posts', 'feed_posts', id, updated_at FROM feed_posts
+            UNION ALL
+            SELECT 'tombstones', table_name, id, deleted_at FROM tombstones
+        ) AS changes
+        """
+    )
+    for table in CURSOR_TABLES:
+        op.execute(
+            f"""
+            UPDATE {table} t SET change_seq = o.seq
+            FROM change_order o
+            WHERE o.source = '{table}' AND o.id = t.id
+            """
+        )
+    op.execute(
+        """
+        UPDATE tombstones t SET change_seq = o.seq
+        FROM change_order o
+        WHERE o.source = 'tombstones'
+        AND o.table_name = t.table_name AND o.id = t.id
+        """
+    )
+    op.execute(
+        """
+        SELECT setval('qubit_change_seq', GREATEST(max(seq), 1), max(seq) IS NOT NULL)
+        FROM change_order
+        """
+    )
+    op.execute("DROP TABLE change_order")
+    for table in CURSOR_TABLES:
+        op.execute(f"ALTER TABLE {table} ENABLE TRIGGER {table}_notify_change")
+
+    for table in (*CURSOR_TABLES, "tombstones"):
+        op.alter_column(table, "change_seq", nullable=False)
+    for table in CURSOR_TABLES:
+        op.create_index(f"idx_{table}_change_seq", table, ["change_seq"])
+    op.create_index(
+        "idx_tombstones_change_seq", "tombstones", ["table_name", "change_seq"]
+    )
+
+    # Every write is stamped here, from one clock. The lock is held until
+    # commit, so stamps are handed out in commit order: a reader that sees
+    # a stamp sees every smaller one, and cursors never pass a change still
+    # to commit. Writers to these tables queue behind each other.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION qubit_stamp_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock({CHANGE_LOCK});
+            NEW.change_seq := nextval('qubit_change_seq');
+            NEW.updated_at := clock_timestamp() AT TIME ZONE 'UTC';
+            IF TG_OP = 'INSERT' AND NEW.created_at IS NULL THEN
+                NEW.created_at := NEW.updated_at;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION qubit_record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock({CHANGE_LOCK});
+            INSERT INTO tombstones (table_name, id, deleted_at, change_seq)
+            VALUES (
+                TG_TABLE_NAME, OLD.id, clock_timestamp() AT TIME ZONE 'UTC',
+                nextval('qubit_change_seq')
+            )
+            ON CONFLICT (table_name, id)
+            DO UPDATE SET deleted_at = EXCLUDED.deleted_at,
+                          change_seq = EXCLUDED.change_seq;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in CURSOR_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_stamp_change
+            BEFORE INSERT OR UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION qubit_stamp_change();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in CURSOR_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_stamp_change ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS qubit_stamp_change()")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION qubit_record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO tombstones (table_name, id, deleted_at)
+            VALUES (TG_TABLE_NAME, OLD.id, clock_timestamp())
+            ON CONFLICT (table_name, id)
+            DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.drop_index("idx_tombstones_change_seq", table_name="tombstones")
+    for table in CURSOR_TABLES:
+        op.drop_index(f"idx_{table}_change_seq", table_name=table)
+    for table in (*CURSOR_TABLES, "tombstones"):
+        op.drop_column(table, "change_seq")
+    op.execute("DROP SEQUENCE IF EXISTS qubit_change_seq")
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION qubit_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := clock_timestamp();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in CURSOR_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_touch_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION qubit_touch_updated_at();
+            """
+        )
@@ -0,0 +1,154 @@
+"""Replay typical read traffic with and without conditional requests.
+
+Runs the same request mix twice against a running server: once as clients
+that always re-download, and once as clients that revalidate with the
+ETag/Last-Modified they were given. Reports bytes transferred, 304s and,
+when a config is given, database transactions committed during each run.
+
+Usage: python -m benchmarks.conditional_get [--base-url http://127.0.0.1:8000]
+           [--visitors 20] [--visits 10] [--config data/config.yaml]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+import asyncpg
+
+from qubit.core.config import load_config
+
+
+# Pollers of the JSON API plus repeat visitors to public pages
+TRAFFIC = [
+    ("/api/feed", 30),
+    ("/api/posts", 25),
+    ("/", 20),
+    ("/about", 5),
+]
+
+
+def fetch(url: str, headers: Dict[str, str]) -> Tuple[int, int, Dict[str, str]]:
+    """GET a URL, returning status, body size and validator headers."""
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            body = response.read()
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            return response.status, len(body), headers
+    except urllib.error.HTTPError as e:
+        headers = {k.lower(): v for k, v in e.headers.items()}
+        return e.code, len(e.read() or b""), headers
+
+
+def discover_posts(base_url: str, limit: int) -> List[str]:
+    """Add individual post pages to the mix."""
+    with urllib.request.urlopen(f"{base_url}/api/posts?limit={limit}") as response:
+        posts = json.loads(response.read())["data"]["posts"]
+    return [f"/api/posts/{post['slug']}" for post in posts] + [
+        f"/posts/{post['id']}" for post in posts
+    ]
+
+
+def build_plan(paths: List[str], visitors: int, visits: int, seed: int) -> List[List[str]]:
+    """Pick each visitor's sequence of requests."""
+    rng = random.Random(seed)
+    weighted = [path for path, weight in TRAFFIC for _ in range(weight)]
+    weighted += paths * 2
+    return [[rng.choice(weighted) for _ in range(visits)] for _ in range(visitors)]
+
+
+def replay(base_url: str, plan: List[List[str]], conditional: bool) -> dict:
+    """Replay the plan, optionally revalidating with stored validators."""
+    stats = {"requests": 0, "not_modified": 0, "bytes": 0}
+    for visits in plan:
+        stored: Dict[str, Dict[str, str]] = {}
+        for path in visits:
+            headers = {}
+            if conditional and path in stored:
+                cached = stored[path]
+                if "etag" in cached:
+                    headers["If-None-Match"] = cached["etag"]
+                if "last-modified" in cached:
+                    headers["If-Modified-Since"] = cached["last-modified"]
+
+            status, size, response_headers = fetch(f"{base_url}{path}", headers)
+            stats["requests"] += 1
+            stats["bytes"] += size
+            if status == 304:
+                stats["not_modified"] += 1
+            elif status == 200:
+                stored[path] = response_headers
+    return stats
+
+
+async def committed_transactions(config_path: Optional[str]) -> Optional[int]:
+    """Transactions committed in the app database so far."""
+    if not config_path:
+        return None
+    config = load_config(config_path)
+    conn = await asyncpg.connect(
+        host=config.database.host,
+        port=config.database.port,
+        database=config.database.name,
+        user=config.database.user,
+        password=config.database.password,
+    )
+    try:
+        return await conn.fetchval(
+            "SELECT xact_commit FROM pg_stat_database WHERE datname = $1",
+            config.database.name,
+        )
+    finally:
+        await conn.close()
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--visitors", type=int, default=20)
+    parser.add_argument("--visits", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--config", default=None, help="Config to read DB stats with")
+    args = parser.parse_args()
+
+    paths = discover_posts(args.base_url, args.posts)
+    plan = build_plan(paths, args.visitors, args.visits, args.seed)
+
+    results = {}
+    for conditional in (False, True):
+        before = asyncio.run(committed_transactions(args.config))
+        start = time.perf_counter()
+        stats = replay(args.base_url, plan, conditional)
+        stats["seconds"] = time.perf_counter() - start
+        after = asyncio.run(committed_transactions(args.config))
+        if before is not None:
+            stats["db_transactions"] = after - before
+        results["conditional" if conditional else "unconditional"] = stats
+
+    for name, stats in results.items():
+        line = (
+            f"{name:>13}: {stats['requests']} requests, "
+            f"{stats['not_modified']} not modified, "
+            f"{stats['bytes'] / 1024:.1f} KiB, {stats['seconds']:.2f}s"
+        )
+        if "db_transactions" in stats:
+            line += f", {stats['db_transactions']} db transactions"
+        print(line)
+
+    base, cond = results["unconditional"], results["conditional"]
+    saved = 1 - cond["bytes"] / base["bytes"] if base["bytes"] else 0
+    print(f"bytes saved: {saved:.1%}")
+    if "db_transactions" in base and base["db_transactions"]:
+        queries = 1 - cond["db_transactions"] / base["db_transactions"]
+        print(f"db transactions saved: {queries:.1%}")
+
+
+if __name__ == "__main__":
+    main()
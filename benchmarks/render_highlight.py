@@ -0,0 +1,98 @@
+"""Benchmark markdown rendering with and without server-side highlighting.
+
+Usage: python -m benchmarks.render_highlight [--posts 50] [--blocks 20]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import markdown
+
+from qubit.models.config import RenderConfig
+from qubit.services.render import (
+    MARKDOWN_EXTENSION_CONFIGS,
+    MARKDOWN_EXTENSIONS,
+    MarkdownRenderer,
+)
+
+
+SNIPPETS = {
+    "python": "def handler(event, context):\n    items = [x * 2 for x in event['items']]\n    return {'count': len(items), 'items': items}\n",
+    "rust": "fn main() {\n    let v: Vec<u32> = (0..10).map(|x| x * x).collect();\n    println!(\"{:?}\", v);\n}\n",
+    "javascript": "async function load(url) {\n  const res = await fetch(url);\n  return (await res.json()).data ?? [];\n}\n",
+    "bash": "for f in *.log; do\n  gzip -9 \"$f\" && echo \"compressed $f\"\ndone\n",
+}
+
+
+def make_post(blocks: int, rng: random.Random) -> str:
+    """Build a code-heavy markdown post."""
+    parts = ["# Benchmark post\n", "Some introductory prose about the code below.\n"]
+    for i in range(blocks):
+        lang = rng.choice(list(SNIPPETS))
+        body = SNIPPETS[lang] * rng.randint(2, 8)
+        parts.append(f"## Step {i}\n\nExplanation for step {i}.\n\n```{lang}\n{body}```\n")
+    return "\n".join(parts)
+
+
+def time_sync(posts, extensions, configs) -> list:
+    """Time conversions with a reused, reset renderer."""
+    md = markdown.Markdown(extensions=extensions, extension_configs=configs)
+    timings = []
+    for post in posts:
+        start = time.perf_counter()
+        md.reset().convert(post)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def time_pool(posts, workers: int) -> float:
+    """Time rendering all posts through the process pool, bypassing caches."""
+    renderer = MarkdownRenderer(RenderConfig(max_workers=workers))
+    # Spawn every worker before timing
+    await asyncio.gather(*(renderer._render_in_pool(posts[0]) for _ in range(workers)))
+    start = time.perf_counter()
+    await asyncio.gather(*(renderer._render_in_pool(post) for post in posts))
+    elapsed = (time.perf_counter() - start) * 1000
+    renderer.shutdown()
+    return elapsed
+
+
+def summarize(label: str, timings: list) -> None:
+    """Print p50/p99 for a set of timings."""
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<28} p50={statistics.median(ordered):7.2f}ms "
+        f"p99={p99:7.2f}ms total={sum(ordered):8.1f}ms"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    posts = [make_post(args.blocks, rng) for _ in range(args.posts)]
+    size = sum(len(post) for post in posts) / len(posts)
+    print(f"{args.posts} posts, {args.blocks} code blocks each, avg {size / 1024:.1f} KiB")
+
+    plain = [ext for ext in MARKDOWN_EXTENSIONS if ext != "codehilite"]
+    summarize("fenced_code only", time_sync(posts, plain, {}))
+    summarize(
+        "with codehilite",
+        time_sync(posts, MARKDOWN_EXTENSIONS, MARKDOWN_EXTENSION_CONFIGS),
+    )
+
+    elapsed = asyncio.run(time_pool(posts, args.workers))
+    print(f"{'process pool (' + str(args.workers) + ' workers)':<28} total={elapsed:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Benchmark the in-process BM25 index against PostgreSQL full-text search.
+
+Builds a synthetic corpus with a Zipf-like word distribution, then reports
+index build time, snapshot size and load time, and query latency for the
+same queries on each backend. Postgres is only measured when a config is
+given; the corpus goes into a temporary table with the same generated
+search vector, GIN index and ranking query the app uses.
+
+Usage: python -m benchmarks.search_backends [--posts 2000] [--queries 200]
+           [--config data/config.yaml]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import asyncpg
+import orjson
+
+from qubit.core.config import load_config
+from qubit.database.posts import HEADLINE_OPTIONS
+from qubit.search.bm25 import BM25Index, snippet, tokenize
+
+
+SYLLABLES = ["ka", "ri", "to", "mu", "sen", "lo", "vi", "dra", "pe", "zu", "ni"]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    """Distinct made-up words."""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 5))))
+    return sorted(words)
+
+
+def make_corpus(count: int, vocabulary: List[str], seed: int) -> List[Tuple]:
+    """Posts as (id, title, content), word frequencies falling off by rank."""
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    posts = []
+    for _ in range(count):
+        title = " ".join(rng.choices(vocabulary, weights, k=6))
+        length = rng.randint(300, 1500)
+        content = " ".join(rng.choices(vocabulary, weights, k=length))
+        posts.append((str(uuid.uuid4()), title, content))
+    return posts
+
+
+def make_queries(count: int, vocabulary: List[str], seed: int) -> List[str]:
+    """One to three words, mostly from the middle of the frequency range."""
+    rng = random.Random(seed)
+    middle = vocabulary[20:2000]
+    return [" ".join(rng.sample(middle, rng.randint(1, 3))) for _ in range(count)]
+
+
+def timed(func: Callable, *args) -> float:
+    """Run func once, returning the time taken in ms."""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def percentiles(timings: List[float]) -> Tuple[float, float]:
+    """p50 and p99 of timings."""
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return statistics.median(timings), p99
+
+
+def build_index(posts: List[Tuple]) -> BM25Index:
+    """Index the corpus the way the memory backend does."""
+    index = BM25Index()
+    for post_id, title, content in posts:
+        payload = orjson.dumps({"summary": {"title": title}, "text": content})
+        index.add(post_id, f"{title} {content}", payload)
+    return index
+
+
+def search_index(index: BM25Index, query: str, limit: int = 10) -> list:
+    """A page of results with snippets, as the memory backend returns them."""
+    hits, _ = index.search(query, limit=limit)
+    terms = tokenize(query)
+    return [snippet(index.payload(post_id)["text"], terms) for post_id, _ in hits]
+
+
+async def postgres_timings(
+    config_path: str, posts: List[Tuple], queries: List[str]
+) -> Tuple[float, List[float]]:
+    """Index build time and per-query times for PostgreSQL full-text search."""
+    config = load_config(config_path)
+    conn = await asyncpg.connect(
+        host=config.database.host,
+        port=config.database.port,
+        database=config.database.name,
+        user=config.database.user,
+        password=config.database.password,
+    )
+    try:
+        await conn.execute(
+            """
+            CREATE TEMP TABLE bench_posts (
+                id uuid PRIMARY KEY,
+                title text,
+                body text,
+                search_vector tsvector GENERATED ALWAYS AS
+                    (to_tsvector('english', title || ' ' || body)) STORED
+            )
+            """
+        )
+        start = time.perf_counter()
+        await conn.copy_records_to_table(
+            "bench_posts",
+            records=[(uuid.UUID(i), t, c) for i, t, c in posts],
+            columns=["id", "title", "body"],
+        )
+        await conn.execute("CREATE INDEX ON bench_posts USING gin (search_vector)")
+        await conn.execute("ANALYZE bench_posts")
+        build_ms = (time.perf_counter() - start) * 1000
+
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            await conn.fetch(
+                """
+                WITH hits AS (
+                    SELECT id,
+                           ts_rank(search_vector,
+                                   plainto_tsquery('english', $1)) AS rank,
+                           count(*) OVER () AS total
+                    FROM bench_posts
+                    WHERE search_vector @@ plainto_tsquery('english', $1)
+                    ORDER BY rank DESC
+                    LIMIT 10
+                )
+                SELECT b.title, hits.total,
+                       ts_headline('english', b.body,
+                                   plainto_tsquery('english', $1), $2)
+                FROM hits JOIN bench_posts b ON b.id = hits.id
+                ORDER BY hits.rank DESC
+                """,
+                query,
+                HEADLINE_OPTIONS,
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+        return build_ms, timings
+    finally:
+        await conn.close()
+
+
+def report(name: str, timings: List[float]) -> None:
+    """Print latency for one backend."""
+    p50, p99 = percentiles(timings)
+    print(f"{name:>16}: p50 {p50:7.2f} ms  p99 {p99:7.2f} ms")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--config", default=None, help="Config to reach Postgres")
+    args = parser.parse_args(argv)
+
+    vocabulary = make_vocabulary(args.vocabulary, random.Random(args.seed))
+    posts = make_corpus(args.posts, vocabulary, args.seed)
+    queries = make_queries(args.queries, vocabulary, args.seed + 1)
+    print(f"{args.posts} posts, {args.queries} queries")
+
+    start = time.perf_counter()
+    index = build_index(posts)
+    print(f"bm25 build: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "search.idx"
+        save_ms = timed(index.save, path)
+        start = time.perf_counter()
+        loaded, _ = BM25Index.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        size = path.stat().st_size
+        print(
+            f"bm25 snapshot: {size / 1024 / 1024:.1f} MiB, "
+            f"save {save_ms:.0f} ms, load {load_ms:.1f} ms"
+        )
+
+        report("bm25", [timed(search_index, index, query) for query in queries])
+        report("bm25 mmap", [timed(search_index, loaded, query) for query in queries])
+
+    if args.config:
+        build_ms, timings = asyncio.run(
+            postgres_timings(args.config, posts, queries)
+        )
+        print(f"postgres GIN build: {build_ms:.0f} ms")
+        report("postgres", timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark serializing a page of posts into an API response.
+
+Compares the previous path (jsonable_encoder, APIResponse, .dict() and
+stdlib json, with posts repeated under ``years``) against the orjson
+response with posts referenced by index, and search results carrying
+full bodies against summaries with a highlighted snippet.
+
+Usage: python -m benchmarks.serialize_posts [--posts 100] [--runs 500]
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from qubit.api.utils import APIResponse, create_response
+from qubit.models.feed import FeedEntry
+from qubit.models.post import PostEntry, SearchResult, TocEntry
+from qubit.services.post import year_index
+
+PARAGRAPH = (
+    "Some prose about an experiment, with <code>inline code</code> and a "
+    '<a href="https://example.com">link</a>. '
+) * 8
+
+
+def make_posts(count: int) -> list:
+    """Build posts with realistic body sizes."""
+    start = datetime(2022, 1, 1)
+    posts = []
+    for i in range(count):
+        created = start + timedelta(days=i * 9)
+        content = "\n\n".join(f"## Section {j}\n\n{PARAGRAPH}" for j in range(6))
+        html = "".join(f"<h2>Section {j}</h2><p>{PARAGRAPH}</p>" for j in range(6))
+        posts.append(
+            PostEntry(
+                id=uuid.uuid4(),
+                title=f"Post number {i}",
+                content=content,
+                content_html=html,
+                slug=f"post-number-{i}",
+                published=True,
+                published_at=created,
+                author_id=1,
+                created_at=created,
+                updated_at=created,
+                tags=["security", "ml"],
+                excerpt=PARAGRAPH[:200],
+                word_count=900,
+                reading_time=5,
+                toc=[
+                    TocEntry(level=2, title=f"Section {j}", anchor=f"section-{j}")
+                    for j in range(6)
+                ],
+            )
+        )
+    return posts
+
+
+def legacy_posts_response(posts: list) -> bytes:
+    """Serialize posts the way create_response did before."""
+    posts_dict = [post.to_dict() for post in posts]
+    years = {}
+    for post in posts_dict:
+        years.setdefault(post["created_at"].split("-")[0], []).append(post)
+    response = APIResponse(
+        success=True,
+        data=jsonable_encoder({"posts": posts_dict, "years": years}),
+        meta={"page": 1, "total_pages": 1},
+    )
+    return JSONResponse(content=response.model_dump(exclude_none=True)).body
+
+
+def posts_response(posts: list) -> bytes:
+    """Serialize posts through the current create_response."""
+    return create_response(
+        data={"posts": [post.to_dict() for post in posts], "years": year_index(posts)},
+        meta={"page": 1, "total_pages": 1},
+    ).body
+
+
+def legacy_feed_response(entries: list) -> bytes:
+    """Serialize feed entries the way create_response did before."""
+    response = APIResponse(success=True, data=jsonable_encoder(entries))
+    return JSONResponse(content=response.model_dump(exclude_none=True)).body
+
+
+def feed_response(entries: list) -> bytes:
+    """Serialize feed entries through the current create_response."""
+    return create_response(data=entries).body
+
+
+def legacy_search_response(posts: list) -> bytes:
+    """Serialize search results with full bodies, as search did before."""
+    return create_response(
+        data={"posts": [post.to_dict() for post in posts], "total": len(posts)}
+    ).body
+
+
+def search_response(results: list) -> bytes:
+    """Serialize search results as summaries with snippets."""
+    return create_response(
+        data={"posts": [result.to_dict() for result in results], "total": len(results)}
+    ).body
+
+
+def measure(func, arg, runs: int) -> tuple:
+    """Time func(arg), returning p50 and p99 in ms and the payload size."""
+    body = func(arg)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(arg)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return statistics.median(timings), p99, len(body)
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    posts = make_posts(args.posts)
+    feed = [
+        FeedEntry(
+            id=uuid.uuid4(),
+            content=PARAGRAPH,
+            author_id=1,
+            author_name="admin",
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+        )
+        for post in posts
+    ]
+
+    snippet = "Some prose about an <mark>experiment</mark>, with inline code … "
+    results = [
+        SearchResult(
+            **{
+                field: getattr(post, field)
+                for field in SearchResult.model_fields
+                if field != "snippet"
+            },
+            snippet=snippet * 2,
+        )
+        for post in posts[:10]
+    ]
+
+    cases = [
+        ("posts legacy", legacy_posts_response, posts),
+        ("posts orjson", posts_response, posts),
+        ("feed legacy", legacy_feed_response, feed),
+        ("feed orjson", feed_response, feed),
+        ("search legacy", legacy_search_response, posts[:10]),
+        ("search snippet", search_response, results),
+    ]
+    print(f"{args.posts} items, {args.runs} runs")
+    for name, func, arg in cases:
+        p50, p99, size = measure(func, arg, args.runs)
+        print(
+            f"{name:>14}: p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  {size / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Qubit command line entry point."""
+
+from qubit.scripts.create_admin import main
+
+
+if __name__ == "__main__":
+    main()
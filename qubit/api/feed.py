@@ -1,6 +1,6 @@
 """Feed API endpoints."""
 
-from typing import List, Annotated
+from typing import List, Annotated, Optional
 from uuid import UUID
 from fastapi import (
     APIRouter,
@@ -9,16 +9,22 @@ from fastapi import (
     Query,
     Path,
     Body,
+    Header,
 )
+from fastapi.responses import StreamingResponse
 
 from qubit.models.feed import FeedEntry, FeedEntryCreate
 from qubit.services.feed import FeedService
 from qubit.services.auth import AuthService
 from qubit.core.common import get_feed_db, get_users_db
+from qubit.core.events import FeedBroadcaster
+from qubit.core.versions import ContentVersions
 from qubit.api.utils import (
     NotFoundError,
     ForbiddenError,
     create_response,
+    format_cursor,
+    parse_cursor,
 )
 
 
@@ -45,17 +51,51 @@ async def get_feed_posts(
     request: Request,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+    since: Annotated[
+        Optional[str],
+        Query(description="Cursor from a previous response; only return changes"),
+    ] = None,
     feed_service: FeedService = Depends(get_feed_service),
 ):
-    """Get feed posts."""
+    """Get feed posts, or what changed since a cursor."""
+    validators = await ContentVersions.get_instance().check(request, "feed")
+
+    if since is not None:
+        changes = await feed_service.get_changes(parse_cursor(since), limit=limit)
+        return create_response(
+            data={"posts": changes.changed, "deleted": changes.deleted},
+            meta={
+                "cursor": format_cursor(changes.cursor),
+                "has_more": changes.has_more,
+            },
+            headers=validators.headers,
+        )
+
     posts = await feed_service.get_posts(limit=limit, offset=offset)
     return create_response(
         data=posts,
         meta={
             "limit": limit,
             "offset": offset,
-            "total": len(posts)
-        }
+            "total": len(posts),
+            "cursor": format_cursor(await feed_service.get_cursor()),
+        },
+        headers=validators.headers,
+    )
+
+
+@router.get("/feed/stream")
+async def stream_feed_posts(
+    last_event_id: Annotated[
+        Optional[str], Header(description="Last event received, to resume from")
+    ] = None,
+):
+    """Stream created, edited and deleted feed posts as server-sent events."""
+    return StreamingResponse(
+        FeedBroadcaster.get_instance().stream(last_event_id),
+        media_type="text/event-stream",
+        # Stop proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -58,7 +58,7 @@ async def admin_required(request: Request, call_next: Callable):
                 )
             return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
 
-        request.state.user = current_user
+        # get_current_user left the user on request.state for the handler
         return await call_next(request)
 
     except Exception as e:
@@ -1,19 +1,27 @@
 """Post API endpoints."""
 
-from typing import List, Annotated
+from typing import List, Annotated, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Request, Query, Path, Body
 from starlette import status
 
-from qubit.services.post import PostService
+from qubit.services.post import PostService, year_index
+from qubit.services.preview import PreviewService
+from qubit.services.render import RenderError
 from qubit.services.auth import AuthService
-from qubit.models.post import PostCreate, PostEntry
+from qubit.models.post import LISTING_CONTEXT, PostCreate, PostEntry, PreviewRequest
 from qubit.database.posts import PostsDB
 from qubit.core.common import get_posts_db, get_users_db
+from qubit.core.search_cache import SearchCache
+from qubit.core.versions import ContentVersions
 from qubit.api.utils import (
     NotFoundError,
     UnauthorizedError,
+    ValidationError,
     create_response,
+    format_cursor,
+    listing,
+    parse_cursor,
 )
 
 
@@ -48,30 +56,44 @@ async def get_posts(
     request: Request,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 10,
+    since: Annotated[
+        Optional[str],
+        Query(description="Cursor from a previous response; only return changes"),
+    ] = None,
     db: PostsDB = Depends(get_posts_db),
 ):
-    """Get all published posts."""
+    """Get all published posts, or what changed since a cursor."""
+    validators = await ContentVersions.get_instance().check(request, "posts")
     post_service = PostService(db)
+
+    if since is not None:
+        changes = await post_service.get_changes(parse_cursor(since), limit=limit)
+        return create_response(
+            data={
+                "posts": listing(changes.changed, LISTING_CONTEXT),
+                "deleted": changes.deleted,
+            },
+            meta={
+                "cursor": format_cursor(changes.cursor),
+                "has_more": changes.has_more,
+            },
+            headers=validators.headers,
+        )
+
     offset = (page - 1) * limit
     posts = await post_service.get_posts(limit=limit, offset=offset)
 
-    posts_dict = [post.to_dict() for post in posts]
-    years = {}
-    for post in posts_dict:
-        year = post["created_at"].split("-")[0]
-        if year not in years:
-            years[year] = []
-        years[year].append(post)
-
     return create_response(
         data={
-            "posts": posts_dict,
-            "years": years,
+            "posts": listing(posts, LISTING_CONTEXT),
+            "years": year_index(posts),
         },
         meta={
             "page": page,
             "total_pages": (len(posts) + limit - 1) // limit,
+            "cursor": format_cursor(await post_service.get_cursor()),
         },
+        headers=validators.headers,
     )
 
 
@@ -81,43 +103,108 @@ async def search_posts(
     q: Annotated[str, Query(min_length=3, max_length=50, description="Search query")],
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 10,
+    tag: Annotated[
+        Optional[List[str]],
+        Query(max_length=10, description="Only posts carrying every tag"),
+    ] = None,
     db: PostsDB = Depends(get_posts_db),
 ):
-    """Search posts."""
+    """Search posts, with match counts per tag for narrowing the search."""
+    validators = await ContentVersions.get_instance().check(request, "posts")
     post_service = PostService(db)
     offset = (page - 1) * limit
-    posts, total = await post_service.search_posts(q, limit=limit, offset=offset)
-
-    posts_dict = [post.to_dict() for post in posts]
-    years = {}
-    for post in posts_dict:
-        year = post["created_at"].split("-")[0]
-        if year not in years:
-            years[year] = []
-        years[year].append(post)
+    results = await post_service.search_posts(
+        q, limit=limit, offset=offset, tags=tag or []
+    )
 
     return create_response(
         data={
-            "posts": posts_dict,
-            "years": years,
+            "posts": listing(results.posts, LISTING_CONTEXT),
+            "years": year_index(results.posts),
+            "facets": results.facets,
         },
         meta={
-            "total_pages": (total + limit - 1) // limit,
+            "total": results.total,
+            "total_pages": (results.total + limit - 1) // limit,
         },
+        headers=validators.headers,
+    )
+
+
+@router.get("/posts/suggest")
+async def suggest_posts(
+    request: Request,
+    q: Annotated[
+        str, Query(min_length=1, max_length=50, description="Partly typed query")
+    ],
+    limit: Annotated[int, Query(ge=1, le=10, description="Suggestions")] = 5,
+    db: PostsDB = Depends(get_posts_db),
+):
+    """Suggest post titles while a search is being typed."""
+    validators = await ContentVersions.get_instance().check(request, "posts")
+    post_service = PostService(db)
+    suggestions = await post_service.suggest_posts(q, limit=limit)
+
+    return create_response(
+        data={"suggestions": suggestions},
+        headers=validators.headers,
+    )
+
+
+@router.get("/posts/batch")
+async def get_posts_batch(
+    request: Request,
+    ids: Annotated[
+        Optional[List[UUID]], Query(max_length=100, description="Post IDs")
+    ] = None,
+    slugs: Annotated[
+        Optional[List[str]], Query(max_length=100, description="Post slugs")
+    ] = None,
+    db: PostsDB = Depends(get_posts_db),
+):
+    """Get several published posts by ID and/or slug in one call."""
+    if not ids and not slugs:
+        raise ValidationError("At least one id or slug is required")
+
+    validators = await ContentVersions.get_instance().check(request, "posts")
+    post_service = PostService(db)
+    posts = []
+    if ids:
+        posts.extend(await post_service.get_posts_by_ids(ids))
+    if slugs:
+        posts.extend(await post_service.get_posts_by_slugs(slugs))
+
+    seen = set()
+    unique = []
+    for post in posts:
+        if not post.published or post.id in seen:
+            continue
+        seen.add(post.id)
+        unique.append(post)
+
+    return create_response(
+        data={"posts": listing(unique, LISTING_CONTEXT)},
+        meta={"total": len(unique)},
+        headers=validators.headers,
     )
 
 
 @router.get("/posts/{slug}", response_model=PostEntry)
 async def get_post(
+    request: Request,
     slug: Annotated[str, Path(min_length=1, max_length=100, description="Post slug")],
     db: PostsDB = Depends(get_posts_db),
 ):
     """Get post by slug."""
+    validators = await ContentVersions.get_instance().check(
+        request, "posts", "slug", slug
+    )
     post_service = PostService(db)
     post = await post_service.get_post(slug)
     if not post:
         raise NotFoundError("Post not found")
-    return create_response(data=post)
+    await ContentVersions.get_instance().seed("posts", "slug", post.slug)
+    return create_response(data=post, headers=validators.headers)
 
 
 @router.post("/admin/posts", response_model=PostEntry)
@@ -134,10 +221,38 @@ async def create_post(
         raise UnauthorizedError()
 
     post_service = PostService(db)
-    created_post = await post_service.create_post(post, user.id)
+    try:
+        created_post = await post_service.create_post(post, user.id)
+    except RenderError as e:
+        raise ValidationError(str(e)) from e
     return create_response(data=created_post, status_code=status.HTTP_201_CREATED)
 
 
+@router.post("/admin/preview")
+async def preview_post(
+    preview: Annotated[PreviewRequest, Body(description="Draft to preview")],
+):
+    """Render a draft preview, returning HTML only for changed blocks (admin only)."""
+    try:
+        patch = await PreviewService().preview(preview.content, preview.known)
+    except RenderError as e:
+        raise ValidationError(str(e)) from e
+    return create_response(data=patch)
+
+
+@router.get("/admin/search/stats")
+async def search_cache_stats():
+    """Search result cache hit rate across all workers (admin only)."""
+    return create_response(data=await SearchCache.get_instance().stats())
+
+
+@router.delete("/admin/search/stats")
+async def reset_search_cache_stats():
+    """Reset the search result cache counters (admin only)."""
+    await SearchCache.get_instance().reset_stats()
+    return create_response(data={"status": "success"})
+
+
 @router.put("/admin/posts/{post_id}", response_model=PostEntry)
 async def update_post(
     post_id: Annotated[UUID, Path(description="Post ID")],
@@ -146,7 +261,10 @@ async def update_post(
 ):
     """Update existing post (admin only)."""
     post_service = PostService(db)
-    updated_post = await post_service.update_post(post_id, post)
+    try:
+        updated_post = await post_service.update_post(post_id, post)
+    except RenderError as e:
+        raise ValidationError(str(e)) from e
     if not updated_post:
         raise NotFoundError("Post not found")
     return create_response(data=updated_post)
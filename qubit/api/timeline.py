@@ -0,0 +1,40 @@
+"""Timeline API endpoints."""
+
+from typing import Annotated, Optional
+from fastapi import APIRouter, Request, Depends, Query
+
+from qubit.services.timeline import InvalidCursor, TimelineService
+from qubit.core.common import get_feed_db, get_posts_db
+from qubit.core.versions import ContentVersions
+from qubit.api.utils import ValidationError, create_response
+
+
+router = APIRouter()
+
+
+async def get_timeline_service(request: Request) -> TimelineService:
+    """Get timeline service instance."""
+    return TimelineService(get_posts_db(request), get_feed_db(request))
+
+
+@router.get("/timeline")
+async def get_timeline(
+    request: Request,
+    limit: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    cursor: Annotated[
+        Optional[str], Query(description="`next` cursor from the previous page")
+    ] = None,
+    timeline_service: TimelineService = Depends(get_timeline_service),
+):
+    """Get posts and feed posts merged into one timeline, newest first."""
+    validators = await ContentVersions.get_instance().check(request, "timeline")
+    try:
+        page = await timeline_service.get_page(limit=limit, cursor=cursor)
+    except InvalidCursor:
+        raise ValidationError("Invalid cursor")
+
+    return create_response(
+        data=page["items"],
+        meta={"limit": limit, "next": page["next"]},
+        headers=validators.headers,
+    )
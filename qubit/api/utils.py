@@ -1,10 +1,13 @@
 """API utilities."""
 
-from typing import Any, Dict, Optional, TypeVar, Generic
-from pydantic import BaseModel
-from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Generic
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 
 T = TypeVar("T")
@@ -58,23 +61,75 @@ class APIResponse(BaseModel, Generic[T]):
     meta: Optional[Dict[str, Any]] = None
 
 
+def _encode_default(obj: Any) -> Any:
+    """Encode values orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=16)
+def _list_adapter(model: type) -> TypeAdapter:
+    """Serializer for lists of one model type."""
+    return TypeAdapter(List[model])
+
+
+def listing(items: Sequence[BaseModel], context: Dict[str, Any]) -> List[Any]:
+    """Dump models of one type for a list response in a single pass.
+
+    ``context`` reaches the models' field serializers, e.g. to pick the list
+    date format. UUIDs and datetimes are left for orjson to encode.
+    """
+    if not items:
+        return []
+    return _list_adapter(type(items[0])).dump_python(list(items), context=context)
+
+
+class APIJSONResponse(ORJSONResponse):
+    """JSON response serialized by orjson, including pydantic models, in one pass."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_encode_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
 def create_response(
     data: Optional[Any] = None,
     meta: Optional[Dict[str, Any]] = None,
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
-    """Create a standardized API response."""
-    response = APIResponse(
-        success=True,
-        data=jsonable_encoder(data) if data is not None else None,
-        meta=meta,
-    )
-    return JSONResponse(
-        status_code=status_code, content=response.dict(exclude_none=True)
-    )
-
-
-async def handle_api_error(exc: APIError) -> JSONResponse:
+    headers: Optional[Dict[str, str]] = None,
+) -> APIJSONResponse:
+    """Create a standardized API response in the ``APIResponse`` shape."""
+    content: Dict[str, Any] = {"success": True}
+    if data is not None:
+        content["data"] = data
+    if meta is not None:
+        content["meta"] = meta
+    return APIJSONResponse(status_code=status_code, content=content, headers=headers)
+
+
+def parse_cursor(value: str) -> int:
+    """Read a ``since`` cursor from a previous response."""
+    try:
+        cursor = int(value)
+    except ValueError:
+        raise ValidationError("Invalid cursor")
+    if cursor < 0:
+        raise ValidationError("Invalid cursor")
+    return cursor
+
+
+def format_cursor(value: Optional[int]) -> str:
+    """Cursor for clients to send back as ``since``; 0 if nothing exists yet."""
+    return str(value or 0)
+
+
+async def handle_api_error(request: Request, exc: APIError) -> JSONResponse:
     """Handle API exceptions."""
     response = APIResponse(success=False, error=exc.detail)
     return JSONResponse(
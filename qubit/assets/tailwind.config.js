@@ -0,0 +1,79 @@
+/** Tailwind build config for `python -m qubit build-assets`. */
+module.exports = {
+    content: {
+        relative: true,
+        files: ["../templates/**/*.html"],
+    },
+    theme: {
+        extend: {
+            fontFamily: {
+                mono: ['"IBM Plex Mono"', 'monospace'],
+            },
+            colors: {
+                'btn': '#1a1a1a',
+                'btn-hover': '#2a2a2a',
+                'link': '#1a1a1a',
+                'link-hover': '#2a2a2a',
+                'warm-gray': {
+                    50: '#fafaf9',
+                    100: '#f5f5f4',
+                    500: '#78716c',
+                    700: '#44403c',
+                    800: '#292524'
+                }
+            },
+            typography: {
+                DEFAULT: {
+                    css: {
+                        fontFamily: '"IBM Plex Mono", monospace',
+                        maxWidth: 'none',
+                        color: '#44403c',
+                        p: {
+                            marginTop: '1.5em',
+                            marginBottom: '1.5em',
+                            lineHeight: '1.75'
+                        },
+                        a: {
+                            color: '#1a1a1a',
+                            textDecoration: 'none',
+                            fontWeight: '500',
+                            '&:hover': {
+                                color: '#2a2a2a'
+                            }
+                        },
+                        h1: {
+                            fontFamily: '"IBM Plex Mono", monospace',
+                            fontWeight: '600'
+                        },
+                        h2: {
+                            fontFamily: '"IBM Plex Mono", monospace',
+                            fontWeight: '600',
+                            marginTop: '2em'
+                        },
+                        h3: {
+                            fontFamily: '"IBM Plex Mono", monospace',
+                            fontWeight: '500'
+                        },
+                        code: {
+                            fontFamily: '"IBM Plex Mono", monospace',
+                            fontWeight: '400',
+                            backgroundColor: '#f5f5f4',
+                            padding: '0.2em 0.4em',
+                            borderRadius: '0.25rem'
+                        },
+                        pre: {
+                            backgroundColor: '#f5f5f4',
+                            padding: '1em',
+                            borderRadius: '0.25rem',
+                            code: {
+                                backgroundColor: 'transparent',
+                                padding: '0'
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+    plugins: [require('@tailwindcss/typography')],
+}
@@ -0,0 +1,98 @@
+"""Fingerprinted static assets."""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from qubit.core.compression import negotiate
+
+
+STATIC_DIR = Path("qubit/static")
+STATIC_URL = "/static"
+MANIFEST_NAME = "manifest.json"
+
+# Built files carry a content hash, e.g. app.3f9c2a1be04d.css
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}\.[A-Za-z0-9]+$")
+VARIANT_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=0, must-revalidate"
+
+
+class AssetError(Exception):
+    """Asset missing from the build."""
+
+
+class AssetManifest:
+    """Map logical asset names to their built, content-hashed URLs."""
+
+    _instance: Optional["AssetManifest"] = None
+
+    def __init__(self, directory: Path = STATIC_DIR):
+        """Load the manifest written by ``build-assets``."""
+        self.directory = directory
+        self.assets: Dict[str, str] = {}
+        try:
+            self.assets = json.loads((directory / MANIFEST_NAME).read_text("utf-8"))
+        except FileNotFoundError:
+            logger.error(
+                f"No asset manifest in {directory}; pages can't load CSS or JS "
+                "until `python -m qubit build-assets` runs"
+            )
+
+    @classmethod
+    def get_instance(cls) -> "AssetManifest":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def fingerprint(self) -> str:
+        """Identify the current build."""
+        return ",".join(sorted(self.assets.values()))
+
+    def url(self, name: str) -> str:
+        """URL of a built asset, for use in templates."""
+        try:
+            return f"{STATIC_URL}/{self.assets[name]}"
+        except KeyError:
+            raise AssetError(
+                f"Asset {name!r} isn't built; run `python -m qubit build-assets`"
+            ) from None
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """Serve built assets, caching hashed files forever.
+
+    Precompressed ``.br``/``.gz`` siblings written by the build are served
+    when the client accepts them, so assets are never compressed per request.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code != 200 or not isinstance(response, FileResponse):
+            return response
+
+        cache_control = IMMUTABLE if HASHED_NAME.search(path) else REVALIDATE
+        headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+        accept = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+        encoding = negotiate(accept)
+        if encoding is not None:
+            variant = Path(str(response.path) + VARIANT_SUFFIXES[encoding])
+            if variant.is_file():
+                return FileResponse(
+                    variant,
+                    media_type=response.media_type,
+                    headers={**headers, "Content-Encoding": encoding},
+                )
+
+        response.headers.update(headers)
+        return response
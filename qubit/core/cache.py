@@ -2,12 +2,14 @@
 
 import json
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, get_type_hints
 from uuid import UUID
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from redis import asyncio as aioredis
 from redis.asyncio.retry import Retry
@@ -27,6 +29,65 @@ class ModelEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+class LRUCache:
+    """Small in-process least-recently-used cache."""
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize cache with a maximum number of entries."""
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        """Get value and mark it as recently used."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Set value, evicting the least recently used entry when full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Delete value if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """In-process LRU cache whose entries also expire after a fixed time."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """Initialize cache with a maximum size and entry lifetime in seconds."""
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Any:
+        """Get value if it has not expired."""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Set value, expiring it after the cache's TTL."""
+        super().set(key, (time.monotonic() + self.ttl, value))
+
+
 class RedisCache:
     """Redis cache implementation."""
 
@@ -35,10 +96,16 @@ class RedisCache:
     def __init__(self, url: Optional[str] = None):
         """Initialize Redis connection."""
         self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.redis = self._connect(decode_responses=True)
+        # Separate client for values that aren't text, e.g. cached page bodies
+        self.raw = self._connect(decode_responses=False)
+
+    def _connect(self, decode_responses: bool):
+        """Create a Redis client."""
         retry = Retry(ExponentialBackoff(), 3)
-        self.redis = aioredis.from_url(
+        return aioredis.from_url(
             self.url,
-            decode_responses=True,
+            decode_responses=decode_responses,
             retry=retry,
             retry_on_timeout=True,
             socket_keepalive=True
@@ -51,6 +118,14 @@ class RedisCache:
             cls._instance = cls()
         return cls._instance
 
+    async def ping(self) -> bool:
+        """Open the connection and check that Redis responds."""
+        try:
+            return await self.redis.ping()
+        except Exception as e:
+            logger.error(f"Redis ping error: {e}")
+            return False
+
     async def get(self, key: str) -> Any:
         """Get value from cache."""
         try:
@@ -79,6 +154,83 @@ class RedisCache:
             logger.error(f"Redis set error: {e}")
             await self._reconnect()
 
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        """Get several values from cache in one round trip."""
+        if not keys:
+            return []
+        try:
+            values = await self.redis.mget(keys)
+            return [json.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            await self._reconnect()
+        return [None] * len(keys)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None:
+        """Set several values in cache with TTL in one round trip."""
+        if not items:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, json.dumps(value, cls=ModelEncoder))
+                await pipe.execute()
+            logger.debug(f"Cache set for {len(items)} keys")
+        except Exception as e:
+            logger.error(f"Redis pipeline set error: {e}")
+            await self._reconnect()
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get raw bytes from cache."""
+        try:
+            return await self.raw.get(key)
+        except Exception as e:
+            logger.error(f"Redis get error: {e}")
+            await self._reconnect()
+        return None
+
+    async def get_many_bytes(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Get several raw values from cache in one round trip."""
+        if not keys:
+            return []
+        try:
+            return await self.raw.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            await self._reconnect()
+        return [None] * len(keys)
+
+    async def set_bytes(self, key: str, value: bytes, ttl: int = 300) -> None:
+        """Set raw bytes in cache with TTL."""
+        try:
+            await self.raw.setex(key, ttl, value)
+            logger.debug(f"Cache set for {key}")
+        except Exception as e:
+            logger.error(f"Redis set error: {e}")
+            await self._reconnect()
+
+    async def set_many_bytes(self, items: Dict[str, bytes], ttl: int = 300) -> None:
+        """Set several raw values in cache with TTL in one round trip."""
+        if not items:
+            return
+        try:
+            async with self.raw.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+            logger.debug(f"Cache set for {len(items)} keys")
+        except Exception as e:
+            logger.error(f"Redis pipeline set error: {e}")
+            await self._reconnect()
+
+    async def publish(self, channel: str, message: Any) -> None:
+        """Publish a JSON message to a channel."""
+        try:
+            await self.redis.publish(channel, json.dumps(message, cls=ModelEncoder))
+        except Exception as e:
+            logger.error(f"Redis publish error: {e}")
+            await self._reconnect()
+
     async def delete(self, key: str) -> None:
         """Delete value from cache."""
         try:
@@ -88,18 +240,31 @@ class RedisCache:
             logger.error(f"Redis delete error: {e}")
             await self._reconnect()
 
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern."""
+        deleted = 0
+        try:
+            batch = []
+            async for key in self.redis.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.redis.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            logger.debug(f"Cache deleted {deleted} keys for {pattern}")
+        except Exception as e:
+            logger.error(f"Redis delete pattern error: {e}")
+            await self._reconnect()
+        return deleted
+
     async def _reconnect(self) -> None:
         """Attempt to reconnect to Redis."""
         try:
             await self.redis.close()
-            retry = Retry(ExponentialBackoff(), 3)
-            self.redis = aioredis.from_url(
-                self.url,
-                decode_responses=True,
-                retry=retry,
-                retry_on_timeout=True,
-                socket_keepalive=True
-            )
+            await self.raw.close()
+            self.redis = self._connect(decode_responses=True)
+            self.raw = self._connect(decode_responses=False)
         except Exception as e:
             logger.error(f"Redis reconnection error: {e}")
 
@@ -109,7 +274,7 @@ def cache_key(*args, **kwargs) -> str:
     key = []
     # Handle special types in args
     for arg in args:
-        if isinstance(arg, (UUID, BaseModel)):
+        if arg is None or isinstance(arg, (str, int, float, UUID, BaseModel)):
             key.append(str(arg))
         elif hasattr(arg, '__class__'):
             # Use class name for class instances instead of str representation
@@ -119,7 +284,7 @@ def cache_key(*args, **kwargs) -> str:
 
     # Handle special types in kwargs
     for k, v in sorted(kwargs.items()):
-        if isinstance(v, (UUID, BaseModel)):
+        if v is None or isinstance(v, (str, int, float, UUID, BaseModel)):
             key.append(f"{k}:{str(v)}")
         elif hasattr(v, '__class__'):
             # Use class name for class instances instead of str representation
@@ -134,14 +299,19 @@ def cache_result(ttl: int = 300):
     """Decorator to cache function results in Redis."""
 
     def decorator(func: Callable):
+        adapter = None
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            nonlocal adapter
             cache = RedisCache.get_instance()
             key = cache_key(func.__name__, *args, **kwargs)
 
-            # Try to get from cache first
+            # Try to get from cache first, rebuilding the declared return type
             if result := await cache.get(key):
-                return result
+                if adapter is None:
+                    adapter = TypeAdapter(get_type_hints(func).get("return", Any))
+                return adapter.validate_python(result)
 
             # If not in cache, execute function and cache result
             result = await func(*args, **kwargs)
@@ -7,6 +7,10 @@ import yaml
 from qubit.models.config import Config
 
 
+# Cookie holding the signed session; pages are only shared by visitors without one
+SESSION_COOKIE = "session"
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file."""
     if not config_path:
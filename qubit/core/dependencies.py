@@ -7,6 +7,7 @@ from loguru import logger
 from qubit.models.user import UserDB
 from qubit.services.auth import AuthService
 from qubit.core.common import get_users_db
+from qubit.core.page_cache import PageCache
 
 
 async def get_current_user(
@@ -15,11 +16,13 @@ async def get_current_user(
     return_model: bool = False,
 ) -> Union[Optional[UserDB], Optional[dict]]:
     """Get current user from session."""
-    db = get_users_db(request)
-    auth_service = AuthService(db, request)
-
     try:
-        user = await auth_service.get_current_user()
+        if PageCache.is_anonymous(request):
+            # Most visitors: nothing to look up, so no database or service
+            user = None
+        else:
+            auth_service = AuthService(get_users_db(request), request)
+            user = await auth_service.get_current_user()
         if not user and raise_on_missing:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,168 @@
+"""Server-sent event fan-out for the live feed."""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional, Set, Tuple
+from uuid import UUID
+
+import orjson
+from loguru import logger
+
+from qubit.database.changes import ChangeEvent
+from qubit.database.feed import FeedDB
+from qubit.models.config import Config, StreamConfig
+
+
+HEARTBEAT = b": ping\n\n"
+
+# Each worker stamps events from its own clock, so a client resuming on
+# another worker is replayed slightly more than it missed; clients apply
+# events idempotently by entry ID.
+RESUME_SKEW_MS = 2000
+
+
+def format_event(event_id: int, event: str, data: dict) -> bytes:
+    """Encode one server-sent event."""
+    return (
+        f"id: {event_id}\nevent: {event}\ndata: ".encode("utf-8")
+        + orjson.dumps(data)
+        + b"\n\n"
+    )
+
+
+class FeedBroadcaster:
+    """Push microblog changes to every connected event stream.
+
+    Fed by the worker's single change listener subscription rather than a
+    connection per client. Each client is a bounded queue read by its
+    response; one task sends heartbeats to all of them. Recent events are
+    kept in a ring buffer so reconnecting clients resume from
+    ``Last-Event-ID``.
+    """
+
+    _instance: Optional["FeedBroadcaster"] = None
+
+    def __init__(self, config: Config):
+        """Initialize broadcaster configuration."""
+        self.config: StreamConfig = config.stream
+        self._db = FeedDB(config)
+        self._buffer: Deque[Tuple[int, bytes]] = deque(maxlen=self.config.buffer_size)
+        self._clients: Set[asyncio.Queue] = set()
+        self._last_id = 0
+        # Events from here on are all in the buffer
+        self._complete_since = self._now_ms()
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls, config: Optional[Config] = None) -> "FeedBroadcaster":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected streams."""
+        return len(self._clients)
+
+    async def start(self) -> None:
+        """Start sending heartbeats."""
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._send_heartbeats())
+
+    async def stop(self) -> None:
+        """Stop heartbeats and end every open stream."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        for queue in list(self._clients):
+            self._disconnect(queue)
+
+    async def _send_heartbeats(self) -> None:
+        """Keep idle connections open through proxies."""
+        while True:
+            await asyncio.sleep(self.config.heartbeat_seconds)
+            self._broadcast(HEARTBEAT)
+
+    def _next_id(self) -> int:
+        """Event ID: milliseconds since the epoch, strictly increasing."""
+        self._last_id = max(self._last_id + 1, self._now_ms())
+        return self._last_id
+
+    def publish(self, event: str, data: dict) -> None:
+        """Send an event to every client and keep it for resuming clients."""
+        event_id = self._next_id()
+        message = format_event(event_id, event, data)
+        if len(self._buffer) == self._buffer.maxlen:
+            self._complete_since = self._buffer[0][0]
+        self._buffer.append((event_id, message))
+        self._broadcast(message)
+
+    def _broadcast(self, message: bytes) -> None:
+        """Queue a message for every client."""
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Far enough behind to reconnect and resume from the buffer
+                self._disconnect(queue)
+
+    def _disconnect(self, queue: asyncio.Queue) -> None:
+        """End a client's stream."""
+        self._clients.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def replay(self, last_event_id: Optional[str]) -> List[bytes]:
+        """Events a reconnecting client missed, or a reset if they are gone."""
+        if not last_event_id:
+            return []
+        try:
+            last = int(last_event_id)
+        except ValueError:
+            last = 0
+        if last < self._complete_since:
+            return [format_event(self._last_id or self._now_ms(), "reset", {})]
+        since = last - RESUME_SKEW_MS
+        return [message for event_id, message in self._buffer if event_id > since]
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """Event stream for one client."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.client_queue_size)
+        # Subscribe before replaying so nothing published meanwhile is lost
+        self._clients.add(queue)
+        try:
+            yield f"retry: {self.config.retry_ms}\n\n".encode("utf-8")
+            for message in self.replay(last_event_id):
+                yield message
+            while True:
+                message = await queue.get()
+                if message is None:
+                    return
+                yield message
+        finally:
+            self._clients.discard(queue)
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Publish a created, edited or deleted feed post."""
+        entry = None
+        if event.op != "DELETE":
+            entry = await self._db.get_feed_post(UUID(event.id))
+        if entry is None:
+            self.publish("delete", {"id": event.id})
+        else:
+            self.publish("upsert", entry.model_dump(mode="json"))
+
+    async def handle_resync(self) -> None:
+        """Tell clients to reload after notifications may have been missed."""
+        self._buffer.clear()
+        self._complete_since = self._now_ms()
+        logger.debug(f"Resetting {self.client_count} feed streams")
+        self._broadcast(format_event(self._next_id(), "reset", {}))
@@ -0,0 +1,73 @@
+"""Batch loading utilities."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from loguru import logger
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce single-key lookups made in the same event-loop tick into one batch call.
+
+    The batch function receives a list of unique keys and returns a mapping of
+    key to value; keys missing from the mapping resolve to ``None``.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 100,
+    ):
+        """Initialize loader with the function used to fetch a batch."""
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[K, List[asyncio.Future]] = {}
+        self._scheduled = False
+
+    async def load(self, key: K) -> Optional[V]:
+        """Queue a key for the next batch and wait for its value."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return await future
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:
+        """Load several keys, sharing batches with any concurrent callers."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Split queued keys into batches and run them."""
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            batch = {key: pending[key] for key in keys[start:start + self.max_batch_size]}
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: Dict[K, List[asyncio.Future]]) -> None:
+        """Run one batch call and resolve the waiting futures."""
+        logger.debug(f"Dispatching batch load: size={len(batch)}")
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, futures in batch.items():
+            value = results.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
@@ -0,0 +1,258 @@
+"""Full-page cache for anonymous visitors."""
+
+import asyncio
+import json
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request
+from fastapi.responses import Response
+from loguru import logger
+
+from qubit.core.cache import RedisCache
+from qubit.core.config import SESSION_COOKIE
+from qubit.core.compression import compress_variants, negotiate
+from qubit.core.versions import Validators
+from qubit.database.changes import ChangeEvent
+from qubit.models.config import CompressionConfig, PageCacheConfig
+
+
+PURGE_CHANNEL = "qubit:purge"
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+# Public pages whose HTML is identical for every visitor without a session,
+# plus the syndication feeds and sitemap
+CACHEABLE_PATHS = re.compile(
+    r"^/(?:about|posts/[^/]+|sitemap\.xml"
+    r"|(?:feed/)?(?:rss\.xml|atom\.xml|feed\.json))?$"
+)
+
+PAGE_PREFIX = "page:body:"
+TAG_PREFIX = "page:tag:"
+
+
+def surrogate_keys(*keys: str) -> Dict[str, str]:
+    """Response headers tagging a page with the keys that purge it."""
+    return {SURROGATE_KEY_HEADER: " ".join(keys)}
+
+
+class PageCache:
+    """Cache rendered pages in Redis, tagged with surrogate keys.
+
+    Each tag maps to a Redis set of the page keys rendered with it, so a
+    post change purges exactly the pages that showed that post. Purges are
+    also published on ``PURGE_CHANNEL`` for a downstream proxy to consume.
+    """
+
+    _instance: Optional["PageCache"] = None
+
+    def __init__(
+        self,
+        config: Optional[PageCacheConfig] = None,
+        compression: Optional[CompressionConfig] = None,
+    ):
+        """Initialize page cache configuration."""
+        self.config = config or PageCacheConfig()
+        self.compression = compression or CompressionConfig()
+        self._cache = RedisCache.get_instance()
+
+    @classmethod
+    def get_instance(
+        cls,
+        config: Optional[PageCacheConfig] = None,
+        compression: Optional[CompressionConfig] = None,
+    ) -> "PageCache":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls(config, compression)
+        return cls._instance
+
+    def is_cacheable(self, request: Request) -> bool:
+        """Whether the request is for a public page."""
+        return (
+            self.config.enabled
+            and request.method == "GET"
+            and bool(CACHEABLE_PATHS.match(request.url.path))
+        )
+
+    @staticmethod
+    def is_anonymous(request: Request) -> bool:
+        """Whether the request carries no session, without decoding it."""
+        return SESSION_COOKIE not in request.cookies
+
+    @staticmethod
+    def page_key(request: Request) -> str:
+        """Cache key for a page, ignoring query parameter order.
+
+        Feeds and the sitemap fall back to the request's host for absolute
+        URLs, so the scheme and host are part of the key: a forged Host
+        header only ever fills its own entries.
+        """
+        query = urlencode(sorted(parse_qsl(request.url.query, keep_blank_values=True)))
+        origin = f"{request.url.scheme}://{request.url.netloc}"
+        return f"{PAGE_PREFIX}{origin}{request.url.path}?{query}"
+
+    @property
+    def cache_control(self) -> str:
+        """Cache-Control for pages shared between anonymous visitors."""
+        return (
+            f"public, max-age={self.config.browser_max_age}, "
+            f"s-maxage={self.config.ttl_seconds}"
+        )
+
+    def negotiate(self, request: Request) -> Optional[str]:
+        """Encoding to serve a cached page in, if compression is on."""
+        if not self.compression.enabled:
+            return None
+        return negotiate(request.headers.get("accept-encoding", ""))
+
+    async def get(
+        self, key: str, encoding: Optional[str] = None
+    ) -> Optional[Tuple[dict, bytes]]:
+        """Get a cached page's metadata and body, preferring an encoded variant."""
+        keys = [f"{key}:{encoding}", key] if encoding else [key]
+        for entry in await self._cache.get_many_bytes(keys):
+            if entry:
+                meta, _, body = entry.partition(b"\n")
+                return json.loads(meta), body
+        return None
+
+    async def store(
+        self,
+        key: str,
+        body: bytes,
+        media_type: str,
+        tags: List[str],
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, bytes]:
+        """Store a page and its compressed variants, indexed by surrogate key.
+
+        Variants are compressed once here rather than on every hit.
+        """
+        ttl = self.config.ttl_seconds
+        meta = {"media_type": media_type, "tags": tags, "validators": validators or {}}
+        variants = {}
+        if self.compression.enabled:
+            variants = await asyncio.to_thread(
+                compress_variants, body, self.compression.minimum_size
+            )
+
+        entries = {key: json.dumps(meta).encode("utf-8") + b"\n" + body}
+        for encoding, content in variants.items():
+            encoded_meta = json.dumps({**meta, "encoding": encoding}).encode("utf-8")
+            entries[f"{key}:{encoding}"] = encoded_meta + b"\n" + content
+        await self._cache.set_many_bytes(entries, ttl=ttl)
+
+        try:
+            async with self._cache.redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.sadd(f"{TAG_PREFIX}{tag}", *entries)
+                    pipe.expire(f"{TAG_PREFIX}{tag}", ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Page cache tag error: {e}")
+            # An untagged page could never be purged
+            await self._cache.redis.unlink(*entries)
+        return variants
+
+    async def purge(self, tags: Iterable[str]) -> int:
+        """Drop every page tagged with any of the given keys."""
+        tags = list(tags)
+        if not tags:
+            return 0
+        purged = 0
+        try:
+            tag_keys = [f"{TAG_PREFIX}{tag}" for tag in tags]
+            async with self._cache.redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+            pages = set().union(*members) if members else set()
+            purged = await self._cache.redis.unlink(*pages, *tag_keys)
+            logger.debug(f"Purged {len(pages)} pages for {tags}")
+        except Exception as e:
+            logger.error(f"Page cache purge error: {e}")
+        await self._cache.publish(PURGE_CHANNEL, {"keys": tags})
+        return purged
+
+    async def purge_all(self) -> int:
+        """Drop every cached page."""
+        purged = await self._cache.delete_pattern("page:*")
+        await self._cache.publish(PURGE_CHANNEL, {"all": True})
+        return purged
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Purge pages showing a post or microblog entry that changed."""
+        if event.table == "feed_posts":
+            await self.purge(["feed:list"])
+            return
+        await self.purge([f"post:{event.id}", "posts:list"])
+
+    async def handle_resync(self) -> None:
+        """Purge everything after notifications may have been missed."""
+        await self.purge_all()
+
+
+async def cache_pages(request: Request, call_next: Callable):
+    """Middleware serving public pages to anonymous visitors from the page cache."""
+    page_cache = PageCache.get_instance()
+    if not page_cache.is_cacheable(request):
+        return await call_next(request)
+
+    if not page_cache.is_anonymous(request):
+        response = await call_next(request)
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.headers["Vary"] = "Cookie"
+        return response
+
+    key = page_cache.page_key(request)
+    encoding = page_cache.negotiate(request)
+    cached = await page_cache.get(key, encoding)
+    if cached is not None:
+        meta, body = cached
+        headers = {
+            **surrogate_keys(*meta["tags"]),
+            **meta.get("validators", {}),
+            "Cache-Control": page_cache.cache_control,
+            "Vary": "Cookie, Accept-Encoding",
+            "X-Cache": "HIT",
+        }
+        validators = Validators.from_headers(meta.get("validators", {}))
+        if validators is not None and validators.matches(request):
+            return Response(status_code=304, headers=headers)
+        if "encoding" in meta:
+            headers["Content-Encoding"] = meta["encoding"]
+        return Response(content=body, media_type=meta["media_type"], headers=headers)
+
+    response = await call_next(request)
+    tags = response.headers.get(SURROGATE_KEY_HEADER, "").split()
+    # Only pages a route tagged are cached; anything setting a cookie is per-visitor
+    if response.status_code != 200 or not tags or "set-cookie" in response.headers:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    media_type = response.headers.get("content-type", "text/html; charset=utf-8")
+    validators = Validators.from_headers(response.headers)
+    variants = await page_cache.store(
+        key, body, media_type, tags, validators.headers if validators else None
+    )
+
+    headers = dict(response.headers)
+    headers.pop("content-length", None)
+    headers.update(
+        {
+            "Cache-Control": page_cache.cache_control,
+            "Vary": "Cookie, Accept-Encoding",
+            "X-Cache": "MISS",
+        }
+    )
+    if encoding in variants:
+        body = variants[encoding]
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=media_type,
+    )
@@ -0,0 +1,97 @@
+"""Full-text search result cache."""
+
+from typing import Any, Dict, Optional, Sequence
+from urllib.parse import quote
+
+from loguru import logger
+
+from qubit.core.cache import LRUCache, RedisCache
+from qubit.core.versions import ContentVersions
+
+
+# Changes with the cached result shape, so old entries are never read
+SEARCH_PREFIX = "search:facets:"
+STATS_KEY = "stats:search"
+SEARCH_CACHE_TTL = 600
+
+
+class SearchCache:
+    """Cache search pages by normalized tsquery and the posts content version.
+
+    Queries that normalize to the same tsquery ("Rust Async", "rust async ",
+    "the rust of async") share entries. Any post write moves the posts
+    version, so entries from before it are never read again and expire.
+    Hits and misses are counted in Redis so every worker reports one rate.
+    """
+
+    _instance: Optional["SearchCache"] = None
+
+    def __init__(self, normalized_size: int = 2048):
+        """Initialize search cache."""
+        self._cache = RedisCache.get_instance()
+        # Raw query text -> tsquery; depends only on the text and config
+        self._normalized = LRUCache(maxsize=normalized_size)
+
+    @classmethod
+    def get_instance(cls) -> "SearchCache":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def raw_key(query: str) -> str:
+        """Query text with case and whitespace differences removed."""
+        return " ".join(query.lower().split())
+
+    def get_normalized(self, query: str) -> Optional[str]:
+        """Previously normalized tsquery for this text, if known."""
+        return self._normalized.get(self.raw_key(query))
+
+    def set_normalized(self, query: str, tsquery: str) -> None:
+        """Remember the tsquery this text normalizes to."""
+        self._normalized.set(self.raw_key(query), tsquery)
+
+    async def key(
+        self, tsquery: str, limit: int, offset: int, tags: Sequence[str] = ()
+    ) -> str:
+        """Cache key for one page of results under the current posts version."""
+        version = await ContentVersions.get_instance().get("posts")
+        # Quoted so tags containing separators can't collide; the tsquery goes last
+        tag_key = ",".join(quote(tag, safe="") for tag in sorted(tags))
+        return f"{SEARCH_PREFIX}{version}:{limit}:{offset}:{tag_key}:{tsquery}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached page, counting the hit or miss."""
+        value = await self._cache.get(key)
+        try:
+            await self._cache.redis.hincrby(
+                STATS_KEY, "hits" if value is not None else "misses", 1
+            )
+        except Exception as e:
+            logger.error(f"Search stats error: {e}")
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Cache a page of results."""
+        await self._cache.set(key, value, SEARCH_CACHE_TTL)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Hits, misses and hit rate since the counters were last reset."""
+        try:
+            counts = await self._cache.redis.hgetall(STATS_KEY)
+        except Exception as e:
+            logger.error(f"Search stats error: {e}")
+            counts = {}
+        hits = int(counts.get("hits", 0))
+        misses = int(counts.get("misses", 0))
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else None,
+        }
+
+    async def reset_stats(self) -> None:
+        """Start counting again."""
+        await self._cache.delete(STATS_KEY)
@@ -0,0 +1,46 @@
+"""Startup timing utilities."""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator, Optional
+
+from loguru import logger
+
+
+class StartupTimer:
+    """Record how long each named startup phase takes."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        """Initialize timer, optionally from an earlier perf_counter() reading."""
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add a measured duration to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Time the enclosed block as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def total_ms(self) -> float:
+        """Milliseconds elapsed since the timer started."""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def log(self, target_ms: Optional[int] = None) -> None:
+        """Log the per-phase breakdown and warn when over the target."""
+        total = self.total_ms()
+        breakdown = " ".join(
+            f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases.items()
+        )
+        message = f"Startup completed in {total:.1f}ms ({breakdown})"
+
+        if target_ms and total > target_ms:
+            logger.warning(f"{message} exceeds target of {target_ms}ms")
+        else:
+            logger.info(message)
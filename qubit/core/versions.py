@@ -0,0 +1,207 @@
+"""Content version counters for conditional requests."""
+
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from fastapi import HTTPException, Request
+from loguru import logger
+from starlette import status
+from starlette.datastructures import Headers
+
+from qubit.core.cache import RedisCache
+from qubit.database.changes import ChangeEvent
+
+
+VERSIONS_KEY = "versions"
+
+# Collections whose versions each change table moves
+TABLE_COLLECTIONS = {
+    "posts": ("posts", "timeline"),
+    "post_tags": ("posts", "timeline"),
+    "feed_posts": ("feed", "timeline"),
+}
+
+
+class Validators:
+    """ETag and Last-Modified for one response.
+
+    ``last_modified`` keeps the version's milliseconds while the header only
+    has whole seconds, so If-Modified-Since matches once the client's date
+    covers the entire version: a later write in the same second still
+    misses instead of answering 304.
+    """
+
+    def __init__(self, etag: str, last_modified: datetime):
+        """Initialize validators."""
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def for_version(cls, version: int, variant: str = "") -> "Validators":
+        """Build validators from a content version in milliseconds."""
+        digest = hashlib.sha1(f"{version}:{variant}".encode("utf-8")).hexdigest()
+        return cls(
+            f'W/"{digest[:16]}"',
+            datetime.fromtimestamp(version / 1000, tz=timezone.utc),
+        )
+
+    @classmethod
+    def from_headers(cls, headers) -> Optional["Validators"]:
+        """Rebuild validators from response headers, if it has them.
+
+        Accepts either response headers or the plain ``headers`` dict kept
+        with cached pages; names are matched case-insensitively.
+        """
+        headers = Headers(headers=headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag or not last_modified:
+            return None
+        # The header dropped the milliseconds; assume the latest they could be
+        return cls(
+            etag, parsedate_to_datetime(last_modified) + timedelta(milliseconds=999)
+        )
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Validator response headers."""
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+        }
+
+    def matches(self, request: Request) -> bool:
+        """Whether the client's cached copy is still current."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match wins over If-Modified-Since when both are sent
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            weak = {tag[2:] if tag.startswith("W/") else tag for tag in tags}
+            return "*" in tags or self.etag[2:] in weak
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified <= since
+        return False
+
+
+class ContentVersions:
+    """Track when each collection and item last changed.
+
+    Versions live in Redis hashes and are moved by the database change
+    stream, so checking one costs a Redis round trip instead of a query.
+    A changed item's entry is dropped rather than rewritten. Untracked
+    items answer with their collection's version, which is never older;
+    only items a lookup found are seeded with it, so values taken from
+    URLs can't grow the hashes.
+    """
+
+    _instance: Optional["ContentVersions"] = None
+
+    def __init__(self):
+        """Initialize version store."""
+        self._cache = RedisCache.get_instance()
+
+    @classmethod
+    def get_instance(cls) -> "ContentVersions":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _now() -> int:
+        """Current time in milliseconds."""
+        return time.time_ns() // 1_000_000
+
+    async def get(
+        self, collection: str, kind: Optional[str] = None, item: Optional[str] = None
+    ) -> int:
+        """Get the version of a collection, or of one item in it."""
+        redis = self._cache.redis
+        try:
+            version = await redis.hget(VERSIONS_KEY, collection)
+            if version is None:
+                await redis.hsetnx(VERSIONS_KEY, collection, self._now())
+                version = await redis.hget(VERSIONS_KEY, collection)
+            if item is None:
+                return int(version)
+
+            item_version = await redis.hget(f"{VERSIONS_KEY}:{collection}:{kind}", item)
+            return int(item_version if item_version is not None else version)
+        except Exception as e:
+            logger.error(f"Content version error: {e}")
+            # An unknown version never matches, so clients just get a full response
+            return self._now()
+
+    async def seed(self, collection: str, kind: str, item: str) -> None:
+        """Start tracking an item that exists at its collection's version."""
+        redis = self._cache.redis
+        try:
+            version = await redis.hget(VERSIONS_KEY, collection)
+            if version is not None:
+                await redis.hsetnx(f"{VERSIONS_KEY}:{collection}:{kind}", item, version)
+        except Exception as e:
+            logger.error(f"Content version error: {e}")
+
+    async def bump(self, collection: str, items: Dict[str, Iterable[str]]) -> None:
+        """Mark a collection and some of its items as changed."""
+        try:
+            async with self._cache.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(VERSIONS_KEY, collection, self._now())
+                for kind, values in items.items():
+                    values = [value for value in values if value]
+                    if values:
+                        pipe.hdel(f"{VERSIONS_KEY}:{collection}:{kind}", *values)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Content version bump error: {e}")
+
+    async def reset(self, collection: str, kind: str) -> None:
+        """Forget every item version of one kind in a collection."""
+        await self._cache.delete(f"{VERSIONS_KEY}:{collection}:{kind}")
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Move versions for a changed row."""
+        for collection in TABLE_COLLECTIONS.get(event.table, ()):
+            await self.bump(
+                collection, {"id": [event.id], "slug": [event.slug, event.old_slug]}
+            )
+            if event.table == "post_tags":
+                # Tag rows don't carry the post's slug
+                await self.reset(collection, "slug")
+
+    async def handle_resync(self) -> None:
+        """Start every version over after notifications may have been missed."""
+        await self._cache.delete_pattern(f"{VERSIONS_KEY}*")
+
+    async def check(
+        self,
+        request: Request,
+        collection: str,
+        kind: Optional[str] = None,
+        item: Optional[str] = None,
+        variant: str = "",
+    ) -> Validators:
+        """Get validators for a response, raising 304 if the client is current.
+
+        Call before querying the database so a revalidation costs nothing else.
+        """
+        version = await self.get(collection, kind, item)
+        validators = Validators.for_version(
+            version, f"{request.url.path}?{request.url.query}:{variant}"
+        )
+        if validators.matches(request):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+            )
+        return validators
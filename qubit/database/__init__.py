@@ -1,12 +1,18 @@
 """Base database."""
 
-from typing import Optional, AsyncGenerator
+import json
+from typing import List, Optional, AsyncGenerator
 import asyncpg
 from loguru import logger
 
+from qubit.models.changes import Tombstone
 from qubit.models.config import Config
 
 
+# Alembic head revision this code expects; bump alongside new migrations
+SCHEMA_REVISION = "c4e1a7d9b250"
+
+
 class Database:
     """Base database manager with connection pooling."""
 
@@ -32,8 +38,9 @@ class Database:
                     database=config.database.name,
                     user=config.database.user,
                     password=config.database.password,
-                    min_size=5,
-                    max_size=20,
+                    min_size=config.database.pool_min_size,
+                    max_size=config.database.pool_max_size,
+                    init=cls._init_connection,
                 )
 
                 logger.info("Database connection pool created successfully")
@@ -42,6 +49,13 @@ class Database:
                 logger.error(f"Failed to create database pool: {e}")
                 raise
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection) -> None:
+        """Decode JSON columns into Python objects."""
+        await conn.set_type_codec(
+            "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
     @classmethod
     async def close_pool(cls) -> None:
         """Close the database connection pool."""
@@ -58,15 +72,69 @@ class Database:
         async with self._pool.acquire() as connection:
             yield connection
 
+    @staticmethod
+    async def _fetch_tombstones(
+        conn: asyncpg.Connection, table: str, since: int, limit: int
+    ) -> List[Tombstone]:
+        """Get rows of a table removed after a change cursor, oldest first."""
+        rows = await conn.fetch(
+            """
+            SELECT id, deleted_at, change_seq FROM tombstones
+            WHERE table_name = $1 AND change_seq > $2
+            ORDER BY change_seq
+            LIMIT $3
+        """,
+            table,
+            since,
+            limit,
+        )
+        return [
+            Tombstone(id=row["id"], deleted_at=row["deleted_at"], seq=row["change_seq"])
+            for row in rows
+        ]
+
     @classmethod
     async def initialize_database(cls, config: Config):
-        """Initialize database schema. Should only be called once at startup."""
+        """Verify the database schema. Should only be called once at startup.
+
+        Migrations own the schema, so a single revision lookup replaces the
+        DDL that used to run on every boot. The legacy bootstrap only runs
+        against a database that has never been migrated.
+        """
         db = cls(config=config)
         await cls.create_pool(config)
-        await db._setup_database()
+
+        revision = await db.get_schema_revision()
+        if revision == SCHEMA_REVISION:
+            logger.info(f"Database schema is current: revision={revision}")
+            return
+
+        if revision is None:
+            logger.warning(
+                "No Alembic revision found, bootstrapping schema; "
+                "run `alembic upgrade head` to finish setup"
+            )
+            await db._setup_database()
+            return
+
+        logger.warning(
+            f"Database schema revision {revision} does not match expected "
+            f"{SCHEMA_REVISION}; run `alembic upgrade head`"
+        )
+
+    async def get_schema_revision(self) -> Optional[str]:
+        """Get the current Alembic revision, or None if never migrated."""
+        if self._pool is None:
+            raise RuntimeError("Database pool not initialized")
+
+        async with self._pool.acquire() as conn:
+            try:
+                return await conn.fetchval("SELECT version_num FROM alembic_version")
+            except asyncpg.exceptions.UndefinedTableError:
+                return None
 
     async def _setup_database(self) -> None:
-        """Initialize database schema."""
+        """Bootstrap the base schema on a database without migrations."""
         if self._pool is None:
             raise RuntimeError("Database pool not initialized")
 
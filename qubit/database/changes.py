@@ -0,0 +1,144 @@
+"""Database change stream."""
+
+import asyncio
+import json
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import asyncpg
+from loguru import logger
+from pydantic import BaseModel
+
+from qubit.database import Database
+from qubit.models.config import Config
+
+
+CHANGES_CHANNEL = "qubit_changes"
+
+
+class ChangeEvent(BaseModel):
+    """Row change published by the ``qubit_notify_change`` trigger."""
+
+    table: str
+    op: str
+    id: str
+    slug: Optional[str] = None
+    old_slug: Optional[str] = None
+
+
+ChangeHandler = Callable[[ChangeEvent], Awaitable[None]]
+ResyncHandler = Callable[[], Awaitable[None]]
+
+
+class ChangeListener(Database):
+    """Listen for row change notifications and dispatch them to handlers.
+
+    Uses one dedicated connection per worker, outside the pool, so writes
+    made by migrations, scripts or manual SQL reach every app node.
+    """
+
+    _instance: Optional["ChangeListener"] = None
+
+    def __init__(self, config: Config):
+        """Initialize listener configuration."""
+        super().__init__(config)
+        self._handlers: Dict[str, List[ChangeHandler]] = defaultdict(list)
+        self._resync_handlers: List[ResyncHandler] = []
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def get_instance(cls, config: Config) -> "ChangeListener":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    def subscribe(self, table: str, handler: ChangeHandler) -> None:
+        """Call handler for every change to the given table."""
+        self._handlers[table].append(handler)
+
+    def on_resync(self, handler: ResyncHandler) -> None:
+        """Call handler after (re)connecting, when notifications may have been missed."""
+        self._resync_handlers.append(handler)
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._listen()),
+                asyncio.create_task(self._dispatch()),
+            ]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _listen(self) -> None:
+        """Hold a LISTEN connection open, reconnecting with backoff."""
+        delay = 1
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(
+                    host=self.host,
+                    port=self.port,
+                    database=self.dbname,
+                    user=self.user,
+                    password=self.password,
+                )
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _: closed.set())
+                await conn.add_listener(CHANGES_CHANNEL, self._on_notify)
+                logger.info(f"Listening for database changes on {CHANGES_CHANNEL}")
+
+                delay = 1
+                await self._resync()
+                await closed.wait()
+                logger.warning("Change listener connection closed")
+
+            except asyncio.CancelledError:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+                raise
+            except Exception as e:
+                logger.error(f"Change listener error: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+
+    def _on_notify(self, conn, pid: int, channel: str, payload: str) -> None:
+        """Queue a notification for dispatch."""
+        try:
+            self._queue.put_nowait(ChangeEvent(**json.loads(payload)))
+        except Exception as e:
+            logger.error(f"Invalid change notification {payload!r}: {e}")
+
+    async def _dispatch(self) -> None:
+        """Deliver queued events, collapsing duplicates that arrive together."""
+        while True:
+            events = [await self._queue.get()]
+            while not self._queue.empty():
+                events.append(self._queue.get_nowait())
+
+            unique = {}
+            for event in events:
+                unique.setdefault((event.table, event.op, event.id, event.slug), event)
+
+            for event in unique.values():
+                for handler in self._handlers.get(event.table, []):
+                    try:
+                        await handler(event)
+                    except Exception as e:
+                        logger.error(f"Change handler error for {event.table}: {e}")
+
+    async def _resync(self) -> None:
+        """Run resync handlers."""
+        for handler in self._resync_handlers:
+            try:
+                await handler()
+            except Exception as e:
+                logger.error(f"Change resync handler error: {e}")
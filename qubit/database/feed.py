@@ -1,12 +1,13 @@
 """Feed database operations."""
 
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from loguru import logger
 
 from qubit.database import Database
+from qubit.models.changes import Tombstone
 from qubit.models.feed import FeedEntry
 
 
@@ -19,22 +20,17 @@ class FeedDB(Database):
         """Create a new feed post."""
         async with self._pool.acquire() as conn:
             try:
-                now = datetime.utcnow()
+                # created_at and updated_at are stamped by the database
                 row = await conn.fetchrow(
                     """
-                    INSERT INTO feed_posts (
-                        content, author_id, author_name,
-                        created_at, updated_at
-                    )
-                    VALUES ($1, $2, $3, $4, $5)
+                    INSERT INTO feed_posts (content, author_id, author_name)
+                    VALUES ($1, $2, $3)
                     RETURNING id, content, author_id, author_name,
                               created_at, updated_at
                 """,
                     content,
                     author_id,
                     author_name,
-                    now,
-                    now,
                 )
 
                 if row:
@@ -83,6 +79,131 @@ class FeedDB(Database):
                 logger.error(f"Error fetching feed posts: {e}")
                 return []
 
+    async def get_feed_posts_before(
+        self, before: Optional[Tuple[datetime, UUID]], limit: int = 20
+    ) -> List[FeedEntry]:
+        """Get feed posts older than a keyset position, newest first."""
+        async with self._pool.acquire() as conn:
+            try:
+                query = """
+                    SELECT id, content, author_id, author_name, created_at, updated_at
+                    FROM feed_posts
+                """
+                params: List[Any] = []
+                if before is not None:
+                    query += " WHERE (created_at, id) < ($1, $2)"
+                    params.extend(before)
+                query += " ORDER BY created_at DESC, id DESC"
+                query += f" LIMIT ${len(params) + 1}"
+                params.append(limit)
+
+                rows = await conn.fetch(query, *params)
+                return [
+                    FeedEntry(
+                        id=row["id"],
+                        content=row["content"],
+                        author_id=row["author_id"],
+                        author_name=row["author_name"],
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
+                    )
+                    for row in rows
+                ]
+
+            except Exception as e:
+                logger.error(f"Error fetching feed posts by keyset: {e}")
+                return []
+
+    async def get_changes_since(
+        self, since: int, limit: int = 100
+    ) -> Tuple[List[Tuple[int, FeedEntry]], List[Tombstone]]:
+        """Get feed posts updated, and feed posts deleted, after a change cursor.
+
+        Each list holds at most ``limit + 1`` rows, oldest first; feed posts
+        come with their place in the change sequence.
+        """
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, content, author_id, author_name, created_at, updated_at,
+                           change_seq
+                    FROM feed_posts
+                    WHERE change_seq > $1
+                    ORDER BY change_seq
+                    LIMIT $2
+                """,
+                    since,
+                    limit + 1,
+                )
+                tombstones = await self._fetch_tombstones(
+                    conn, "feed_posts", since, limit + 1
+                )
+                return [
+                    (
+                        row["change_seq"],
+                        FeedEntry(
+                            id=row["id"],
+                            content=row["content"],
+                            author_id=row["author_id"],
+                            author_name=row["author_name"],
+                            created_at=row["created_at"],
+                            updated_at=row["updated_at"],
+                        ),
+                    )
+                    for row in rows
+                ], tombstones
+
+            except Exception as e:
+                logger.error(f"Error fetching feed changes: {e}")
+                return [], []
+
+    async def get_cursor(self) -> Optional[int]:
+        """Get the change cursor of the latest change to the feed."""
+        async with self._pool.acquire() as conn:
+            try:
+                return await conn.fetchval(
+                    """
+                    SELECT GREATEST(
+                        (SELECT max(change_seq) FROM feed_posts),
+                        (SELECT max(change_seq) FROM tombstones
+                         WHERE table_name = 'feed_posts')
+                    )
+                """
+                )
+
+            except Exception as e:
+                logger.error(f"Error fetching feed cursor: {e}")
+                return None
+
+    async def get_feed_post(self, post_id: UUID) -> Optional[FeedEntry]:
+        """Get a feed post by ID."""
+        async with self._pool.acquire() as conn:
+            try:
+                row = await conn.fetchrow(
+                    """
+                    SELECT id, content, author_id, author_name, created_at, updated_at
+                    FROM feed_posts
+                    WHERE id = $1
+                """,
+                    post_id,
+                )
+
+                if row:
+                    return FeedEntry(
+                        id=row["id"],
+                        content=row["content"],
+                        author_id=row["author_id"],
+                        author_name=row["author_name"],
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
+                    )
+                return None
+
+            except Exception as e:
+                logger.error(f"Error fetching feed post: {e}")
+                return None
+
     async def delete_feed_post(self, post_id: UUID) -> bool:
         """Delete a feed post."""
         async with self._pool.acquire() as conn:
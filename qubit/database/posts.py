@@ -1,20 +1,72 @@
 """Post database operations."""
 
-from typing import List, Optional
+import html
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from loguru import logger
 
-from qubit.models.post import PostCreate, PostEntry
-from qubit.core.cache import cache_result, RedisCache
+from qubit.models.changes import Tombstone
+from qubit.models.post import (
+    DerivedFields,
+    PostCreate,
+    PostEntry,
+    PostSummary,
+    SearchPage,
+    SearchResult,
+    Suggestion,
+    TagFacet,
+)
+from qubit.core.cache import cache_result, RedisCache, TTLCache
+from qubit.core.loader import BatchLoader
+from qubit.core.search_cache import SearchCache
 from qubit.database import Database
+from qubit.database.changes import ChangeEvent
+
+
+# Writes from any source are invalidated through the change stream
+POST_CACHE_TTL = 3600
+
+# ts_headline marks matches with control characters that can't be confused
+# with markup, so the snippet can be escaped before <mark> tags go in
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=\" … \""
+)
+
+# Suggestions come from this worker's memory; writes clear them through the
+# change stream and the TTL bounds anything a missed notification leaves
+SUGGEST_CACHE_SIZE = 512
+SUGGEST_CACHE_TTL = 60
+
+WORD_RE = re.compile(r"\w+")
+
+
+def prefix_tsquery(text: str) -> str:
+    """tsquery matching titles with words starting with each typed word."""
+    return " & ".join(f"{word}:*" for word in WORD_RE.findall(text.lower()))
+
+
+def highlight_snippet(headline: str) -> str:
+    """Escape a ts_headline snippet and wrap its matches in <mark>."""
+    return (
+        html.escape(headline)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
 
 
 class PostsDB(Database):
     """Post database operations."""
 
     _redis = RedisCache.get_instance()
+    _id_loader: Optional[BatchLoader] = None
+    _slug_loader: Optional[BatchLoader] = None
+    _suggestions = TTLCache(SUGGEST_CACHE_SIZE, SUGGEST_CACHE_TTL)
 
     def __init__(self, config):
         """Initialize database configuration."""
@@ -30,6 +82,7 @@ class PostsDB(Database):
                     SELECT p.id, p.title, p.content, p.content_html, p.slug,
                            p.published, p.published_at, p.author_id,
                            p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time, p.toc,
                            array_agg(t.name) as tags
                     FROM posts p
                     LEFT JOIN post_tags pt ON p.id = pt.post_id
@@ -41,19 +94,7 @@ class PostsDB(Database):
                 )
 
                 if row:
-                    return PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=row["tags"] if row["tags"][0] is not None else [],
-                    )
+                    return self._row_to_post(row)
                 return None
 
             except Exception as e:
@@ -69,6 +110,7 @@ class PostsDB(Database):
                     SELECT p.id, p.title, p.content, p.content_html, p.slug,
                            p.published, p.published_at, p.author_id,
                            p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time, p.toc,
                            array_agg(t.name) as tags
                     FROM posts p
                     LEFT JOIN post_tags pt ON p.id = pt.post_id
@@ -80,25 +122,179 @@ class PostsDB(Database):
                 )
 
                 if row:
-                    return PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=row["tags"] if row["tags"][0] is not None else [],
-                    )
+                    return self._row_to_post(row)
                 return None
 
             except Exception as e:
                 logger.error(f"Error fetching post by ID: {e}")
                 return None
 
+    @staticmethod
+    def _row_to_post(row, tags: Optional[List[str]] = None) -> PostEntry:
+        """Build a post entry from a posts row joined with aggregated tags."""
+        if tags is None:
+            tags = row["tags"] if row["tags"][0] is not None else []
+        return PostEntry(
+            id=row["id"],
+            title=row["title"],
+            content=row["content"],
+            content_html=row["content_html"],
+            slug=row["slug"],
+            published=row["published"],
+            published_at=row["published_at"],
+            author_id=row["author_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            excerpt=row["excerpt"] or "",
+            word_count=row["word_count"] or 0,
+            reading_time=row["reading_time"] or 0,
+            toc=row["toc"] or [],
+            tags=tags,
+        )
+
+    @staticmethod
+    def _row_to_summary(row) -> PostSummary:
+        """Build a post summary from a posts row joined with aggregated tags."""
+        return PostSummary(
+            id=row["id"],
+            title=row["title"],
+            slug=row["slug"],
+            published=row["published"],
+            published_at=row["published_at"],
+            author_id=row["author_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            excerpt=row["excerpt"] or "",
+            word_count=row["word_count"] or 0,
+            reading_time=row["reading_time"] or 0,
+            tags=row["tags"] if row["tags"][0] is not None else [],
+        )
+
+    async def _fetch_posts(self, field: str, values: List[Any]) -> Dict[Any, PostEntry]:
+        """Fetch posts keyed by ``id`` or ``slug``, serving cache hits from Redis.
+
+        Cache misses are loaded with a single ``= ANY($1)`` query and written
+        back under both their id and slug keys.
+        """
+        if field not in ("id", "slug"):
+            raise ValueError(f"Unsupported lookup field: {field}")
+        if not values:
+            return {}
+
+        cached = await self._redis.get_many([f"posts:{field}:{value}" for value in values])
+        found: Dict[Any, PostEntry] = {}
+        missing = []
+        for value, hit in zip(values, cached):
+            if hit:
+                found[value] = PostEntry.model_validate(hit)
+            else:
+                missing.append(value)
+
+        if not missing:
+            return found
+
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT p.id, p.title, p.content, p.content_html, p.slug,
+                           p.published, p.published_at, p.author_id,
+                           p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time, p.toc,
+                           array_agg(t.name) as tags
+                    FROM posts p
+                    LEFT JOIN post_tags pt ON p.id = pt.post_id
+                    LEFT JOIN tags t ON pt.tag_id = t.id
+                    WHERE p.{field} = ANY($1)
+                    GROUP BY p.id
+                    ORDER BY p.created_at DESC
+                """,
+                    missing,
+                )
+            except Exception as e:
+                logger.error(f"Error batch fetching posts by {field}: {e}")
+                return found
+
+        to_cache = {}
+        for row in rows:
+            post = self._row_to_post(row)
+            key = getattr(post, field)
+            # Slugs are not unique; the newest post wins, matching row order
+            if key not in found:
+                found[key] = post
+            to_cache[f"posts:id:{post.id}"] = post
+            to_cache.setdefault(f"posts:slug:{post.slug}", post)
+
+        await self._redis.set_many(to_cache, ttl=POST_CACHE_TTL)
+        logger.debug(
+            f"Batch fetched posts by {field}: requested={len(values)} "
+            f"cached={len(values) - len(missing)} fetched={len(rows)}"
+        )
+        return found
+
+    async def get_posts_by_ids(self, post_ids: List[UUID]) -> List[PostEntry]:
+        """Get many posts by ID in request order, skipping unknown IDs."""
+        ids = list(dict.fromkeys(UUID(str(post_id)) for post_id in post_ids))
+        found = await self._fetch_posts("id", ids)
+        return [found[post_id] for post_id in ids if post_id in found]
+
+    async def get_posts_by_slugs(self, slugs: List[str]) -> List[PostEntry]:
+        """Get many posts by slug in request order, skipping unknown slugs."""
+        slugs = list(dict.fromkeys(slugs))
+        found = await self._fetch_posts("slug", slugs)
+        return [found[slug] for slug in slugs if slug in found]
+
+    async def load_post_by_id(self, post_id: UUID) -> Optional[PostEntry]:
+        """Get post by ID, batching with concurrent lookups in the same tick."""
+        if PostsDB._id_loader is None:
+            PostsDB._id_loader = BatchLoader(
+                lambda ids: self._fetch_posts("id", ids)
+            )
+        return await PostsDB._id_loader.load(UUID(str(post_id)))
+
+    async def load_post_by_slug(self, slug: str) -> Optional[PostEntry]:
+        """Get post by slug, batching with concurrent lookups in the same tick."""
+        if PostsDB._slug_loader is None:
+            PostsDB._slug_loader = BatchLoader(
+                lambda slugs: self._fetch_posts("slug", slugs)
+            )
+        return await PostsDB._slug_loader.load(slug)
+
+    @classmethod
+    async def _invalidate_post(cls, post_id: UUID, *slugs: Optional[str]) -> None:
+        """Drop cached single-post lookups for a post."""
+        await cls._redis.delete(f"posts:id:{post_id}")
+        for slug in slugs:
+            if slug:
+                await cls._redis.delete(f"posts:slug:{slug}")
+
+    @classmethod
+    async def _invalidate_lists(cls) -> None:
+        """Drop cached results that may include any post."""
+        await cls._redis.delete_pattern("get_post_by_slug:*")
+        await cls._redis.delete_pattern("get_posts:*")
+        await cls._redis.delete_pattern("get_post_summaries:*")
+
+    @classmethod
+    async def handle_change(cls, event: ChangeEvent) -> None:
+        """Invalidate caches for a post changed anywhere in the database."""
+        slugs = [event.slug, event.old_slug]
+        if not any(slugs):
+            # Tag changes carry only the post id; recover the slug from cache
+            cached = await cls._redis.get(f"posts:id:{event.id}")
+            slugs = [cached.get("slug")] if cached else []
+
+        await cls._invalidate_post(event.id, *slugs)
+        await cls._invalidate_lists()
+        cls._suggestions.clear()
+
+    @classmethod
+    async def handle_resync(cls) -> None:
+        """Drop all post caches after notifications may have been missed."""
+        await cls._redis.delete_pattern("posts:*")
+        await cls._invalidate_lists()
+        cls._suggestions.clear()
+
     @cache_result(ttl=300)  # Cache for 5 minutes
     async def get_posts(
         self,
@@ -115,6 +311,7 @@ class PostsDB(Database):
                     SELECT p.id, p.title, p.content, p.content_html, p.slug,
                            p.published, p.published_at, p.author_id,
                            p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time, p.toc,
                            array_agg(t.name) as tags
                     FROM posts p
                     LEFT JOIN post_tags pt ON p.id = pt.post_id
@@ -140,19 +337,7 @@ class PostsDB(Database):
 
                 rows = await conn.fetch(query, *params)
                 return [
-                    PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=row["tags"] if row["tags"][0] is not None else [],
-                    )
+                    self._row_to_post(row)
                     for row in rows
                 ]
 
@@ -160,113 +345,414 @@ class PostsDB(Database):
                 logger.error(f"Error fetching posts: {e}")
                 return []
 
-    async def search_posts(
-        self, query: str, limit: int = 10, offset: int = 0
-    ) -> tuple[List[PostEntry], int]:
-        """Search posts using PostgreSQL full-text search and return total count."""
+    @cache_result(ttl=300)  # Cache for 5 minutes
+    async def get_post_summaries(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        published_only: bool = True,
+        author_id: Optional[int] = None,
+    ) -> List[PostSummary]:
+        """Get post summaries, without bodies, for list views."""
         async with self._pool.acquire() as conn:
             try:
-                total = await conn.fetchval(
+                query = """
+                    SELECT p.id, p.title, p.slug, p.published, p.published_at,
+                           p.author_id, p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time,
+                           array_agg(t.name) as tags
+                    FROM posts p
+                    LEFT JOIN post_tags pt ON p.id = pt.post_id
+                    LEFT JOIN tags t ON pt.tag_id = t.id
+                    WHERE 1=1
+                """
+                params = []
+                if published_only:
+                    query += " AND p.published = true"
+                if author_id:
+                    query += f" AND p.author_id = ${len(params) + 1}"
+                    params.append(author_id)
+
+                query += " GROUP BY p.id"
+                query += " ORDER BY p.created_at DESC"
+                query += f" LIMIT ${len(params) + 1}"
+                params.append(limit)
+                query += f" OFFSET ${len(params) + 1}"
+                params.append(offset)
+
+                rows = await conn.fetch(query, *params)
+                return [self._row_to_summary(row) for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error fetching post summaries: {e}")
+                return []
+
+    async def get_summaries_by_ids(self, post_ids: List[UUID]) -> List[PostSummary]:
+        """Get summaries of published posts by ID in request order, skipping others."""
+        if not post_ids:
+            return []
+        ids = list(dict.fromkeys(UUID(str(post_id)) for post_id in post_ids))
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
                     """
-                    SELECT COUNT(*)
+                    SELECT p.id, p.title, p.slug, p.published, p.published_at,
+                           p.author_id, p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time,
+                           array_agg(t.name) as tags
                     FROM posts p
-                    WHERE p.published = true
-                    AND to_tsvector('english', p.title || ' ' || p.content) @@ plainto_tsquery('english', $1)
-                    """,
-                    query
+                    LEFT JOIN post_tags pt ON p.id = pt.post_id
+                    LEFT JOIN tags t ON pt.tag_id = t.id
+                    WHERE p.id = ANY($1::uuid[]) AND p.published
+                    GROUP BY p.id
+                """,
+                    ids,
                 )
+                found = {row["id"]: self._row_to_summary(row) for row in rows}
+                return [found[post_id] for post_id in ids if post_id in found]
 
+            except Exception as e:
+                logger.error(f"Error fetching post summaries by ID: {e}")
+                return []
+
+    async def get_summaries_before(
+        self, before: Optional[Tuple[datetime, UUID]], limit: int = 10
+    ) -> List[PostSummary]:
+        """Get published post summaries older than a keyset position, newest first."""
+        async with self._pool.acquire() as conn:
+            try:
+                query = """
+                    SELECT p.id, p.title, p.slug, p.published, p.published_at,
+                           p.author_id, p.created_at, p.updated_at,
+                           p.excerpt, p.word_count, p.reading_time,
+                           array_agg(t.name) as tags
+                    FROM posts p
+                    LEFT JOIN post_tags pt ON p.id = pt.post_id
+                    LEFT JOIN tags t ON pt.tag_id = t.id
+                    WHERE p.published = true
+                """
+                params: List[Any] = []
+                if before is not None:
+                    query += " AND (p.created_at, p.id) < ($1, $2)"
+                    params.extend(before)
+                query += " GROUP BY p.id"
+                query += " ORDER BY p.created_at DESC, p.id DESC"
+                query += f" LIMIT ${len(params) + 1}"
+                params.append(limit)
+
+                rows = await conn.fetch(query, *params)
+                return [self._row_to_summary(row) for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error fetching post summaries by keyset: {e}")
+                return []
+
+    async def get_changes_since(
+        self, since: int, limit: int = 100
+    ) -> Tuple[List[Tuple[int, PostEntry]], List[Tombstone]]:
+        """Get published posts updated, and posts removed, after a change cursor.
+
+        Each list holds at most ``limit + 1`` rows, oldest first; posts come
+        with their place in the change sequence.
+        """
+        async with self._pool.acquire() as conn:
+            try:
                 rows = await conn.fetch(
                     """
                     SELECT p.id, p.title, p.content, p.content_html, p.slug,
                            p.published, p.published_at, p.author_id,
                            p.created_at, p.updated_at,
-                           array_agg(t.name) as tags,
-                           ts_rank(to_tsvector('english', p.title || ' ' || p.content), 
-                                 plainto_tsquery('english', $1)) as rank
+                           p.excerpt, p.word_count, p.reading_time, p.toc,
+                           p.change_seq,
+                           array_agg(t.name) as tags
                     FROM posts p
                     LEFT JOIN post_tags pt ON p.id = pt.post_id
                     LEFT JOIN tags t ON pt.tag_id = t.id
-                    WHERE p.published = true
-                    AND to_tsvector('english', p.title || ' ' || p.content) @@ plainto_tsquery('english', $1)
+                    WHERE p.change_seq > $1 AND p.published = true
                     GROUP BY p.id
-                    ORDER BY rank DESC
+                    ORDER BY p.change_seq
                     LIMIT $2
-                    OFFSET $3
                 """,
-                    query,
+                    since,
+                    limit + 1,
+                )
+                tombstones = await self._fetch_tombstones(
+                    conn, "posts", since, limit + 1
+                )
+                changed = [(row["change_seq"], self._row_to_post(row)) for row in rows]
+                return changed, tombstones
+
+            except Exception as e:
+                logger.error(f"Error fetching post changes: {e}")
+                return [], []
+
+    async def get_cursor(self) -> Optional[int]:
+        """Get the change cursor of the latest change to the published posts."""
+        async with self._pool.acquire() as conn:
+            try:
+                return await conn.fetchval(
+                    """
+                    SELECT GREATEST(
+                        (SELECT max(change_seq) FROM posts WHERE published = true),
+                        (SELECT max(change_seq) FROM tombstones
+                         WHERE table_name = 'posts')
+                    )
+                """
+                )
+
+            except Exception as e:
+                logger.error(f"Error fetching posts cursor: {e}")
+                return None
+
+    async def get_post_versions(self) -> List[Dict[str, Any]]:
+        """Get the ID and update time of every published post."""
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, updated_at FROM posts
+                    WHERE published = true
+                    ORDER BY created_at DESC
+                """
+                )
+                return [dict(row) for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error fetching post versions: {e}")
+                return []
+
+    async def normalize_search_query(self, query: str) -> str:
+        """Normalize search text to its tsquery: lowercased, stemmed, no stopwords."""
+        search_cache = SearchCache.get_instance()
+        tsquery = search_cache.get_normalized(query)
+        if tsquery is None:
+            async with self._pool.acquire() as conn:
+                tsquery = await conn.fetchval(
+                    "SELECT plainto_tsquery('english', $1)::text", query
+                )
+            search_cache.set_normalized(query, tsquery)
+        return tsquery
+
+    async def search_posts(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        tags: Sequence[str] = (),
+    ) -> SearchPage:
+        """Search posts using PostgreSQL full-text search, with per-tag hit counts.
+
+        Matches come from the GIN-indexed search vector, narrowed to posts
+        carrying every tag given. One statement returns the page, the total
+        and the tag counts, and only the page gets headlines. Results are
+        cached by normalized tsquery and tags until the next post write.
+        """
+        search_cache = SearchCache.get_instance()
+        tags = sorted(set(tags))
+        try:
+            tsquery = await self.normalize_search_query(query)
+            if not tsquery:
+                # Only stopwords; nothing can match
+                return SearchPage()
+
+            key = await search_cache.key(tsquery, limit, offset, tags)
+            cached = await search_cache.get(key)
+            if cached is not None:
+                return SearchPage.model_validate(cached)
+
+            async with self._pool.acquire() as conn:
+                # The summary row is always there, so an empty page still
+                # carries the total and facets
+                rows = await conn.fetch(
+                    """
+                    WITH matches AS (
+                        SELECT p.id, ts_rank(p.search_vector, $1::tsquery) AS rank
+                        FROM posts p
+                        WHERE p.published = true
+                        AND p.search_vector @@ $1::tsquery
+                        AND (
+                            cardinality($4::text[]) = 0
+                            OR p.id IN (
+                                SELECT pt.post_id
+                                FROM post_tags pt
+                                JOIN tags t ON t.id = pt.tag_id
+                                WHERE t.name = ANY($4::text[])
+                                GROUP BY pt.post_id
+                                HAVING count(*) = cardinality($4::text[])
+                            )
+                        )
+                    ),
+                    facets AS (
+                        SELECT t.name, count(*) AS hits
+                        FROM matches m
+                        JOIN post_tags pt ON pt.post_id = m.id
+                        JOIN tags t ON t.id = pt.tag_id
+                        GROUP BY t.name
+                    ),
+                    page AS (
+                        SELECT id, rank
+                        FROM matches
+                        ORDER BY rank DESC
+                        LIMIT $2
+                        OFFSET $3
+                    )
+                    SELECT (SELECT count(*) FROM matches) AS total,
+                           (SELECT array_agg(name ORDER BY hits DESC, name)
+                            FROM facets) AS facet_tags,
+                           (SELECT array_agg(hits ORDER BY hits DESC, name)
+                            FROM facets) AS facet_counts,
+                           results.*
+                    FROM (SELECT 1) AS summary
+                    LEFT JOIN (
+                        SELECT p.id, p.title, p.slug, p.published, p.published_at,
+                               p.author_id, p.created_at, p.updated_at,
+                               p.excerpt, p.word_count, p.reading_time,
+                               array_agg(t.name) as tags,
+                               page.rank,
+                               ts_headline('english', p.content, $1::tsquery, $5)
+                                   AS snippet
+                        FROM page
+                        JOIN posts p ON p.id = page.id
+                        LEFT JOIN post_tags pt ON p.id = pt.post_id
+                        LEFT JOIN tags t ON pt.tag_id = t.id
+                        GROUP BY p.id, page.rank
+                    ) AS results ON true
+                    ORDER BY results.rank DESC
+                """,
+                    tsquery,
                     limit,
                     offset,
+                    tags,
+                    HEADLINE_OPTIONS,
                 )
 
-                posts = [
-                    PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=row["tags"] if row["tags"][0] is not None else [],
+            summary = rows[0]
+            page = SearchPage(
+                posts=[
+                    SearchResult(
+                        **self._row_to_summary(row).model_dump(),
+                        snippet=highlight_snippet(row["snippet"]),
                     )
                     for row in rows
-                ]
-
-                return posts, total
+                    if row["id"] is not None
+                ],
+                total=summary["total"],
+                facets=[
+                    TagFacet(tag=tag, count=count)
+                    for tag, count in zip(
+                        summary["facet_tags"] or [], summary["facet_counts"] or []
+                    )
+                ],
+            )
+            await search_cache.set(key, page)
+
+            return page
+
+        except Exception as e:
+            logger.error(f"Error searching posts: {e}")
+            return SearchPage()
+
+    async def suggest_posts(self, prefix: str, limit: int = 5) -> List[Suggestion]:
+        """Titles for a partly typed query, tolerating typos.
+
+        Whole words typed so far match as prefixes of title words; trigram
+        similarity on titles and tag names catches misspellings. Popular
+        prefixes are answered from memory.
+        """
+        text = SearchCache.raw_key(prefix)
+        if not WORD_RE.search(text):
+            return []
+
+        key = f"{limit}:{text}"
+        cached = self._suggestions.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    WITH candidates AS (
+                        SELECT p.id
+                        FROM posts p
+                        WHERE p.published = true
+                        AND (
+                            to_tsvector('simple', p.title) @@ to_tsquery('simple', $2)
+                            OR $1 <% lower(p.title)
+                        )
+                        UNION
+                        SELECT pt.post_id
+                        FROM tags t
+                        JOIN post_tags pt ON pt.tag_id = t.id
+                        WHERE $1 <% lower(t.name)
+                    )
+                    SELECT p.id, p.title, p.slug
+                    FROM candidates c
+                    JOIN posts p ON p.id = c.id
+                    WHERE p.published = true
+                    ORDER BY
+                        (to_tsvector('simple', p.title) @@ to_tsquery('simple', $2))
+                            DESC,
+                        word_similarity($1, lower(p.title)) DESC,
+                        p.created_at DESC
+                    LIMIT $3
+                """,
+                    text,
+                    prefix_tsquery(text),
+                    limit,
+                )
+        except Exception as e:
+            logger.error(f"Error suggesting posts: {e}")
+            return []
 
-            except Exception as e:
-                logger.error(f"Error searching posts: {e}")
-                return [], 0
+        suggestions = [Suggestion(**dict(row)) for row in rows]
+        self._suggestions.set(key, suggestions)
+        return suggestions
 
     async def create_post(
-        self, post: PostCreate, author_id: int, content_html: str
+        self,
+        post: PostCreate,
+        author_id: int,
+        content_html: str,
+        derived: Optional[DerivedFields] = None,
     ) -> Optional[PostEntry]:
         """Create a new post and invalidate relevant caches."""
         async with self._pool.acquire() as conn:
             try:
                 async with conn.transaction():
-                    now = datetime.utcnow()
+                    derived = derived or DerivedFields()
+                    # created_at and updated_at are stamped by the database
                     row = await conn.fetchrow(
                         """
                         INSERT INTO posts (
                             title, content, content_html, slug, published,
                             published_at, author_id,
-                            created_at, updated_at
+                            excerpt, word_count, reading_time, toc
+                        )
+                        VALUES (
+                            $1, $2, $3, $4, $5,
+                            CASE WHEN $5 THEN clock_timestamp() AT TIME ZONE 'UTC' END,
+                            $6, $7, $8, $9, $10
                         )
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
                         RETURNING id, title, content, content_html, slug,
                                  published, published_at, author_id,
-                                 created_at, updated_at
+                                 created_at, updated_at,
+                                 excerpt, word_count, reading_time, toc
                         """,
                         post.title,
                         post.content,
                         content_html,
                         post.slug,
                         post.published,
-                        datetime.utcnow() if post.published else None,
                         author_id,
-                        now,
-                        now,
+                        derived.excerpt,
+                        derived.word_count,
+                        derived.reading_time,
+                        [entry.model_dump() for entry in derived.toc],
                     )
 
                     # Create post entry
-                    created_post = PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=post.tags,
-                    )
+                    created_post = self._row_to_post(row, tags=post.tags)
 
                     # Add tags if any
                     if post.tags:
@@ -297,7 +783,7 @@ class PostsDB(Database):
                     # Invalidate caches
                     await self._redis.delete(f"posts:slug:{created_post.slug}")
                     await self._redis.delete(f"posts:id:{created_post.id}")
-                    await self._redis.delete("posts:list")
+                    await self._invalidate_lists()
 
                     return created_post
 
@@ -306,43 +792,54 @@ class PostsDB(Database):
                 return None
 
     async def update_post(
-        self, post_id: UUID, post: PostCreate, content_html: str
+        self,
+        post_id: UUID,
+        post: PostCreate,
+        content_html: str,
+        derived: Optional[DerivedFields] = None,
     ) -> Optional[PostEntry]:
         """Update a post and invalidate relevant caches."""
         async with self._pool.acquire() as conn:
             try:
                 async with conn.transaction():
                     current = await conn.fetchrow(
-                        "SELECT published, published_at FROM posts WHERE id = $1",
+                        "SELECT slug FROM posts WHERE id = $1",
                         post_id,
                     )
                     if not current:
                         return None
 
-                    published_at = None
-                    if post.published and not current["published"]:
-                        published_at = datetime.now()
-                    elif post.published:
-                        published_at = current["published_at"]
-
+                    derived = derived or DerivedFields()
+                    # Publishing stamps published_at, and the database stamps
+                    # updated_at; SET sees the row's old values
                     row = await conn.fetchrow(
                         """
                         UPDATE posts
                         SET title = $1, content = $2, content_html = $3,
-                            slug = $4, published = $5, published_at = $6,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = $7
+                            slug = $4, published = $5,
+                            published_at = CASE
+                                WHEN NOT $5 THEN NULL
+                                WHEN published THEN published_at
+                                ELSE clock_timestamp() AT TIME ZONE 'UTC'
+                            END,
+                            excerpt = $7, word_count = $8, reading_time = $9,
+                            toc = $10
+                        WHERE id = $6
                         RETURNING id, title, content, content_html, slug,
                                   published, published_at, author_id,
-                                  created_at, updated_at
+                                  created_at, updated_at,
+                                  excerpt, word_count, reading_time, toc
                     """,
                         post.title,
                         post.content,
                         content_html,
                         post.slug,
                         post.published,
-                        published_at,
                         post_id,
+                        derived.excerpt,
+                        derived.word_count,
+                        derived.reading_time,
+                        [entry.model_dump() for entry in derived.toc],
                     )
 
                     # Update tags
@@ -372,23 +869,11 @@ class PostsDB(Database):
                             )
 
                 # Get Redis cache instance and delete relevant keys
-                await self._redis.delete("get_post_by_slug:*")
-                await self._redis.delete("get_posts:*")
+                await self._invalidate_post(post_id, current["slug"], post.slug)
+                await self._invalidate_lists()
 
                 if row:
-                    return PostEntry(
-                        id=row["id"],
-                        title=row["title"],
-                        content=row["content"],
-                        content_html=row["content_html"],
-                        slug=row["slug"],
-                        published=row["published"],
-                        published_at=row["published_at"],
-                        author_id=row["author_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        tags=post.tags,
-                    )
+                    return self._row_to_post(row, tags=post.tags)
                 return None
 
             except Exception as e:
@@ -399,18 +884,18 @@ class PostsDB(Database):
         """Delete a post and invalidate relevant caches."""
         async with self._pool.acquire() as conn:
             try:
-                result = await conn.execute(
+                slug = await conn.fetchval(
                     """
-                    DELETE FROM posts WHERE id = $1
+                    DELETE FROM posts WHERE id = $1 RETURNING slug
                 """,
                     post_id,
                 )
 
                 # Get Redis cache instance and delete relevant keys
-                await self._redis.delete("get_post_by_slug:*")
-                await self._redis.delete("get_posts:*")
+                await self._invalidate_post(post_id, slug)
+                await self._invalidate_lists()
 
-                return "DELETE 1" in result
+                return slug is not None
 
             except Exception as e:
                 logger.error(f"Error deleting post: {e}")
@@ -420,18 +905,19 @@ class PostsDB(Database):
         """Delete multiple posts."""
         async with self._pool.acquire() as conn:
             try:
-                result = await conn.execute(
+                rows = await conn.fetch(
                     """
-                    DELETE FROM posts WHERE id = ANY($1)
+                    DELETE FROM posts WHERE id = ANY($1) RETURNING id, slug
                 """,
                     post_ids,
                 )
 
                 # Get Redis cache instance and delete relevant keys
-                await self._redis.delete("get_post_by_slug:*")
-                await self._redis.delete("get_posts:*")
+                for row in rows:
+                    await self._invalidate_post(row["id"], row["slug"])
+                await self._invalidate_lists()
 
-                return "DELETE" in result
+                return bool(rows)
 
             except Exception as e:
                 logger.error(f"Error bulk deleting posts: {e}")
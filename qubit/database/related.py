@@ -0,0 +1,216 @@
+"""Related posts database operations."""
+
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+from qubit.database import Database
+
+
+class RelatedDB(Database):
+    """Post embeddings, related post lists and the model behind them."""
+
+    async def get_model(self) -> Optional[Tuple[bytes, bytes]]:
+        """Get the stored IDF weights and SVD components, if fitted."""
+        async with self._pool.acquire() as conn:
+            try:
+                row = await conn.fetchrow(
+                    "SELECT idf, components FROM embedding_model WHERE id = 1"
+                )
+                return (row["idf"], row["components"]) if row else None
+
+            except Exception as e:
+                logger.error(f"Error fetching embedding model: {e}")
+                return None
+
+    async def get_corpus(self) -> List[Tuple[UUID, str, str, List[str]]]:
+        """Get id, title, content and tags of every published post."""
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT p.id, p.title, p.content,
+                           array_remove(array_agg(t.name), NULL) AS tags
+                    FROM posts p
+                    LEFT JOIN post_tags pt ON p.id = pt.post_id
+                    LEFT JOIN tags t ON pt.tag_id = t.id
+                    WHERE p.published = true
+                    GROUP BY p.id
+                    ORDER BY p.id
+                """
+                )
+                return [
+                    (row["id"], row["title"], row["content"], row["tags"])
+                    for row in rows
+                ]
+
+            except Exception as e:
+                logger.error(f"Error fetching posts for embedding: {e}")
+                return []
+
+    async def get_embeddings(
+        self, post_ids: Sequence[UUID]
+    ) -> List[Tuple[UUID, List[float]]]:
+        """Get stored embeddings for posts that have one."""
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT post_id, embedding::real[] AS embedding
+                    FROM post_embeddings
+                    WHERE post_id = ANY($1::uuid[])
+                """,
+                    list(post_ids),
+                )
+                return [(row["post_id"], row["embedding"]) for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error fetching post embeddings: {e}")
+                return []
+
+    async def nearest(
+        self, post_id: UUID, embedding: Sequence[float], limit: int
+    ) -> List[UUID]:
+        """Get the published posts closest to an embedding, through the HNSW index."""
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT e.post_id
+                    FROM post_embeddings e
+                    JOIN posts p ON p.id = e.post_id
+                    WHERE p.published = true AND e.post_id <> $1
+                    ORDER BY e.embedding <=> $2::real[]::vector
+                    LIMIT $3
+                """,
+                    post_id,
+                    list(embedding),
+                    limit,
+                )
+                return [row["post_id"] for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error finding nearest posts: {e}")
+                return []
+
+    async def save_embedding(
+        self, post_id: UUID, embedding: Sequence[float], related_ids: List[UUID]
+    ) -> bool:
+        """Store a post's embedding and related posts."""
+        async with self._pool.acquire() as conn:
+            try:
+                await conn.execute(
+                    """
+                    INSERT INTO post_embeddings (post_id, embedding, related_ids)
+                    VALUES ($1, $2::real[]::vector, $3)
+                    ON CONFLICT (post_id) DO UPDATE
+                    SET embedding = EXCLUDED.embedding,
+                        related_ids = EXCLUDED.related_ids,
+                        updated_at = CURRENT_TIMESTAMP
+                """,
+                    post_id,
+                    list(embedding),
+                    related_ids,
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"Error saving post embedding: {e}")
+                return False
+
+    async def save_related(self, related: List[Tuple[UUID, List[UUID]]]) -> bool:
+        """Replace the related posts of posts that already have embeddings."""
+        if not related:
+            return True
+        async with self._pool.acquire() as conn:
+            try:
+                await conn.executemany(
+                    """
+                    UPDATE post_embeddings
+                    SET related_ids = $2, updated_at = CURRENT_TIMESTAMP
+                    WHERE post_id = $1
+                """,
+                    related,
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"Error saving related posts: {e}")
+                return False
+
+    async def replace_all(
+        self,
+        idf: bytes,
+        components: bytes,
+        rows: List[Tuple[UUID, List[float], List[UUID]]],
+    ) -> bool:
+        """Store a newly fitted model with every embedding and related list it made."""
+        async with self._pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        INSERT INTO embedding_model (id, idf, components, fitted_at)
+                        VALUES (1, $1, $2, CURRENT_TIMESTAMP)
+                        ON CONFLICT (id) DO UPDATE
+                        SET idf = EXCLUDED.idf,
+                            components = EXCLUDED.components,
+                            fitted_at = EXCLUDED.fitted_at
+                    """,
+                        idf,
+                        components,
+                    )
+                    # Posts no longer published drop out; the rest are rewritten
+                    await conn.execute(
+                        "DELETE FROM post_embeddings WHERE post_id <> ALL($1::uuid[])",
+                        [post_id for post_id, _, _ in rows],
+                    )
+                    await conn.executemany(
+                        """
+                        INSERT INTO post_embeddings (post_id, embedding, related_ids)
+                        VALUES ($1, $2::real[]::vector, $3)
+                        ON CONFLICT (post_id) DO UPDATE
+                        SET embedding = EXCLUDED.embedding,
+                            related_ids = EXCLUDED.related_ids,
+                            updated_at = CURRENT_TIMESTAMP
+                    """,
+                        rows,
+                    )
+                return True
+
+            except Exception as e:
+                logger.error(f"Error saving post embeddings: {e}")
+                return False
+
+    async def get_related_ids(self, post_id: UUID) -> List[UUID]:
+        """Get the precomputed related posts of a post, closest first."""
+        async with self._pool.acquire() as conn:
+            try:
+                related = await conn.fetchval(
+                    "SELECT related_ids FROM post_embeddings WHERE post_id = $1",
+                    post_id,
+                )
+                return list(related or [])
+
+            except Exception as e:
+                logger.error(f"Error fetching related posts: {e}")
+                return []
+
+    async def get_referrers(self, post_id: UUID) -> List[UUID]:
+        """Get the posts whose related lists include a post."""
+        async with self._pool.acquire() as conn:
+            try:
+                rows = await conn.fetch(
+                    """
+                    SELECT post_id
+                    FROM post_embeddings
+                    WHERE related_ids @> ARRAY[$1::uuid]
+                """,
+                    post_id,
+                )
+                return [row["post_id"] for row in rows]
+
+            except Exception as e:
+                logger.error(f"Error fetching referring posts: {e}")
+                return []
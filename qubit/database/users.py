@@ -5,12 +5,25 @@ from typing import Optional
 from loguru import logger
 
 from qubit.models.user import UserCreate, UserDB, AuthUser
+from qubit.core.cache import RedisCache
 from qubit.database import Database
 
 
+# Writes through UsersDB drop the entry; the TTL bounds changes made elsewhere
+USER_CACHE_TTL = 60
+USER_PREFIX = "users:username:"
+
+
 class UsersDB(Database):
     """User database operations."""
 
+    _redis = RedisCache.get_instance()
+
+    @classmethod
+    async def invalidate_user(cls, username: str) -> None:
+        """Drop a cached session user."""
+        await cls._redis.delete(f"{USER_PREFIX}{username}")
+
     async def create_user(
         self, user: UserCreate, password_hash: str
     ) -> Optional[UserDB]:
@@ -31,6 +44,7 @@ class UsersDB(Database):
                 )
 
                 if row:
+                    await self.invalidate_user(row["username"])
                     return UserDB(
                         id=row["id"],
                         username=row["username"],
@@ -81,6 +95,20 @@ class UsersDB(Database):
                 logger.error(f"Error fetching user: {e}")
                 return None
 
+    async def get_session_user(self, username: str) -> Optional[UserDB]:
+        """Get user by username without the password hash, cached briefly."""
+        key = f"{USER_PREFIX}{username}"
+        cached = await self._redis.get(key)
+        if cached is not None:
+            return UserDB.model_validate(cached)
+
+        user = await self.get_user_by_username(username)
+        if not user:
+            return None
+        session_user = UserDB.model_validate(user.model_dump(exclude={"password_hash"}))
+        await self._redis.set(key, session_user, USER_CACHE_TTL)
+        return session_user
+
     async def set_user_admin(self, username: str, is_admin: bool = True) -> bool:
         """Set user admin status."""
         async with self._pool.acquire() as conn:
@@ -95,6 +123,7 @@ class UsersDB(Database):
                     username,
                 )
 
+                await self.invalidate_user(username)
                 return "UPDATE 1" in result
 
             except Exception as e:
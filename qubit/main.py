@@ -1,13 +1,19 @@
 """Main application module."""
 
+import time
+
+# Measured before the heavier imports below so startup logs can report them
+_IMPORTS_STARTED = time.perf_counter()
+
 import argparse
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 from loguru import logger
@@ -16,25 +22,96 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from dotenv import load_dotenv
 
-from qubit.api import posts, auth, feed
+from qubit.api import posts, auth, feed, timeline
 from qubit.web import routes
 from qubit.api.middleware import admin_required
 from qubit.api.utils import APIError, handle_api_error
 from qubit.database import Database
-from qubit.core.config import load_config, Config
-
-
-def create_app(config: Config) -> FastAPI:
+from qubit.database.changes import ChangeListener
+from qubit.database.posts import PostsDB
+from qubit.search import get_search_backend
+from qubit.services.render import MarkdownRenderer, highlight_stylesheet_url
+from qubit.services.related import RelatedPostsService
+from qubit.services.syndication import FEED_FORMATS
+from qubit.core.assets import (
+    STATIC_DIR,
+    STATIC_URL,
+    AssetManifest,
+    FingerprintedStaticFiles,
+)
+from qubit.core.cache import RedisCache
+from qubit.core.compression import CompressionMiddleware
+from qubit.core.events import FeedBroadcaster
+from qubit.core.page_cache import PageCache, cache_pages
+from qubit.core.versions import ContentVersions
+from qubit.core.config import SESSION_COOKIE, load_config, Config
+from qubit.core.timing import StartupTimer
+
+_IMPORTS_FINISHED = time.perf_counter()
+
+
+def create_app(config: Config, timer: Optional[StartupTimer] = None) -> FastAPI:
     """Create FastAPI application."""
     load_dotenv()
+    timer = timer or StartupTimer()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Open connections and background tasks for the app's lifetime."""
+        with timer.phase("pool"):
+            await Database.create_pool(config)
+        with timer.phase("schema"):
+            await Database.initialize_database(config)
+        with timer.phase("redis"):
+            await RedisCache.get_instance().ping()
+
+        renderer = MarkdownRenderer.get_instance(config.render)
+        search = get_search_backend(PostsDB(config))
+        with timer.phase("search"):
+            await search.start()
+
+        listener = ChangeListener.get_instance(config)
+        listener.subscribe("posts", PostsDB.handle_change)
+        listener.subscribe("post_tags", PostsDB.handle_change)
+        listener.on_resync(PostsDB.handle_resync)
+        listener.subscribe("posts", search.handle_change)
+        listener.subscribe("post_tags", search.handle_change)
+        listener.on_resync(search.handle_resync)
+        for table in ("posts", "post_tags", "feed_posts"):
+            listener.subscribe(table, page_cache.handle_change)
+        listener.on_resync(page_cache.handle_resync)
+        versions = ContentVersions.get_instance()
+        for table in ("posts", "post_tags", "feed_posts"):
+            listener.subscribe(table, versions.handle_change)
+        listener.on_resync(versions.handle_resync)
+        # Post pages also show other posts' titles in their related lists
+        related = RelatedPostsService(PostsDB(config))
+        listener.subscribe("posts", related.handle_change)
+        listener.subscribe("feed_posts", broadcaster.handle_change)
+        listener.on_resync(broadcaster.handle_resync)
+        await listener.start()
+        await broadcaster.start()
+
+        timer.log(config.server.startup_target_ms)
+        yield
+
+        await broadcaster.stop()
+        await listener.stop()
+        await search.stop()
+        renderer.shutdown()
+        await Database.close_pool()
 
     app = FastAPI(
         title="Qubit",
         description="A minimalist blogging platform",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     app.state.config = config
+    page_cache = PageCache.get_instance(config.page_cache, config.compression)
+    broadcaster = FeedBroadcaster.get_instance(config)
+    app.state.startup_timer = timer
 
     # Add exception handlers
     app.add_exception_handler(APIError, handle_api_error)
@@ -43,13 +120,27 @@ def create_app(config: Config) -> FastAPI:
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    app.mount("/static", StaticFiles(directory="qubit/templates/static"), name="static")
-    templates = Jinja2Templates(directory="qubit/templates")
+    # check_dir=False so the app still starts before assets are built
+    app.mount(
+        STATIC_URL,
+        FingerprintedStaticFiles(directory=STATIC_DIR, check_dir=False),
+        name="static",
+    )
+    with timer.phase("templates"):
+        templates = Jinja2Templates(directory="qubit/templates")
+        # Compile every template now rather than on the first request
+        for name in templates.env.list_templates(extensions=["html"]):
+            templates.env.get_template(name)
 
     templates.env.globals["config"] = config
+    templates.env.globals["asset_url"] = AssetManifest.get_instance().url
+    templates.env.globals["highlight_css_url"] = highlight_stylesheet_url(
+        config.render.highlight_style
+    )
     app.state.templates = templates
 
     app.middleware("http")(admin_required)
+    app.middleware("http")(cache_pages)
 
     app.add_middleware(
         CORSMiddleware,
@@ -65,33 +156,38 @@ def create_app(config: Config) -> FastAPI:
     app.add_middleware(
         SessionMiddleware,
         secret_key=config.auth.secret_key,
+        session_cookie=SESSION_COOKIE,
         https_only=False,
     )
 
+    if config.compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=config.compression.minimum_size,
+            gzip_level=config.compression.gzip_level,
+            brotli_quality=config.compression.brotli_quality,
+        )
+
     app.include_router(auth.router, prefix="/api", tags=["auth"])
     app.include_router(posts.router, prefix="/api", tags=["posts"])
     app.include_router(feed.router, prefix="/api", tags=["feed"])
+    app.include_router(timeline.router, prefix="/api", tags=["timeline"])
 
     app.get("/")(routes.list_posts)
     app.get("/feed")(routes.feed)
     app.get("/posts/{post_id}")(routes.view_post)
     app.get("/about")(routes.about)
+    for name in FEED_FORMATS:
+        app.get(f"/{name}")(routes.posts_feed)
+        app.get(f"/feed/{name}")(routes.microblog_feed)
+    app.get("/sitemap.xml")(routes.sitemap)
+    app.get("/assets/highlight.css")(routes.highlight_css)
     app.get("/login")(routes.login)
     app.get("/admin/settings")(routes.admin_settings)
     app.get("/admin/hub")(routes.writer_hub)
     app.get("/admin/hub/write")(routes.hub_new_post)
     app.get("/admin/hub/edit/{post_id}")(routes.hub_edit_post)
 
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize database on startup."""
-        await Database.initialize_database(config)
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Close database connections on shutdown."""
-        await Database.close_pool()
-
     return app
 
 
@@ -113,9 +209,14 @@ def main():
         logger.error(f"Config file not found: {config_path}")
         return
 
-    config = load_config(str(config_path))
-    app = create_app(config)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    timer = StartupTimer(started_at=_IMPORTS_STARTED)
+    timer.record("imports", _IMPORTS_FINISHED - _IMPORTS_STARTED)
+
+    with timer.phase("config"):
+        config = load_config(str(config_path))
+    app = create_app(config, timer)
+    # Open event streams never finish on their own, so don't wait long for them
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_graceful_shutdown=5)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""Change cursor models."""
+
+from typing import Any, List, Optional, Tuple
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class Tombstone(BaseModel):
+    """Row that was deleted, or left the public list."""
+
+    id: UUID
+    deleted_at: datetime
+    # Position in the change sequence
+    seq: int
+
+
+class ChangeSet(BaseModel):
+    """Entries changed and removed after a cursor, oldest first.
+
+    Clients apply ``deleted`` before ``changed``: a post unpublished and
+    then published again within one page appears in both.
+    """
+
+    changed: List[Any] = []
+    deleted: List[UUID] = []
+    cursor: Optional[int] = None
+    has_more: bool = False
+
+    @classmethod
+    def merge(
+        cls,
+        since: int,
+        changed: List[Tuple[int, Any]],
+        tombstones: List[Tombstone],
+        limit: int,
+    ) -> "ChangeSet":
+        """Combine up to ``limit + 1`` rows of each kind into one page.
+
+        Rows carry their place in the commit-ordered change sequence, which
+        no two rows share, so a page can end anywhere. The cursor is the
+        last change kept and the next request continues strictly after it.
+        """
+        events = sorted(
+            changed + [(tombstone.seq, tombstone) for tombstone in tombstones],
+            key=lambda event: event[0],
+        )
+        has_more = len(events) > limit
+        events = events[:limit]
+
+        return cls(
+            changed=[item for _, item in events if not isinstance(item, Tombstone)],
+            deleted=[item.id for _, item in events if isinstance(item, Tombstone)],
+            cursor=events[-1][0] if events else since,
+            has_more=has_more,
+        )
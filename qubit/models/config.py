@@ -13,6 +13,8 @@ class DatabaseConfig(BaseModel):
     name: str
     user: str
     password: Optional[str] = None
+    pool_min_size: int = 5
+    pool_max_size: int = 20
 
 
 class AuthorConfig(BaseModel):
@@ -33,12 +35,73 @@ class AuthConfig(BaseModel):
     secret_key: Optional[str] = None
 
 
+class ServerConfig(BaseModel):
+    """Server runtime configuration."""
+
+    startup_target_ms: int = 2000
+    # Absolute URLs in feeds and the sitemap; defaults to the request's host,
+    # which is then part of their page cache key
+    base_url: Optional[str] = None
+
+
+class RenderConfig(BaseModel):
+    """Markdown rendering configuration."""
+
+    max_workers: int = 2
+    timeout_seconds: float = 10.0
+    max_content_bytes: int = 1_000_000
+    cache_ttl_seconds: int = 7 * 24 * 3600
+    local_cache_size: int = 256
+    highlight_style: str = "friendly"
+
+
+class PageCacheConfig(BaseModel):
+    """Full-page cache configuration for anonymous visitors."""
+
+    enabled: bool = True
+    ttl_seconds: int = 300
+    browser_max_age: int = 60
+
+
+class CompressionConfig(BaseModel):
+    """Response compression configuration."""
+
+    enabled: bool = True
+    minimum_size: int = 500
+    gzip_level: int = 6
+    brotli_quality: int = 4
+
+
+class StreamConfig(BaseModel):
+    """Live feed event stream configuration."""
+
+    heartbeat_seconds: float = 15.0
+    retry_ms: int = 3000
+    buffer_size: int = 256
+    client_queue_size: int = 64
+
+
+class SearchConfig(BaseModel):
+    """Post search configuration."""
+
+    # "postgres" for full-text search in the database, "memory" for an
+    # in-process BM25 index in each worker
+    backend: str = "postgres"
+    snapshot_path: str = "data/search.idx"
+
+
 class Config(BaseSettings):
     """Application configuration."""
 
     database: DatabaseConfig
     author: AuthorConfig
     auth: AuthConfig
+    server: ServerConfig = ServerConfig()
+    render: RenderConfig = RenderConfig()
+    page_cache: PageCacheConfig = PageCacheConfig()
+    compression: CompressionConfig = CompressionConfig()
+    stream: StreamConfig = StreamConfig()
+    search: SearchConfig = SearchConfig()
 
     auth_secret_key: str = Field(default=..., env="AUTH_SECRET_KEY")
     db_password: str = Field(default=..., env="DB_PASSWORD")
@@ -3,17 +3,23 @@ from datetime import datetime
 import uuid
 
 from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
     Column,
+    Computed,
     Integer,
     String,
     Text,
     Boolean,
     DateTime,
     ForeignKey,
+    LargeBinary,
+    SmallInteger,
     Table,
 )
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from pgvector.sqlalchemy import Vector
 
 
 Base = declarative_base()
@@ -57,8 +63,18 @@ class Post(Base):
     published = Column(Boolean, default=False)
     published_at = Column(DateTime)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    excerpt = Column(Text, nullable=False, default="")
+    word_count = Column(Integer, nullable=False, default=0)
+    reading_time = Column(Integer, nullable=False, default=0)
+    toc = Column(JSONB, nullable=False, default=list)
+    search_vector = Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', title || ' ' || content)", persisted=True),
+    )
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped with updated_at by the qubit_stamp_change trigger
+    change_seq = Column(BigInteger, nullable=False)
 
     author = relationship("User", back_populates="posts")
     tags = relationship("Tag", secondary=post_tags, back_populates="posts")
@@ -87,5 +103,40 @@ class FeedPost(Base):
     author_name = Column(String(50), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped with updated_at by the qubit_stamp_change trigger
+    change_seq = Column(BigInteger, nullable=False)
 
     author = relationship("User", back_populates="feed_posts")
+
+
+class Tombstone(Base):
+    """Deleted or unpublished row, kept for clients syncing changes."""
+    __tablename__ = "tombstones"
+
+    table_name = Column(String(50), primary_key=True)
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    change_seq = Column(BigInteger, nullable=False)
+
+
+class PostEmbedding(Base):
+    """Embedding of a published post and its precomputed related posts."""
+    __tablename__ = "post_embeddings"
+
+    post_id = Column(
+        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    embedding = Column(Vector(64), nullable=False)
+    related_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EmbeddingModel(Base):
+    """TF-IDF weights and SVD projection that post embeddings are made with."""
+    __tablename__ = "embedding_model"
+    __table_args__ = (CheckConstraint("id = 1", name="embedding_model_single_row"),)
+
+    id = Column(SmallInteger, primary_key=True, default=1)
+    idf = Column(LargeBinary, nullable=False)
+    components = Column(LargeBinary, nullable=False)
+    fitted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,9 +1,22 @@
 """Post models."""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializationInfo, field_serializer
+
+
+# How list responses show created_at
+LISTING_TIME_FORMAT = "%Y-%m-%d @ %I:%M %p UTC"
+# Serialization context selecting the list response shape
+LISTING_CONTEXT = {"listing": True}
+
+
+def _listing_time(value: datetime, info: SerializationInfo) -> Union[str, datetime]:
+    """Format ``value`` for list responses, leaving it as is otherwise."""
+    if info.context and info.context.get("listing"):
+        return value.strftime(LISTING_TIME_FORMAT)
+    return value
 
 
 class PostBase(BaseModel):
@@ -15,6 +28,23 @@ class PostBase(BaseModel):
     published: bool = False
 
 
+class TocEntry(BaseModel):
+    """Heading in a post's table of contents."""
+
+    level: int
+    title: str
+    anchor: str
+
+
+class DerivedFields(BaseModel):
+    """Fields computed from post content at write time."""
+
+    excerpt: str = ""
+    word_count: int = 0
+    reading_time: int = 0
+    toc: List[TocEntry] = []
+
+
 class PostCreate(BaseModel):
     """Post creation model."""
 
@@ -25,6 +55,13 @@ class PostCreate(BaseModel):
     published: bool = False
 
 
+class PreviewRequest(BaseModel):
+    """Editor preview request."""
+
+    content: str
+    known: List[str] = Field(default=[], max_length=10000)
+
+
 class PostEntry(PostBase):
     """Post database model."""
 
@@ -35,11 +72,21 @@ class PostEntry(PostBase):
     created_at: datetime
     updated_at: datetime
     tags: List[str] = []
+    excerpt: str = ""
+    word_count: int = 0
+    reading_time: int = 0
+    toc: List[TocEntry] = []
 
     class Config:
         """Config."""
         from_attributes = True
 
+    @field_serializer("created_at")
+    def _serialize_created_at(
+        self, value: datetime, info: SerializationInfo
+    ) -> Union[str, datetime]:
+        return _listing_time(value, info)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -51,7 +98,98 @@ class PostEntry(PostBase):
             "published": self.published,
             "published_at": self.published_at.isoformat() if self.published_at else None,
             "author_id": self.author_id,
-            "created_at": self.created_at.strftime('%Y-%m-%d @ %I:%M %p UTC'),
+            "created_at": self.created_at.strftime(LISTING_TIME_FORMAT),
+            "updated_at": self.updated_at.isoformat(),
+            "tags": self.tags,
+            "excerpt": self.excerpt,
+            "word_count": self.word_count,
+            "reading_time": self.reading_time,
+            "toc": [entry.model_dump() for entry in self.toc],
+        }
+
+
+class PostSummary(BaseModel):
+    """Post list projection without the body."""
+
+    id: UUID
+    title: str
+    slug: str
+    published: bool = False
+    published_at: Optional[datetime] = None
+    author_id: int
+    created_at: datetime
+    updated_at: datetime
+    tags: List[str] = []
+    excerpt: str = ""
+    word_count: int = 0
+    reading_time: int = 0
+
+    class Config:
+        """Config."""
+        from_attributes = True
+
+    @field_serializer("created_at")
+    def _serialize_created_at(
+        self, value: datetime, info: SerializationInfo
+    ) -> Union[str, datetime]:
+        return _listing_time(value, info)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": str(self.id),
+            "title": self.title,
+            "slug": self.slug,
+            "published": self.published,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "author_id": self.author_id,
+            "created_at": self.created_at.strftime(LISTING_TIME_FORMAT),
             "updated_at": self.updated_at.isoformat(),
             "tags": self.tags,
+            "excerpt": self.excerpt,
+            "word_count": self.word_count,
+            "reading_time": self.reading_time,
         }
+
+
+class SearchResult(PostSummary):
+    """Search hit: a post summary plus a highlighted snippet of the match."""
+
+    # HTML-escaped text with matches wrapped in <mark>
+    snippet: str = ""
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {**super().to_dict(), "snippet": self.snippet}
+
+
+class Suggestion(BaseModel):
+    """Post title offered while the reader is still typing a search."""
+
+    id: UUID
+    title: str
+    slug: str
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"id": str(self.id), "title": self.title, "slug": self.slug}
+
+
+class TagFacet(BaseModel):
+    """Number of search matches carrying a tag."""
+
+    tag: str
+    count: int
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"tag": self.tag, "count": self.count}
+
+
+class SearchPage(BaseModel):
+    """One page of search hits, with totals over every match."""
+
+    posts: List[SearchResult] = []
+    total: int = 0
+    # Tags of all matches, most common first
+    facets: List[TagFacet] = []
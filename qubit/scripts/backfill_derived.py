@@ -0,0 +1,80 @@
+"""Backfill derived post fields for existing rows."""
+
+import asyncio
+
+from loguru import logger
+
+from qubit.core.config import load_config
+from qubit.database import Database
+from qubit.models.config import Config
+from qubit.services.derived import compute_derived_fields
+
+
+async def backfill_derived_fields(
+    config: Config, batch_size: int = 200, recompute_all: bool = False
+) -> int:
+    """Compute excerpt, word count, reading time and TOC in batches."""
+    await Database.create_pool(config)
+
+    last_id = None
+    updated = 0
+    try:
+        while True:
+            async with Database._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, content
+                    FROM posts
+                    WHERE ($1::uuid IS NULL OR id > $1)
+                    AND ($3 OR word_count = 0)
+                    ORDER BY id
+                    LIMIT $2
+                """,
+                    last_id,
+                    batch_size,
+                    recompute_all,
+                )
+                if not rows:
+                    break
+
+                values = []
+                for row in rows:
+                    derived = compute_derived_fields(row["content"])
+                    values.append(
+                        (
+                            row["id"],
+                            derived.excerpt,
+                            derived.word_count,
+                            derived.reading_time,
+                            [entry.model_dump() for entry in derived.toc],
+                        )
+                    )
+
+                await conn.executemany(
+                    """
+                    UPDATE posts
+                    SET excerpt = $2, word_count = $3, reading_time = $4, toc = $5
+                    WHERE id = $1
+                """,
+                    values,
+                )
+
+            updated += len(rows)
+            last_id = rows[-1]["id"]
+            logger.info(f"Backfilled derived fields for {updated} posts")
+
+    finally:
+        await Database.close_pool()
+
+    logger.info(f"Derived field backfill complete: updated={updated}")
+    return updated
+
+
+def backfill(config_path: str, batch_size: int = 200, recompute_all: bool = False):
+    """Backfill derived post fields."""
+    config = load_config(config_path)
+    return asyncio.run(
+        backfill_derived_fields(
+            config, batch_size=batch_size, recompute_all=recompute_all
+        )
+    )
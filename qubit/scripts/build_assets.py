@@ -0,0 +1,183 @@
+"""Build fingerprinted static assets."""
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import stat
+import subprocess
+import tempfile
+import urllib.request
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from qubit.core.assets import MANIFEST_NAME, STATIC_DIR, VARIANT_SUFFIXES
+from qubit.core.compression import compress_variants
+
+
+ASSET_DIR = Path("qubit/assets")
+VENDOR_DIR = ASSET_DIR / "vendor"
+# sha256sum-style "<hex>  <name>" lines pinning each vendored file
+VENDOR_CHECKSUMS = VENDOR_DIR / "SHA256SUMS"
+TOOLS_DIR = Path(".cache/tools")
+
+TAILWIND_VERSION = "3.4.17"
+
+# Third-party scripts served from our own origin instead of a CDN
+VENDOR_ASSETS = {
+    "alpine.js": "https://unpkg.com/alpinejs@3.14.8/dist/cdn.min.js",
+    "easymde.js": "https://cdn.jsdelivr.net/npm/easymde@2.18.0/dist/easymde.min.js",
+    "easymde.css": "https://cdn.jsdelivr.net/npm/easymde@2.18.0/dist/easymde.min.css",
+}
+
+
+def download(url: str, target: Path) -> None:
+    """Download a file."""
+    logger.info(f"Downloading {url}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with urllib.request.urlopen(url, timeout=60) as response:
+        target.write_bytes(response.read())
+
+
+class VendorError(Exception):
+    """Vendored file is unpinned or doesn't match its pinned checksum."""
+
+
+def read_checksums() -> Dict[str, str]:
+    """Read the pinned checksums of vendored files."""
+    if not VENDOR_CHECKSUMS.exists():
+        return {}
+    checksums = {}
+    for line in VENDOR_CHECKSUMS.read_text("utf-8").splitlines():
+        if line.strip():
+            digest, name = line.split(maxsplit=1)
+            checksums[name.lstrip("*")] = digest
+    return checksums
+
+
+def fetch_vendor(refresh: bool = False, pin: bool = False) -> None:
+    """Download vendored libraries that aren't checked in, and verify them all.
+
+    Every file must match its checksum in ``SHA256SUMS``. With ``pin`` the
+    current files' checksums are recorded instead, to be committed with them.
+    """
+    checksums = read_checksums()
+    for name, url in VENDOR_ASSETS.items():
+        target = VENDOR_DIR / name
+        if refresh or not target.exists():
+            download(url, target)
+        digest = hashlib.sha256(target.read_bytes()).hexdigest()
+        if pin:
+            checksums[name] = digest
+        elif name not in checksums:
+            raise VendorError(
+                f"{target} has no pinned checksum; check the file, then run "
+                "`python -m qubit build-assets --pin-vendor` and commit "
+                f"{VENDOR_DIR}"
+            )
+        elif checksums[name] != digest:
+            raise VendorError(
+                f"{target} doesn't match its pinned checksum: "
+                f"expected {checksums[name]}, got {digest}"
+            )
+
+    if pin:
+        VENDOR_CHECKSUMS.write_text(
+            "".join(f"{checksums[name]}  {name}\n" for name in sorted(checksums)),
+            encoding="utf-8",
+        )
+        logger.info(f"Pinned vendored checksums in {VENDOR_CHECKSUMS}")
+
+
+def find_tailwind(tailwind: Optional[str] = None) -> str:
+    """Locate the Tailwind CLI, fetching the standalone build if needed."""
+    if tailwind:
+        return tailwind
+    on_path = shutil.which("tailwindcss")
+    if on_path:
+        return on_path
+
+    system = {"Darwin": "macos", "Linux": "linux", "Windows": "windows"}[
+        platform.system()
+    ]
+    machine = {"x86_64": "x64", "AMD64": "x64", "arm64": "arm64", "aarch64": "arm64"}[
+        platform.machine()
+    ]
+    suffix = ".exe" if system == "windows" else ""
+    binary = TOOLS_DIR / f"tailwindcss-{TAILWIND_VERSION}-{system}-{machine}{suffix}"
+    if not binary.exists():
+        download(
+            "https://github.com/tailwindlabs/tailwindcss/releases/download/"
+            f"v{TAILWIND_VERSION}/tailwindcss-{system}-{machine}{suffix}",
+            binary,
+        )
+        binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    return str(binary)
+
+
+def build_css(tailwind: str) -> bytes:
+    """Compile the minified stylesheet from classes used in the templates."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "app.css"
+        subprocess.run(
+            [
+                tailwind,
+                "--config", str(ASSET_DIR / "tailwind.config.js"),
+                "--input", str(ASSET_DIR / "app.css"),
+                "--output", str(output),
+                "--minify",
+            ],
+            check=True,
+        )
+        return output.read_bytes()
+
+
+def write_hashed(name: str, data: bytes, output: Path) -> str:
+    """Write an asset under a content-hashed name with precompressed variants."""
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    hashed = f"{stem}.{digest}{ext}"
+
+    files = {hashed: data}
+    for encoding, content in compress_variants(data).items():
+        files[hashed + VARIANT_SUFFIXES[encoding]] = content
+    for filename, content in files.items():
+        (output / filename).write_bytes(content)
+    return hashed
+
+
+def build_assets(
+    output_dir: Path = STATIC_DIR,
+    tailwind: Optional[str] = None,
+    refresh_vendor: bool = False,
+    pin_vendor: bool = False,
+) -> Dict[str, str]:
+    """Build every asset and write the manifest templates resolve URLs from."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fetch_vendor(refresh_vendor, pin_vendor)
+
+    sources = {name: (VENDOR_DIR / name).read_bytes() for name in VENDOR_ASSETS}
+    sources["app.css"] = build_css(find_tailwind(tailwind))
+
+    manifest = {
+        name: write_hashed(name, data, output_dir) for name, data in sources.items()
+    }
+
+    # Drop files from earlier builds
+    keep = {MANIFEST_NAME}
+    for hashed in manifest.values():
+        keep.add(hashed)
+        keep.update(hashed + suffix for suffix in VARIANT_SUFFIXES.values())
+    for path in output_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+
+    (output_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+    )
+    for name, hashed in sorted(manifest.items()):
+        logger.info(f"{name} -> {hashed} ({len(sources[name]) / 1024:.1f} KiB)")
+    return manifest
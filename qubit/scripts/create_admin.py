@@ -93,10 +93,113 @@ def main():
         "--config", default="data/config.yaml", help="Path to config file"
     )
 
+    rerender_parser = subparsers.add_parser(
+        "rerender-posts", help="Re-render post HTML after renderer changes"
+    )
+    rerender_parser.add_argument(
+        "--batch-size", type=int, default=100, help="Posts loaded per batch"
+    )
+    rerender_parser.add_argument(
+        "--workers", type=int, default=None, help="Render worker processes"
+    )
+    rerender_parser.add_argument(
+        "--config", default="data/config.yaml", help="Path to config file"
+    )
+
+    backfill_parser = subparsers.add_parser(
+        "backfill-derived", help="Compute derived fields for existing posts"
+    )
+    backfill_parser.add_argument(
+        "--batch-size", type=int, default=200, help="Posts updated per batch"
+    )
+    backfill_parser.add_argument(
+        "--all", action="store_true", help="Recompute posts that already have fields"
+    )
+    backfill_parser.add_argument(
+        "--config", default="data/config.yaml", help="Path to config file"
+    )
+
+    related_parser = subparsers.add_parser(
+        "recompute-related", help="Refit embeddings and rebuild related posts"
+    )
+    related_parser.add_argument(
+        "--config", default="data/config.yaml", help="Path to config file"
+    )
+
+    export_parser = subparsers.add_parser(
+        "export-static", help="Export the public site as static HTML"
+    )
+    export_parser.add_argument(
+        "--output", default="dist", help="Directory to write the site to"
+    )
+    export_parser.add_argument(
+        "--workers", type=int, default=None, help="Render worker processes"
+    )
+    export_parser.add_argument(
+        "--full", action="store_true", help="Re-render every page"
+    )
+    export_parser.add_argument(
+        "--config", default="data/config.yaml", help="Path to config file"
+    )
+
+    assets_parser = subparsers.add_parser(
+        "build-assets", help="Build fingerprinted CSS and vendored JS"
+    )
+    assets_parser.add_argument(
+        "--tailwind", default=None, help="Path to the Tailwind CLI"
+    )
+    assets_parser.add_argument(
+        "--refresh-vendor",
+        action="store_true",
+        help="Download vendored libraries again",
+    )
+    assets_parser.add_argument(
+        "--pin-vendor",
+        action="store_true",
+        help="Record checksums of the vendored libraries in SHA256SUMS",
+    )
+
+    relay_parser = subparsers.add_parser(
+        "purge-relay", help="Forward page cache purges to a reverse proxy"
+    )
+    relay_parser.add_argument(
+        "--target",
+        default="http://127.0.0.1:6081/",
+        help="Proxy URL that accepts PURGE requests",
+    )
+
     args = parser.parse_args()
 
     if args.command == "create-admin":
         create_admin(args.username, args.email, args.password, args.config)
+    elif args.command == "rerender-posts":
+        from qubit.scripts.rerender import rerender
+
+        rerender(args.config, batch_size=args.batch_size, workers=args.workers)
+    elif args.command == "backfill-derived":
+        from qubit.scripts.backfill_derived import backfill
+
+        backfill(args.config, batch_size=args.batch_size, recompute_all=args.all)
+    elif args.command == "recompute-related":
+        from qubit.scripts.recompute_related import recompute
+
+        recompute(args.config)
+    elif args.command == "export-static":
+        from qubit.scripts.export_static import export
+
+        export(args.config, args.output, workers=args.workers, full=args.full)
+    elif args.command == "build-assets":
+        from qubit.scripts.build_assets import build_assets
+
+        build_assets(
+            tailwind=args.tailwind,
+            refresh_vendor=args.refresh_vendor,
+            pin_vendor=args.pin_vendor,
+        )
+    elif args.command == "purge-relay":
+        from qubit.scripts.purge_relay import relay
+
+        relay(args.target)
     else:
         parser.print_help()
 
@@ -0,0 +1,304 @@
+"""Export the public site as static files."""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from jinja2 import Environment, FileSystemLoader
+from loguru import logger
+
+from qubit.core.assets import STATIC_DIR, AssetManifest
+from qubit.core.compression import compress_variants
+from qubit.core.config import load_config
+from qubit.database import Database
+from qubit.database.feed import FeedDB
+from qubit.database.posts import PostsDB
+from qubit.models.config import Config
+from qubit.services.post import group_by_year
+from qubit.services.related import RELATED_LIMIT
+from qubit.services.render import highlight_stylesheet, highlight_stylesheet_url
+
+
+TEMPLATE_DIR = "qubit/templates"
+MANIFEST_NAME = ".qubit-export.json"
+FEED_LIMIT = 20
+VARIANT_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+# Bump when the export layout changes so existing exports are rebuilt
+EXPORT_VERSION = "2"
+
+POST_COLUMNS = """
+    p.id, p.title, p.content, p.content_html, p.slug,
+    p.published, p.published_at, p.author_id,
+    p.created_at, p.updated_at,
+    p.excerpt, p.word_count, p.reading_time, p.toc,
+    array_agg(t.name) as tags
+"""
+
+# One template environment per worker process
+_env: Optional[Environment] = None
+_output: Optional[Path] = None
+
+
+def _init_worker(template_dir: str, output: str, globals_: Dict[str, Any]) -> None:
+    """Build the worker's template environment."""
+    global _env, _output
+    _env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
+    _env.globals.update(globals_)
+    _output = Path(output)
+
+
+def write_file(path: Path, data: bytes) -> int:
+    """Write a file and its precompressed variants, replacing them atomically."""
+    variants = [(path, data)] + [
+        (path.with_name(path.name + VARIANT_SUFFIXES[encoding]), content)
+        for encoding, content in compress_variants(data).items()
+    ]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for target, content in variants:
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, target)
+    return len(data)
+
+
+def _render_page(job: Tuple[str, Dict[str, Any], str]) -> int:
+    """Render one template to a file under the output directory."""
+    template, context, relative_path = job
+    html = _env.get_template(template).render(request=None, user=None, **context)
+    return write_file(_output / relative_path, html.encode("utf-8"))
+
+
+def site_fingerprint(config: Config) -> str:
+    """Identify everything besides post data that affects exported pages."""
+    digest = hashlib.sha256(EXPORT_VERSION.encode("utf-8"))
+    for path in sorted(Path(TEMPLATE_DIR).rglob("*.html")):
+        digest.update(str(path).encode("utf-8"))
+        digest.update(path.read_bytes())
+    digest.update(config.author.model_dump_json().encode("utf-8"))
+    digest.update(config.render.highlight_style.encode("utf-8"))
+    digest.update(AssetManifest.get_instance().fingerprint.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(output: Path) -> dict:
+    """Load what the previous export rendered."""
+    try:
+        return json.loads((output / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(output: Path, manifest: dict) -> None:
+    """Record what this export rendered."""
+    tmp = output / f".{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, output / MANIFEST_NAME)
+
+
+async def _fetch_versions() -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Get a version for every published post page, and its related post IDs.
+
+    A page's version covers its post's ``updated_at`` and those of the
+    published posts it lists as related, so a change to either re-renders it.
+    """
+    async with Database._pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT p.id, p.updated_at, e.related_ids
+            FROM posts p
+            LEFT JOIN post_embeddings e ON e.post_id = p.id
+            WHERE p.published
+        """
+        )
+    updated = {str(row["id"]): row["updated_at"].isoformat() for row in rows}
+    related = {
+        str(row["id"]): [
+            str(related_id)
+            for related_id in row["related_ids"] or []
+            if str(related_id) in updated
+        ][:RELATED_LIMIT]
+        for row in rows
+    }
+
+    versions = {}
+    for post_id, updated_at in updated.items():
+        digest = hashlib.sha256(updated_at.encode("utf-8"))
+        for related_id in related[post_id]:
+            digest.update(f"{related_id}:{updated[related_id]}".encode("utf-8"))
+        versions[post_id] = digest.hexdigest()[:16]
+    return versions, related
+
+
+async def _fetch_posts(post_ids: List[str]) -> list:
+    """Load full published posts by ID."""
+    if not post_ids:
+        return []
+    async with Database._pool.acquire() as conn:
+        rows = await conn.fetch(
+            f"""
+            SELECT {POST_COLUMNS}
+            FROM posts p
+            LEFT JOIN post_tags pt ON p.id = pt.post_id
+            LEFT JOIN tags t ON pt.tag_id = t.id
+            WHERE p.id = ANY($1::uuid[]) AND p.published
+            GROUP BY p.id
+        """,
+            post_ids,
+        )
+    return [PostsDB._row_to_post(row) for row in rows]
+
+
+async def _fetch_summaries() -> list:
+    """Load summaries of every published post for the index."""
+    async with Database._pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT p.id, p.title, p.slug, p.published, p.published_at,
+                   p.author_id, p.created_at, p.updated_at,
+                   p.excerpt, p.word_count, p.reading_time,
+                   array_agg(t.name) as tags
+            FROM posts p
+            LEFT JOIN post_tags pt ON p.id = pt.post_id
+            LEFT JOIN tags t ON pt.tag_id = t.id
+            WHERE p.published
+            GROUP BY p.id
+            ORDER BY p.created_at DESC
+        """
+        )
+    return [PostsDB._row_to_summary(row) for row in rows]
+
+
+async def export_site(
+    config: Config,
+    output_dir: str = "dist",
+    workers: Optional[int] = None,
+    full: bool = False,
+) -> int:
+    """Export published posts, the index, about and feed pages.
+
+    Later runs re-render only posts whose page version changed, plus the
+    index when any post was added, changed or removed. A change to the
+    templates or site config forces a full rebuild.
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output)
+    fingerprint = site_fingerprint(config)
+    rebuild = full or manifest.get("fingerprint") != fingerprint
+    if rebuild:
+        logger.info("Exporting full site")
+
+    await Database.create_pool(config)
+    try:
+        versions, related = await _fetch_versions()
+        previous = {} if rebuild else manifest.get("posts", {})
+        changed = [
+            post_id for post_id, updated in versions.items()
+            if previous.get(post_id) != updated
+        ]
+        removed = [
+            post_id for post_id in manifest.get("posts", {}) if post_id not in versions
+        ]
+
+        posts = await _fetch_posts(changed)
+        related_summaries = {
+            str(summary.id): summary
+            for summary in await PostsDB(config).get_summaries_by_ids(
+                list({post_id for post in posts for post_id in related[str(post.id)]})
+            )
+        }
+        jobs = [
+            (
+                "post.html",
+                {
+                    "post": post,
+                    "post_id": str(post.id),
+                    "related": [
+                        related_summaries[post_id]
+                        for post_id in related[str(post.id)]
+                        if post_id in related_summaries
+                    ],
+                },
+                f"posts/{post.id}/index.html",
+            )
+            for post in posts
+        ]
+        if rebuild or changed or removed:
+            summaries = await _fetch_summaries()
+            jobs.append(
+                (
+                    "posts.html",
+                    {"posts": summaries, "years": group_by_year(summaries)},
+                    "index.html",
+                )
+            )
+
+        feed_posts = await FeedDB(config).get_feed_posts(limit=FEED_LIMIT)
+        feed_json = json.dumps(
+            {"success": True, "data": jsonable_encoder(feed_posts)}, sort_keys=True
+        ).encode("utf-8")
+        feed_version = hashlib.sha256(feed_json).hexdigest()[:16]
+    finally:
+        await Database.close_pool()
+
+    if rebuild:
+        jobs.append(("about.html", {"author": config.author}, "about/index.html"))
+        jobs.append(("feed.html", {}, "feed/index.html"))
+        write_file(
+            output / "assets" / "highlight.css",
+            highlight_stylesheet(config.render.highlight_style).encode("utf-8"),
+        )
+        if STATIC_DIR.exists():
+            shutil.copytree(STATIC_DIR, output / "static", dirs_exist_ok=True)
+    if rebuild or manifest.get("feed") != feed_version:
+        write_file(output / "api" / "feed.json", feed_json)
+
+    for post_id in removed:
+        shutil.rmtree(output / "posts" / post_id, ignore_errors=True)
+
+    globals_ = {
+        "config": config,
+        "highlight_css_url": highlight_stylesheet_url(config.render.highlight_style),
+        "asset_url": AssetManifest.get_instance().url,
+        "feed_url": "/api/feed.json",
+    }
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(TEMPLATE_DIR, str(output), globals_),
+    ) as executor:
+        loop = asyncio.get_running_loop()
+        written = await asyncio.gather(
+            *(loop.run_in_executor(executor, _render_page, job) for job in jobs)
+        )
+
+    save_manifest(
+        output,
+        {"fingerprint": fingerprint, "posts": versions, "feed": feed_version},
+    )
+    logger.info(
+        f"Exported {len(jobs)} pages ({sum(written) / 1024:.1f} KiB) to {output}: "
+        f"{len(changed)} posts changed, {len(removed)} removed"
+    )
+    return len(jobs)
+
+
+def export(
+    config_path: str,
+    output_dir: str = "dist",
+    workers: Optional[int] = None,
+    full: bool = False,
+):
+    """Export the public site as static HTML."""
+    config = load_config(config_path)
+    return asyncio.run(export_site(config, output_dir, workers=workers, full=full))
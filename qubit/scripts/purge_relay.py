@@ -0,0 +1,57 @@
+"""Relay page cache purges to a caching reverse proxy."""
+
+import asyncio
+import json
+import urllib.request
+
+from loguru import logger
+
+from qubit.core.cache import RedisCache
+from qubit.core.page_cache import PURGE_CHANNEL, SURROGATE_KEY_HEADER
+
+
+def send_purge(target: str, message: dict, timeout: float = 5.0) -> int:
+    """Send one PURGE request to the proxy.
+
+    Tagged purges carry the surrogate keys in a ``Surrogate-Key`` header
+    (varnish xkey / Fastly style); a full purge is sent as ``X-Purge-All``.
+    """
+    headers = {}
+    if message.get("all"):
+        headers["X-Purge-All"] = "true"
+    else:
+        headers[SURROGATE_KEY_HEADER] = " ".join(message.get("keys", []))
+
+    request = urllib.request.Request(target, method="PURGE", headers=headers)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+async def relay_purges(target: str) -> None:
+    """Forward every purge published by the app until interrupted."""
+    cache = RedisCache.get_instance()
+    pubsub = cache.redis.pubsub()
+    await pubsub.subscribe(PURGE_CHANNEL)
+    logger.info(f"Relaying purges from {PURGE_CHANNEL} to {target}")
+
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            try:
+                payload = json.loads(message["data"])
+                status = await asyncio.to_thread(send_purge, target, payload)
+                logger.info(f"Purged {payload} -> {status}")
+            except Exception as e:
+                logger.error(f"Failed to relay purge {message['data']!r}: {e}")
+    finally:
+        await pubsub.unsubscribe(PURGE_CHANNEL)
+        await pubsub.close()
+
+
+def relay(target: str):
+    """Run the purge relay."""
+    try:
+        asyncio.run(relay_purges(target))
+    except KeyboardInterrupt:
+        pass
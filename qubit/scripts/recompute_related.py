@@ -0,0 +1,29 @@
+"""Recompute post embeddings and related posts for the whole corpus."""
+
+import asyncio
+
+from loguru import logger
+
+from qubit.core.config import load_config
+from qubit.database import Database
+from qubit.database.posts import PostsDB
+from qubit.models.config import Config
+from qubit.services.related import RelatedPostsService
+
+
+async def recompute_related_posts(config: Config) -> int:
+    """Refit the embedding model and rebuild every related posts list."""
+    await Database.create_pool(config)
+    try:
+        count = await RelatedPostsService(PostsDB(config)).recompute()
+    finally:
+        await Database.close_pool()
+
+    logger.info(f"Related posts recompute complete: posts={count}")
+    return count
+
+
+def recompute(config_path: str):
+    """Recompute related posts."""
+    config = load_config(config_path)
+    return asyncio.run(recompute_related_posts(config))
@@ -0,0 +1,85 @@
+"""Re-render stored post HTML after renderer changes."""
+
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from qubit.core.config import load_config
+from qubit.database import Database
+from qubit.models.config import Config
+from qubit.services.render import MarkdownRenderer, RENDERER_FINGERPRINT, RenderError
+
+
+async def rerender_posts(
+    config: Config, batch_size: int = 100, workers: Optional[int] = None
+) -> int:
+    """Re-render every post in parallel and write only rows whose HTML changed."""
+    render_config = config.render.model_copy()
+    if workers:
+        render_config.max_workers = workers
+    renderer = MarkdownRenderer(render_config)
+
+    await Database.create_pool(config)
+    logger.info(f"Re-rendering posts with renderer {RENDERER_FINGERPRINT}")
+
+    last_id = None
+    scanned = updated = failed = 0
+    try:
+        while True:
+            async with Database._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, content, content_html
+                    FROM posts
+                    WHERE $1::uuid IS NULL OR id > $1
+                    ORDER BY id
+                    LIMIT $2
+                """,
+                    last_id,
+                    batch_size,
+                )
+            if not rows:
+                break
+
+            results = await asyncio.gather(
+                *(renderer.render(row["content"]) for row in rows),
+                return_exceptions=True,
+            )
+
+            changed = []
+            for row, html in zip(rows, results):
+                if isinstance(html, RenderError):
+                    logger.error(f"Failed to render post {row['id']}: {html}")
+                    failed += 1
+                elif isinstance(html, BaseException):
+                    raise html
+                elif html != row["content_html"]:
+                    changed.append((row["id"], html))
+
+            if changed:
+                async with Database._pool.acquire() as conn:
+                    await conn.executemany(
+                        "UPDATE posts SET content_html = $2 WHERE id = $1",
+                        changed,
+                    )
+
+            scanned += len(rows)
+            updated += len(changed)
+            last_id = rows[-1]["id"]
+            logger.info(f"Re-rendered {scanned} posts, {updated} changed")
+
+    finally:
+        renderer.shutdown()
+        await Database.close_pool()
+
+    logger.info(
+        f"Re-render complete: scanned={scanned} updated={updated} failed={failed}"
+    )
+    return updated
+
+
+def rerender(config_path: str, batch_size: int = 100, workers: Optional[int] = None):
+    """Re-render all posts using the current markdown renderer."""
+    config = load_config(config_path)
+    return asyncio.run(rerender_posts(config, batch_size=batch_size, workers=workers))
@@ -0,0 +1,13 @@
+"""Post search backends."""
+
+from qubit.database.posts import PostsDB
+from qubit.search.base import SearchBackend
+from qubit.search.memory import MemorySearchBackend
+from qubit.search.postgres import PostgresSearchBackend
+
+
+def get_search_backend(db: PostsDB) -> SearchBackend:
+    """Backend chosen by the ``search.backend`` setting."""
+    if db.config.search.backend == "memory":
+        return MemorySearchBackend.get_instance(db.config)
+    return PostgresSearchBackend(db)
@@ -0,0 +1,37 @@
+"""Search backend interface."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from qubit.database.changes import ChangeEvent
+from qubit.models.post import SearchPage
+
+
+class SearchBackend(ABC):
+    """Answers post searches for ``PostService.search_posts``.
+
+    Backends that keep their own index follow writes through the change
+    stream; the default handlers do nothing.
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        tags: Sequence[str] = (),
+    ) -> SearchPage:
+        """Best matching published posts carrying every tag, with match counts."""
+
+    async def start(self) -> None:
+        """Prepare the backend when the app starts."""
+
+    async def stop(self) -> None:
+        """Release the backend when the app stops."""
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Follow a post changed anywhere in the database."""
+
+    async def handle_resync(self) -> None:
+        """Catch up after notifications may have been missed."""
@@ -0,0 +1,407 @@
+"""In-process BM25 inverted index."""
+
+import heapq
+import html
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import orjson
+
+
+WORD_RE = re.compile(r"\w+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his i if in into is "
+    "it its me my no not of on or our she so than that the their them then there "
+    "these they this to was we were what when which who will with you your".split()
+)
+
+# Standard BM25 parameters: term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Deleted documents stay in postings until they are this share of the index
+COMPACT_RATIO = 0.25
+
+# Keywords (tags) are exact terms under a prefix no word can start with
+KEYWORD_PREFIX = "\x00"
+
+SNAPSHOT_MAGIC = b"QBM25\x00\x00\x02"
+HEADER = struct.Struct("<8sQ")
+
+# Postings are read-only views into a snapshot until a write copies them
+Postings = Tuple[Union[array, memoryview], Union[array, memoryview]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words without stopwords. Words are not stemmed."""
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+def snippet(text: str, terms: Iterable[str], max_words: int = 35) -> str:
+    """HTML-escaped excerpt around the first match, matches wrapped in <mark>."""
+    terms = set(terms)
+    words = list(WORD_RE.finditer(text))
+    first = next(
+        (i for i, word in enumerate(words) if word.group().lower() in terms), 0
+    )
+    start = max(0, first - max_words // 3)
+    window = words[start : start + max_words]
+    if not window:
+        return ""
+
+    parts = ["… "] if start else []
+    position = window[0].start()
+    for word in window:
+        parts.append(html.escape(text[position : word.start()]))
+        if word.group().lower() in terms:
+            parts.append(f"<mark>{html.escape(word.group())}</mark>")
+        else:
+            parts.append(html.escape(word.group()))
+        position = word.end()
+    if start + max_words < len(words):
+        parts.append(" …")
+    return "".join(parts)
+
+
+def _align(offset: int, size: int = 8) -> int:
+    return (offset + size - 1) // size * size
+
+
+class BM25Index:
+    """Inverted index over documents identified by string IDs, ranked by BM25.
+
+    Each term's postings are two parallel ``array('I')`` columns of document
+    numbers and term frequencies, in increasing document order, so adding a
+    document only appends. Removing one marks it dead; dead documents are
+    skipped at query time and dropped when they pass ``COMPACT_RATIO`` of the
+    index, which also renumbers the rest. Every document carries an opaque
+    payload returned with its hits, and optional keywords to filter and count
+    matches by; keywords don't affect scores.
+
+    Snapshots are loaded with mmap: postings and payloads are read straight
+    from the page cache, and only terms written to afterwards are copied.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._ids: List[Optional[str]] = []
+        self._numbers: Dict[str, int] = {}
+        self._lengths = array("I")
+        self._payloads: List[Optional[bytes]] = []
+        self._postings: Dict[str, Postings] = {}
+        # May keep keywords whose postings compaction dropped
+        self._keywords: Set[str] = set()
+        self._live = 0
+        self._total_length = 0
+        # Terms and payloads still only in a loaded snapshot
+        self._snapshot: Optional[memoryview] = None
+        self._snapshot_terms: Dict[str, Tuple[int, int]] = {}
+        self._snapshot_offsets: Optional[memoryview] = None
+        self._snapshot_blob = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._numbers
+
+    def _get_postings(self, term: str) -> Optional[Postings]:
+        postings = self._postings.get(term)
+        if postings is None and term in self._snapshot_terms:
+            offset, count = self._snapshot_terms.pop(term)
+            middle = offset + count * 4
+            postings = (
+                self._snapshot[offset:middle].cast("I"),
+                self._snapshot[middle : middle + count * 4].cast("I"),
+            )
+            self._postings[term] = postings
+        return postings
+
+    def _writable_postings(self, term: str) -> Tuple[array, array]:
+        postings = self._get_postings(term)
+        if postings is None:
+            postings = (array("I"), array("I"))
+        elif not isinstance(postings[0], array):
+            postings = (
+                array("I", postings[0].tobytes()),
+                array("I", postings[1].tobytes()),
+            )
+        self._postings[term] = postings
+        return postings
+
+    def add(
+        self, doc_id: str, text: str, payload: bytes, keywords: Iterable[str] = ()
+    ) -> None:
+        """Index a document, replacing any earlier version of it."""
+        self.remove(doc_id)
+        tokens = tokenize(text)
+        number = len(self._ids)
+        self._ids.append(doc_id)
+        self._numbers[doc_id] = number
+        self._lengths.append(len(tokens))
+        self._payloads.append(payload)
+        for term, frequency in Counter(tokens).items():
+            docs, frequencies = self._writable_postings(term)
+            docs.append(number)
+            frequencies.append(frequency)
+        for keyword in set(keywords):
+            docs, frequencies = self._writable_postings(KEYWORD_PREFIX + keyword)
+            docs.append(number)
+            frequencies.append(1)
+            self._keywords.add(keyword)
+        self._live += 1
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document, returning whether it was indexed."""
+        number = self._numbers.pop(doc_id, None)
+        if number is None:
+            return False
+        self._ids[number] = None
+        self._payloads[number] = None
+        self._live -= 1
+        self._total_length -= self._lengths[number]
+        if len(self._ids) - self._live > COMPACT_RATIO * len(self._ids):
+            self.compact()
+        return True
+
+    def _raw_payload(self, number: int) -> Union[bytes, memoryview]:
+        payload = self._payloads[number]
+        if payload is None:
+            start = self._snapshot_blob + self._snapshot_offsets[number]
+            end = self._snapshot_blob + self._snapshot_offsets[number + 1]
+            payload = self._snapshot[start:end]
+        return payload
+
+    def payload(self, doc_id: str) -> Any:
+        """Decoded payload of an indexed document."""
+        return orjson.loads(self._raw_payload(self._numbers[doc_id]))
+
+    def compact(self) -> None:
+        """Drop dead documents from postings and renumber the live ones."""
+        renumber = array("i", [-1]) * len(self._ids)
+        ids: List[Optional[str]] = []
+        lengths = array("I")
+        payloads: List[Optional[bytes]] = []
+        for number, doc_id in enumerate(self._ids):
+            if doc_id is None:
+                continue
+            renumber[number] = len(ids)
+            ids.append(doc_id)
+            lengths.append(self._lengths[number])
+            payloads.append(bytes(self._raw_payload(number)))
+
+        postings: Dict[str, Postings] = {}
+        for term in list(self._postings) + list(self._snapshot_terms):
+            docs, frequencies = self._get_postings(term)
+            new_docs, new_frequencies = array("I"), array("I")
+            for number, frequency in zip(docs, frequencies):
+                if renumber[number] >= 0:
+                    new_docs.append(renumber[number])
+                    new_frequencies.append(frequency)
+            if new_docs:
+                postings[term] = (new_docs, new_frequencies)
+
+        self._ids = ids
+        self._numbers = {doc_id: number for number, doc_id in enumerate(ids)}
+        self._lengths = lengths
+        self._payloads = payloads
+        self._postings = postings
+        # Nothing refers to the snapshot now; the map closes once unreferenced
+        self._snapshot = None
+        self._snapshot_terms = {}
+        self._snapshot_offsets = None
+
+    def _scores(self, terms: List[str]) -> Dict[int, float]:
+        """BM25 scores of the live documents containing every term."""
+        postings = [self._get_postings(term) for term in terms]
+        if any(p is None for p in postings):
+            return {}
+
+        count = len(self._ids)
+        average_length = self._total_length / self._live
+        scores: Optional[Dict[int, float]] = None
+        # Rarest first, so later terms only check the surviving candidates
+        for docs, frequencies in sorted(postings, key=lambda p: len(p[0])):
+            df = len(docs)
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            if scores is None:
+                candidates = zip(docs, frequencies)
+            elif len(scores) * 16 < df:
+                candidates = []
+                for number in scores:
+                    i = bisect_left(docs, number)
+                    if i < df and docs[i] == number:
+                        candidates.append((number, frequencies[i]))
+            else:
+                candidates = (
+                    (number, frequency)
+                    for number, frequency in zip(docs, frequencies)
+                    if number in scores
+                )
+
+            term_scores: Dict[int, float] = {}
+            for number, frequency in candidates:
+                if self._ids[number] is None:
+                    continue
+                norm = K1 * (1 - B + B * self._lengths[number] / average_length)
+                score = idf * frequency * (K1 + 1) / (frequency + norm)
+                term_scores[number] = score + (
+                    scores[number] if scores is not None else 0.0
+                )
+            scores = term_scores
+            if not scores:
+                break
+        return scores or {}
+
+    def match(self, query: str, keywords: Iterable[str] = ()) -> Dict[int, float]:
+        """Scores of the documents matching every query word and keyword."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._live:
+            return {}
+        scores = self._scores(terms)
+        for keyword in set(keywords):
+            if not scores:
+                break
+            postings = self._get_postings(KEYWORD_PREFIX + keyword)
+            docs = postings[0] if postings is not None else ()
+            scores = {number: scores[number] for number in docs if number in scores}
+        return scores
+
+    def top(
+        self, scores: Dict[int, float], limit: int = 10, offset: int = 0
+    ) -> List[Tuple[str, float]]:
+        """One page of matched documents, best first."""
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda hit: hit[1])
+        return [(self._ids[number], score) for number, score in top[offset:]]
+
+    def keyword_counts(self, scores: Dict[int, float]) -> Dict[str, int]:
+        """How many matched documents carry each keyword."""
+        counts = {}
+        for keyword in self._keywords:
+            postings = self._get_postings(KEYWORD_PREFIX + keyword)
+            if postings is None:
+                continue
+            count = sum(1 for number in postings[0] if number in scores)
+            if count:
+                counts[keyword] = count
+        return counts
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        keywords: Iterable[str] = (),
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """Documents matching every query word and keyword, best first, and how many."""
+        scores = self.match(query, keywords)
+        return self.top(scores, limit, offset), len(scores)
+
+    def save(
+        self, path: Union[str, Path], meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write a snapshot, replacing the file atomically."""
+        if self._live < len(self._ids):
+            self.compact()
+        for term in list(self._snapshot_terms):
+            self._get_postings(term)
+
+        count = len(self._ids)
+        payloads = [self._raw_payload(number) for number in range(count)]
+        offsets = array("Q", [0])
+        for payload in payloads:
+            offsets.append(offsets[-1] + len(payload))
+
+        # Sections in order: payload offsets, lengths, postings, payloads
+        position = len(offsets) * 8 + count * 4
+        terms = []
+        for term, (docs, _) in self._postings.items():
+            terms.append([term, position, len(docs)])
+            position += len(docs) * 8
+        header = orjson.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "ids": self._ids,
+                "total_length": self._total_length,
+                "terms": terms,
+                "blob": position,
+                "meta": meta or {},
+            }
+        )
+        padding = _align(HEADER.size + len(header)) - HEADER.size - len(header)
+
+        path = Path(path)
+        # A temp file of its own, so workers saving at once can't interleave
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp = Path(f.name)
+            try:
+                f.write(HEADER.pack(SNAPSHOT_MAGIC, len(header)))
+                f.write(header + b"\x00" * padding)
+                f.write(offsets)
+                f.write(self._lengths)
+                for docs, frequencies in self._postings.values():
+                    f.write(docs)
+                    f.write(frequencies)
+                for payload in payloads:
+                    f.write(payload)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Tuple["BM25Index", Dict[str, Any]]:
+        """Map a snapshot, returning the index and the metadata saved with it."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, header_size = HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a search index snapshot")
+        header = orjson.loads(view[HEADER.size : HEADER.size + header_size])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(
+                f"{path} was written on a {header['byteorder']}-endian host"
+            )
+
+        index = cls()
+        data = view[_align(HEADER.size + header_size) :]
+        count = len(header["ids"])
+        index._ids = header["ids"]
+        index._numbers = {doc_id: number for number, doc_id in enumerate(index._ids)}
+        index._snapshot_offsets = data[: (count + 1) * 8].cast("Q")
+        lengths_start = (count + 1) * 8
+        index._lengths = array(
+            "I", data[lengths_start : lengths_start + count * 4].tobytes()
+        )
+        index._payloads = [None] * count
+        index._live = count
+        index._total_length = header["total_length"]
+        index._snapshot = data
+        index._snapshot_terms = {
+            term: (offset, length) for term, offset, length in header["terms"]
+        }
+        index._keywords = {
+            term[len(KEYWORD_PREFIX) :]
+            for term in index._snapshot_terms
+            if term.startswith(KEYWORD_PREFIX)
+        }
+        index._snapshot_blob = header["blob"]
+        return index, header["meta"]
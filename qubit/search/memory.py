@@ -0,0 +1,154 @@
+"""In-process search backend."""
+
+import asyncio
+from pathlib import Path
+from typing import Optional, Sequence
+from uuid import UUID
+
+import orjson
+from loguru import logger
+
+from qubit.database.changes import ChangeEvent
+from qubit.database.posts import PostsDB
+from qubit.models.changes import ChangeSet
+from qubit.models.config import Config
+from qubit.models.post import (
+    PostEntry,
+    PostSummary,
+    SearchPage,
+    SearchResult,
+    TagFacet,
+)
+from qubit.search.base import SearchBackend
+from qubit.search.bm25 import BM25Index, snippet, tokenize
+
+
+CATCH_UP_BATCH = 500
+
+
+class MemorySearchBackend(SearchBackend):
+    """Search published posts with a BM25 index held in this worker.
+
+    The index starts from the last snapshot and catches up through the
+    change cursor saved with it; a missing snapshot means catching up from
+    the beginning. Afterwards single posts are re-indexed from the change
+    stream, and the snapshot is written again on shutdown.
+    """
+
+    _instance: Optional["MemorySearchBackend"] = None
+
+    def __init__(self, config: Config):
+        """Initialize search backend."""
+        self.config = config.search
+        self.db = PostsDB(config)
+        self.index = BM25Index()
+        # Time of the last change applied by catching up
+        self.cursor: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls, config: Config) -> "MemorySearchBackend":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    async def start(self) -> None:
+        """Load the snapshot, if any, and apply changes made since it."""
+        path = Path(self.config.snapshot_path)
+        loaded = False
+        if path.exists():
+            try:
+                self.index, meta = BM25Index.load(path)
+                cursor = meta.get("cursor")
+                self.cursor = int(cursor) if cursor is not None else None
+                loaded = True
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring search snapshot {path}: {e}")
+
+        await self.catch_up()
+        logger.info(f"Search index ready: posts={len(self.index)} snapshot={loaded}")
+        if not loaded:
+            self.save()
+
+    async def stop(self) -> None:
+        """Write the snapshot for the next start."""
+        self.save()
+
+    def save(self) -> None:
+        """Write the index and its cursor to the snapshot file."""
+        path = Path(self.config.snapshot_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.index.save(path, {"cursor": self.cursor})
+        except OSError as e:
+            logger.error(f"Error saving search snapshot {path}: {e}")
+
+    def _add(self, post: PostEntry) -> None:
+        summary = PostSummary.model_validate(post.model_dump())
+        payload = {"summary": summary.model_dump(mode="json"), "text": post.content}
+        # Same document text as the Postgres backend's tsvector
+        self.index.add(
+            str(post.id),
+            f"{post.title} {post.content}",
+            orjson.dumps(payload),
+            keywords=post.tags,
+        )
+
+    async def catch_up(self) -> None:
+        """Apply every change after the cursor."""
+        async with self._lock:
+            since = self.cursor or 0
+            while True:
+                changed, tombstones = await self.db.get_changes_since(
+                    since, CATCH_UP_BATCH
+                )
+                changes = ChangeSet.merge(since, changed, tombstones, CATCH_UP_BATCH)
+                for post_id in changes.deleted:
+                    self.index.remove(str(post_id))
+                for post in changes.changed:
+                    self._add(post)
+                since = changes.cursor
+                if not changes.has_more:
+                    break
+            self.cursor = since
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Re-index one post, or drop it if it is gone or unpublished."""
+        post = None
+        if event.op != "DELETE":
+            post = await self.db.get_post_by_id(UUID(event.id))
+        if post and post.published:
+            self._add(post)
+        else:
+            self.index.remove(event.id)
+
+    async def handle_resync(self) -> None:
+        """Catch up after notifications may have been missed."""
+        await self.catch_up()
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        tags: Sequence[str] = (),
+    ) -> SearchPage:
+        """Search published posts."""
+        scores = self.index.match(query, keywords=tags)
+        terms = tokenize(query)
+        results = []
+        for post_id, _ in self.index.top(scores, limit=limit, offset=offset):
+            payload = self.index.payload(post_id)
+            results.append(
+                SearchResult(
+                    **payload["summary"], snippet=snippet(payload["text"], terms)
+                )
+            )
+        # Most common first, like the Postgres backend
+        counts = sorted(
+            self.index.keyword_counts(scores).items(),
+            key=lambda item: (-item[1], item[0]),
+        )
+        facets = [TagFacet(tag=tag, count=count) for tag, count in counts]
+        return SearchPage(posts=results, total=len(scores), facets=facets)
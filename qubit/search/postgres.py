@@ -0,0 +1,27 @@
+"""PostgreSQL full-text search backend."""
+
+from typing import Sequence
+
+from qubit.database.posts import PostsDB
+from qubit.models.post import SearchPage
+from qubit.search.base import SearchBackend
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Search with PostgreSQL full-text search, cached by normalized tsquery."""
+
+    def __init__(self, db: PostsDB):
+        """Initialize search backend."""
+        self.db = db
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        tags: Sequence[str] = (),
+    ) -> SearchPage:
+        """Search published posts."""
+        return await self.db.search_posts(
+            query, limit=limit, offset=offset, tags=tags
+        )
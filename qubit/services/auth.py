@@ -9,6 +9,7 @@ from pydantic import EmailStr
 from starlette.responses import Response
 
 from qubit.models.user import UserCreate, UserDB
+from qubit.core.config import SESSION_COOKIE
 from qubit.database.users import UsersDB
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -51,6 +52,7 @@ class AuthService:
 
             self.request.session.clear()
             self.request.session.update(session_data)
+            self.forget_user()
             logger.info(f"Session created for {username}; admin: {is_admin}")
         except Exception as e:
             logger.error(f"Error setting session: {e}")
@@ -60,6 +62,7 @@ class AuthService:
         """Clear session cookie."""
         try:
             self.request.session.clear()
+            self.forget_user()
         except Exception as e:
             logger.error(f"Error clearing session: {e}")
 
@@ -77,8 +80,23 @@ class AuthService:
             {k: v for k, v in auth_user.model_dump().items() if k != "password_hash"}
         )
 
+    def forget_user(self) -> None:
+        """Drop the user resolved earlier in this request."""
+        if hasattr(self.request.state, "user"):
+            del self.request.state.user
+
     async def get_current_user(self) -> Optional[UserDB]:
-        """Get current user from session."""
+        """Get current user from session, resolved once per request."""
+        if hasattr(self.request.state, "user"):
+            return self.request.state.user
+        user = await self._load_current_user()
+        self.request.state.user = user
+        return user
+
+    async def _load_current_user(self) -> Optional[UserDB]:
+        """Look up the session's user, skipping all work without a cookie."""
+        if SESSION_COOKIE not in self.request.cookies:
+            return None
         try:
             session = getattr(self.request, "session", None)
             if not session:
@@ -93,13 +111,13 @@ class AuthService:
                 self.clear_session(None)
                 return None
 
-            user = await self.db.get_user_by_username(username)
+            user = await self.db.get_session_user(username)
             if not user:
                 logger.warning(f"User not found: {username}")
                 return None
 
             logger.debug(f"User found in session: {username}")
-            return UserDB.model_validate(user)
+            return user
         except Exception as e:
             logger.warning(f"Session error: {e}")
             return None
@@ -0,0 +1,104 @@
+"""Derived post fields."""
+
+import math
+import re
+from typing import List, Tuple
+
+from markdown.extensions.toc import slugify, unique
+
+from qubit.models.post import DerivedFields, TocEntry
+
+
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 280
+
+FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+INLINE_MARKUP_RE = re.compile(r"[`*_~]+")
+BLOCK_PREFIX_RE = re.compile(r"^\s*(?:>\s*)*(?:[-*+]\s+|\d+[.)]\s+)?")
+WORD_RE = re.compile(r"\w+")
+
+
+def _strip_inline(text: str) -> str:
+    """Remove inline markdown, keeping the visible text."""
+    text = IMAGE_RE.sub(r"\1", text)
+    text = LINK_RE.sub(r"\1", text)
+    text = HTML_TAG_RE.sub("", text)
+    return INLINE_MARKUP_RE.sub("", text)
+
+
+def _split_blocks(content: str) -> Tuple[List[TocEntry], List[str], List[str]]:
+    """Split markdown into headings, prose paragraphs and code lines."""
+    toc: List[TocEntry] = []
+    anchors: set = set()
+    paragraphs: List[str] = []
+    code: List[str] = []
+    current: List[str] = []
+    fence = None
+
+    def flush():
+        if current:
+            paragraphs.append(" ".join(current))
+            current.clear()
+
+    for line in content.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(
+                fence_match.group(1)
+            ) >= len(fence):
+                fence = None
+            else:
+                code.append(line)
+            continue
+        if fence_match:
+            flush()
+            fence = fence_match.group(1)
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            flush()
+            title = _strip_inline(heading.group(2)).strip()
+            # Same slug rules as the markdown toc extension, so anchors match
+            anchor = unique(slugify(title, "-"), anchors)
+            toc.append(TocEntry(level=len(heading.group(1)), title=title, anchor=anchor))
+            continue
+
+        if not line.strip():
+            flush()
+            continue
+
+        current.append(_strip_inline(BLOCK_PREFIX_RE.sub("", line, count=1)).strip())
+
+    flush()
+    return toc, paragraphs, code
+
+
+def _truncate(text: str, length: int) -> str:
+    """Truncate text at a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0].rstrip(" ,;:.")
+    return f"{cut}…"
+
+
+def compute_derived_fields(content: str) -> DerivedFields:
+    """Compute excerpt, word count, reading time and TOC from markdown."""
+    toc, paragraphs, code = _split_blocks(content)
+
+    prose = [" ".join(paragraph.split()) for paragraph in paragraphs]
+    word_count = sum(len(WORD_RE.findall(text)) for text in prose) + sum(
+        len(WORD_RE.findall(line)) for line in code
+    )
+    excerpt = next((text for text in prose if text), "")
+
+    return DerivedFields(
+        excerpt=_truncate(excerpt, EXCERPT_LENGTH),
+        word_count=word_count,
+        reading_time=math.ceil(word_count / WORDS_PER_MINUTE) if word_count else 0,
+        toc=toc,
+    )
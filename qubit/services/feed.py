@@ -4,6 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 from loguru import logger
 
+from qubit.models.changes import ChangeSet
 from qubit.models.feed import FeedEntry, FeedEntryCreate
 from qubit.database.feed import FeedDB
 
@@ -38,6 +39,15 @@ class FeedService:
             logger.error(f"Error fetching feed posts: {e}")
             return []
 
+    async def get_changes(self, since: int, limit: int = 100) -> ChangeSet:
+        """Get feed posts changed or deleted after a cursor."""
+        changed, tombstones = await self.db.get_changes_since(since, limit)
+        return ChangeSet.merge(since, changed, tombstones, limit)
+
+    async def get_cursor(self) -> Optional[int]:
+        """Get the cursor for the feed as it is now."""
+        return await self.db.get_cursor()
+
     async def delete_post(self, post_id: UUID) -> bool:
         """Delete a feed post."""
         try:
@@ -1,21 +1,68 @@
 """Post service."""
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
-import markdown
 from loguru import logger
 
-from qubit.models.post import PostCreate, PostEntry
+from qubit.models.changes import ChangeSet
+from qubit.models.post import (
+    DerivedFields,
+    PostCreate,
+    PostEntry,
+    PostSummary,
+    SearchPage,
+    Suggestion,
+)
 from qubit.database.posts import PostsDB
+from qubit.search import get_search_backend
+from qubit.services.derived import compute_derived_fields
+from qubit.services.related import RelatedPostsService
+from qubit.services.render import MarkdownRenderer
 from qubit.core.common import slugify
 
 
+def group_by_year(
+    posts: List[Union[PostEntry, PostSummary]]
+) -> Dict[str, List[Union[PostEntry, PostSummary]]]:
+    """Group posts by the year they were created, keeping their order."""
+    years: Dict[str, List[Union[PostEntry, PostSummary]]] = {}
+    for post in posts:
+        years.setdefault(post.created_at.strftime("%Y"), []).append(post)
+    return years
+
+
+def year_index(posts: List[Union[PostEntry, PostSummary]]) -> Dict[str, List[int]]:
+    """Map each year to the positions of its posts, so payloads list each post once."""
+    years: Dict[str, List[int]] = {}
+    for index, post in enumerate(posts):
+        years.setdefault(post.created_at.strftime("%Y"), []).append(index)
+    return years
+
+
 class PostService:
     """Post service."""
 
-    def __init__(self, db: PostsDB):
+    def __init__(self, db: PostsDB, renderer: Optional[MarkdownRenderer] = None):
         self.db = db
-        self.md = markdown.Markdown(extensions=["fenced_code", "tables"])
+        self.renderer = renderer or MarkdownRenderer.get_instance()
+
+    async def _prepare_content(self, content: str) -> Tuple[str, DerivedFields]:
+        """Render HTML and compute derived fields for post content."""
+        content_html, derived = await asyncio.gather(
+            self.renderer.render(content),
+            asyncio.to_thread(compute_derived_fields, content),
+        )
+        return content_html, derived
+
+    async def _update_related(self, post: Optional[PostEntry]) -> None:
+        """Embed a saved post; a failure here must not fail the save."""
+        if post is None:
+            return
+        try:
+            await RelatedPostsService(self.db).update_post(post)
+        except Exception as e:
+            logger.error(f"Error updating related posts: id={post.id} error={e}")
 
     async def bulk_delete_posts(self, post_ids: List[UUID]) -> bool:
         """Delete multiple posts."""
@@ -28,12 +75,14 @@ class PostService:
         """Create a new post."""
         logger.info(f"Creating post: title={post.title} author_id={author_id}")
         try:
-            content_html = self.md.convert(post.content)
+            content_html, derived = await self._prepare_content(post.content)
 
             if not post.slug:
                 post.slug = slugify(post.title)
 
-            return await self.db.create_post(post, author_id, content_html)
+            created = await self.db.create_post(post, author_id, content_html, derived)
+            await self._update_related(created)
+            return created
         except Exception as e:
             logger.error(f"Error creating post: {e}")
             raise
@@ -51,33 +100,88 @@ class PostService:
         )
         return await self.db.get_posts(limit, offset, published_only, author_id)
 
+    async def get_changes(self, since: int, limit: int = 100) -> ChangeSet:
+        """Get published posts changed or removed after a cursor."""
+        changed, tombstones = await self.db.get_changes_since(since, limit)
+        return ChangeSet.merge(since, changed, tombstones, limit)
+
+    async def get_cursor(self) -> Optional[int]:
+        """Get the cursor for the published posts as they are now."""
+        return await self.db.get_cursor()
+
+    async def get_post_summaries(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        published_only: bool = True,
+        author_id: Optional[int] = None,
+    ) -> List[PostSummary]:
+        """Get post summaries with pagination."""
+        logger.info(
+            f"Getting post summaries: limit={limit} offset={offset} published_only={published_only} author_id={author_id}"
+        )
+        return await self.db.get_post_summaries(limit, offset, published_only, author_id)
+
     async def get_post(self, slug: str) -> Optional[PostEntry]:
         """Get post by slug."""
         logger.info(f"Getting post by slug: slug={slug}")
-        return await self.db.get_post_by_slug(slug)
+        return await self.db.load_post_by_slug(slug)
+
+    async def get_posts_by_ids(self, post_ids: List[UUID]) -> List[PostEntry]:
+        """Get many posts by ID."""
+        logger.info(f"Getting posts by IDs: count={len(post_ids)}")
+        return await self.db.get_posts_by_ids(post_ids)
+
+    async def get_posts_by_slugs(self, slugs: List[str]) -> List[PostEntry]:
+        """Get many posts by slug."""
+        logger.info(f"Getting posts by slugs: count={len(slugs)}")
+        return await self.db.get_posts_by_slugs(slugs)
 
     async def search_posts(
-        self, query: str, limit: int = 10, offset: int = 0
-    ) -> tuple[List[PostEntry], int]:
-        """Search posts."""
-        logger.info(f"Searching posts: query={query} limit={limit} offset={offset}")
-        return await self.db.search_posts(query, limit=limit, offset=offset)
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        tags: Sequence[str] = (),
+    ) -> SearchPage:
+        """Search posts, optionally narrowed to posts carrying every tag."""
+        logger.info(
+            f"Searching posts: query={query} tags={list(tags)} "
+            f"limit={limit} offset={offset}"
+        )
+        backend = get_search_backend(self.db)
+        return await backend.search(query, limit=limit, offset=offset, tags=tags)
+
+    async def suggest_posts(self, prefix: str, limit: int = 5) -> List[Suggestion]:
+        """Suggest post titles for a partly typed search."""
+        return await self.db.suggest_posts(prefix, limit=limit)
 
     async def update_post(self, post_id: UUID, post: PostCreate) -> Optional[PostEntry]:
         """Update an existing post."""
-        content_html = self.md.convert(post.content)
+        content_html, derived = await self._prepare_content(post.content)
 
         logger.info(
             f"Updating post: id={post_id} title={post.title} published={post.published}"
         )
-        return await self.db.update_post(post_id, post, content_html)
+        updated = await self.db.update_post(post_id, post, content_html, derived)
+        await self._update_related(updated)
+        return updated
 
     async def delete_post(self, post_id: UUID) -> bool:
         """Delete a post."""
         logger.info(f"Deleting post: id={post_id}")
         return await self.db.delete_post(post_id)
 
+    async def get_related_posts(self, post: PostEntry) -> List[PostSummary]:
+        """Get summaries of published posts related to a post."""
+        if not post.published:
+            return []
+        return await RelatedPostsService(self.db).get_related(post.id)
+
     async def get_post_by_id(self, post_id: str) -> Optional[PostEntry]:
         """Get post by ID."""
         logger.info(f"Getting post by ID: id={post_id}")
-        return await self.db.get_post_by_id(post_id)
+        try:
+            return await self.db.load_post_by_id(post_id)
+        except ValueError:
+            return None
@@ -0,0 +1,111 @@
+"""Live preview service."""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from qubit.core.cache import LRUCache
+from qubit.services.render import MarkdownRenderer
+
+
+BLOCK_CACHE_SIZE = 4096
+
+FENCE_RE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+# Definitions that other blocks can refer to; these force a whole-document render
+REFERENCE_RE = re.compile(r"^\s{0,3}\[\^?[^\]]+\]:", re.MULTILINE)
+
+
+def split_blocks(content: str) -> List[str]:
+    """Split markdown into top-level blocks that render independently.
+
+    Blocks are separated by blank lines, except inside fenced code and where
+    the next chunk is indented (list continuations and indented code).
+    """
+    blocks: List[str] = []
+    current: List[str] = []
+    fence: Optional[str] = None
+    blank_seen = False
+
+    for line in content.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            current.append(line)
+            if fence_match and fence_match.group(1).startswith(fence):
+                fence = None
+            continue
+
+        if not line.strip():
+            blank_seen = True
+            if current:
+                current.append(line)
+            continue
+
+        if blank_seen and current and not line[0].isspace():
+            blocks.append("\n".join(current).rstrip("\n"))
+            current = []
+        blank_seen = False
+
+        if fence_match:
+            fence = fence_match.group(1)
+        current.append(line)
+
+    if current:
+        blocks.append("\n".join(current).rstrip("\n"))
+    return blocks
+
+
+class PreviewService:
+    """Render editor previews block by block, re-rendering only changed blocks."""
+
+    _blocks = LRUCache(BLOCK_CACHE_SIZE)
+
+    def __init__(self, renderer: Optional[MarkdownRenderer] = None):
+        """Initialize preview service."""
+        self.renderer = renderer or MarkdownRenderer.get_instance()
+
+    async def preview(self, content: str, known: Iterable[str] = ()) -> Dict:
+        """Render a draft and return a patch against the client's known blocks.
+
+        The result lists the block hashes in document order, plus HTML only
+        for blocks the client does not already hold.
+        """
+        self.renderer.check_size(content)
+
+        if REFERENCE_RE.search(content):
+            blocks = [content]
+        else:
+            blocks = split_blocks(content)
+
+        hashes = [self.renderer.cache_key(block) for block in blocks]
+        # The shared cache may evict while rendering awaits, so the patch is
+        # built from this local copy and the cache is only written to
+        block_html: Dict[str, str] = {}
+        missing = {}
+        for block_hash, block in zip(hashes, blocks):
+            if block_hash in block_html or block_hash in missing:
+                continue
+            cached = self._blocks.get(block_hash)
+            if cached is None:
+                missing[block_hash] = block
+            else:
+                block_html[block_hash] = cached
+
+        if missing:
+            rendered = await self.renderer.render_blocks(list(missing.values()))
+            for block_hash, html in zip(missing, rendered):
+                block_html[block_hash] = html
+                self._blocks.set(block_hash, html)
+
+        logger.debug(
+            f"Preview rendered: blocks={len(blocks)} rendered={len(missing)}"
+        )
+
+        known = set(known)
+        html = {
+            block_hash: block_html[block_hash]
+            for block_hash in hashes
+            if block_hash not in known
+        }
+
+        return {"blocks": hashes, "html": html, "rendered": len(missing)}
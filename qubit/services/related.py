@@ -0,0 +1,269 @@
+"""Related posts service."""
+
+import asyncio
+import zlib
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+
+from qubit.core.cache import RedisCache
+from qubit.core.page_cache import PageCache
+from qubit.core.versions import ContentVersions
+from qubit.database.changes import ChangeEvent
+from qubit.database.posts import PostsDB
+from qubit.database.related import RelatedDB
+from qubit.models.post import PostEntry, PostSummary
+from qubit.search.bm25 import tokenize
+
+
+# Words are hashed into this many TF-IDF features, then projected down
+HASH_FEATURES = 1 << 12
+EMBEDDING_DIMS = 64
+RELATED_LIMIT = 5
+# Rows of the similarity matrix computed at once in a batch recompute
+SIMILARITY_BLOCK = 1024
+
+RELATED_PREFIX = "posts:related_summaries:"
+RELATED_CACHE_TTL = 3600
+
+
+def document_text(title: str, content: str, tags: Sequence[str]) -> str:
+    """Text a post is embedded from."""
+    return " ".join([title, *tags, content])
+
+
+def term_frequencies(texts: Sequence[str]) -> np.ndarray:
+    """Sublinear term frequencies of each text over hashed word features."""
+    matrix = np.zeros((len(texts), HASH_FEATURES), dtype=np.float32)
+    for row, text in enumerate(texts):
+        # crc32 rather than hash(), which changes between processes
+        buckets = np.fromiter(
+            (zlib.crc32(word.encode("utf-8")) for word in tokenize(text)),
+            dtype=np.int64,
+        )
+        features, counts = np.unique(buckets % HASH_FEATURES, return_counts=True)
+        matrix[row, features] = 1 + np.log(counts)
+    return matrix
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving empty rows at zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def svd_components(matrix: np.ndarray, rank: int) -> np.ndarray:
+    """Top right singular vectors, by randomized SVD once the matrix is large.
+
+    A full SVD of the corpus matrix costs O(posts^2 * features); sketching it
+    onto a few more random directions than needed costs O(posts * features *
+    rank) and loses nothing visible in the leading components.
+    """
+    sketch = rank + 10
+    if min(matrix.shape) <= sketch:
+        return np.linalg.svd(matrix, full_matrices=False)[2][:rank]
+
+    # Fixed seed, so refitting the same corpus gives the same embeddings
+    rng = np.random.default_rng(0)
+    basis = matrix @ rng.standard_normal((matrix.shape[1], sketch), dtype=np.float32)
+    for _ in range(2):
+        basis, _ = np.linalg.qr(matrix @ (matrix.T @ basis))
+    basis, _ = np.linalg.qr(basis)
+    return np.linalg.svd(basis.T @ matrix, full_matrices=False)[2][:rank]
+
+
+def nearest_neighbors(embeddings: np.ndarray, limit: int) -> List[List[int]]:
+    """Indices of each row's most similar other rows, closest first."""
+    count = len(embeddings)
+    limit = min(limit, count - 1)
+    if limit <= 0:
+        return [[] for _ in range(count)]
+
+    neighbors: List[List[int]] = []
+    for start in range(0, count, SIMILARITY_BLOCK):
+        similarity = embeddings[start : start + SIMILARITY_BLOCK] @ embeddings.T
+        rows = np.arange(len(similarity))
+        similarity[rows, rows + start] = -np.inf
+        top = np.argpartition(-similarity, limit - 1, axis=1)[:, :limit]
+        order = np.argsort(-similarity[rows[:, None], top], axis=1)
+        neighbors.extend(np.take_along_axis(top, order, axis=1).tolist())
+    return neighbors
+
+
+class EmbeddingModel:
+    """TF-IDF weights and a truncated SVD projection fitted on the published posts.
+
+    Embeddings are the unit-length projection of each post's hashed TF-IDF
+    vector (latent semantic analysis), computed locally with NumPy.
+    """
+
+    def __init__(self, idf: np.ndarray, components: np.ndarray):
+        """Initialize model from fitted arrays."""
+        self.idf = idf
+        self.components = components
+
+    @classmethod
+    def fit(cls, texts: Sequence[str]) -> "EmbeddingModel":
+        """Fit IDF weights and SVD components on a corpus."""
+        frequencies = term_frequencies(texts)
+        document_frequency = np.count_nonzero(frequencies, axis=0)
+        idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+        tfidf = normalize(frequencies * idf.astype(np.float32))
+
+        vt = svd_components(tfidf, EMBEDDING_DIMS)
+        # Small corpora have fewer components than dimensions; pad with zeros
+        components = np.zeros((EMBEDDING_DIMS, HASH_FEATURES), dtype=np.float32)
+        components[: len(vt)] = vt
+        return cls(idf.astype(np.float32), components)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Unit-length embeddings of texts."""
+        tfidf = normalize(term_frequencies(texts) * self.idf)
+        return normalize(tfidf @ self.components.T)
+
+    def to_bytes(self) -> Tuple[bytes, bytes]:
+        """Serialize for storage."""
+        return self.idf.tobytes(), self.components.tobytes()
+
+    @classmethod
+    def from_bytes(cls, idf: bytes, components: bytes) -> Optional["EmbeddingModel"]:
+        """Load a stored model, or None if it was fitted with other dimensions."""
+        idf_array = np.frombuffer(idf, dtype=np.float32)
+        component_array = np.frombuffer(components, dtype=np.float32)
+        if (
+            idf_array.size != HASH_FEATURES
+            or component_array.size != EMBEDDING_DIMS * HASH_FEATURES
+        ):
+            return None
+        return cls(idf_array, component_array.reshape(EMBEDDING_DIMS, HASH_FEATURES))
+
+
+def fit_corpus(
+    texts: Sequence[str],
+) -> Tuple[EmbeddingModel, np.ndarray, List[List[int]]]:
+    """Fit a model, embed every text and find each one's nearest neighbors."""
+    model = EmbeddingModel.fit(texts)
+    embeddings = model.embed(texts)
+    return model, embeddings, nearest_neighbors(embeddings, RELATED_LIMIT)
+
+
+class RelatedPostsService:
+    """Related posts from local text embeddings stored with pgvector.
+
+    Saving a post embeds it with the stored model and asks the HNSW index
+    for its neighbors, whose lists are refreshed too. A batch recompute
+    refits the model on every published post and rebuilds all lists at once;
+    until a model is stored, a save starts that in the background instead.
+    """
+
+    # First fit started by a save in this worker, while no model is stored
+    _fitting: Optional[asyncio.Task] = None
+
+    def __init__(self, db: PostsDB, related_db: Optional[RelatedDB] = None):
+        """Initialize related posts service."""
+        self.db = db
+        self.related_db = related_db or RelatedDB(db.config)
+        self._cache = RedisCache.get_instance()
+
+    async def _invalidate(self, post_ids: Sequence[UUID]) -> None:
+        """Drop cached related lists and the post pages that render them.
+
+        Embedding writes don't go through the change stream, so the pages'
+        versions and cached copies are moved here.
+        """
+        if not post_ids:
+            return
+        for post_id in post_ids:
+            await self._cache.delete(f"{RELATED_PREFIX}{post_id}")
+        await ContentVersions.get_instance().bump(
+            "posts", {"id": [str(post_id) for post_id in post_ids]}
+        )
+        await PageCache.get_instance().purge(
+            [f"post:{post_id}" for post_id in post_ids]
+        )
+
+    async def handle_change(self, event: ChangeEvent) -> None:
+        """Refresh pages listing a post that changed anywhere in the database."""
+        await self._invalidate(await self.related_db.get_referrers(UUID(event.id)))
+
+    async def update_post(self, post: PostEntry) -> None:
+        """Embed a saved post and refresh the related posts around it."""
+        if not post.published:
+            return
+        stored = await self.related_db.get_model()
+        model = EmbeddingModel.from_bytes(*stored) if stored else None
+        if model is None:
+            # Fitting reads every post; it embeds this one too, so the save
+            # doesn't wait for it
+            self._start_first_fit()
+            return
+
+        text = document_text(post.title, post.content, post.tags)
+        embedding = (await asyncio.to_thread(model.embed, [text]))[0].tolist()
+        related_ids = await self.related_db.nearest(post.id, embedding, RELATED_LIMIT)
+        await self.related_db.save_embedding(post.id, embedding, related_ids)
+
+        # This post may now belong in its neighbors' lists
+        updates = []
+        for neighbor_id, neighbor in await self.related_db.get_embeddings(related_ids):
+            nearest = await self.related_db.nearest(
+                neighbor_id, neighbor, RELATED_LIMIT
+            )
+            updates.append((neighbor_id, nearest))
+        await self.related_db.save_related(updates)
+        await self._invalidate([post.id, *related_ids])
+
+    def _start_first_fit(self) -> None:
+        """Fit the model in the background, once per worker at a time."""
+        cls = type(self)
+        if cls._fitting is not None and not cls._fitting.done():
+            return
+        logger.info("No related posts model yet; fitting in the background")
+        cls._fitting = asyncio.create_task(self._first_fit())
+
+    async def _first_fit(self) -> None:
+        """Recompute, logging rather than raising from a background task."""
+        try:
+            await self.recompute()
+        except Exception as e:
+            logger.error(f"Error fitting related posts model: {e}")
+
+    async def recompute(self) -> int:
+        """Refit the model and rebuild every embedding and related list."""
+        corpus = await self.related_db.get_corpus()
+        if not corpus:
+            return 0
+
+        texts = [
+            document_text(title, content, tags) for _, title, content, tags in corpus
+        ]
+        model, embeddings, neighbors = await asyncio.to_thread(fit_corpus, texts)
+        ids = [post_id for post_id, _, _, _ in corpus]
+        rows = [
+            (post_id, embedding, [ids[i] for i in nearest])
+            for post_id, embedding, nearest in zip(ids, embeddings.tolist(), neighbors)
+        ]
+        if await self.related_db.replace_all(*model.to_bytes(), rows):
+            await self._invalidate(ids)
+        logger.info(f"Recomputed related posts: posts={len(rows)}")
+        return len(rows)
+
+    async def get_related(
+        self, post_id: UUID, limit: int = RELATED_LIMIT
+    ) -> List[PostSummary]:
+        """Summaries of published posts related to a post, closest first.
+
+        The cached list goes stale with any of its posts; ``handle_change``
+        drops it through the referrers of a changed post.
+        """
+        key = f"{RELATED_PREFIX}{post_id}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return [PostSummary.model_validate(summary) for summary in cached][:limit]
+
+        related_ids = await self.related_db.get_related_ids(post_id)
+        summaries = await self.db.get_summaries_by_ids(related_ids)
+        await self._cache.set(key, summaries, RELATED_CACHE_TTL)
+        return summaries[:limit]
@@ -0,0 +1,210 @@
+"""Markdown rendering service."""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import List, Optional
+
+import markdown
+import pygments
+from loguru import logger
+from pygments.formatters import HtmlFormatter
+
+from qubit.core.cache import LRUCache, RedisCache
+from qubit.models.config import RenderConfig
+
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "codehilite", "tables", "toc"]
+MARKDOWN_EXTENSION_CONFIGS: dict = {
+    # Emit CSS classes rather than inline styles so one stylesheet serves all posts
+    "codehilite": {"css_class": "highlight", "guess_lang": False, "noclasses": False},
+}
+HIGHLIGHT_CSS_CLASS = "highlight"
+
+# Bump when output changes in a way the extension settings don't capture
+RENDERER_VERSION = "1"
+
+# One renderer per worker process, reused across conversions
+_renderer: Optional[markdown.Markdown] = None
+
+
+def _init_worker() -> None:
+    """Build the worker's markdown renderer."""
+    global _renderer
+    _renderer = markdown.Markdown(
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+    )
+
+
+def _convert(text: str) -> str:
+    """Convert markdown to HTML, resetting renderer state between documents."""
+    if _renderer is None:
+        _init_worker()
+    return _renderer.reset().convert(text)
+
+
+def _convert_many(texts: List[str]) -> List[str]:
+    """Convert several markdown documents in one worker round trip."""
+    return [_convert(text) for text in texts]
+
+
+def renderer_fingerprint() -> str:
+    """Identify the renderer configuration that cached HTML was produced with."""
+    spec = json.dumps(
+        {
+            "version": RENDERER_VERSION,
+            "markdown": markdown.__version__,
+            "pygments": pygments.__version__,
+            "extensions": MARKDOWN_EXTENSIONS,
+            "configs": MARKDOWN_EXTENSION_CONFIGS,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()[:16]
+
+
+RENDERER_FINGERPRINT = renderer_fingerprint()
+
+
+@lru_cache(maxsize=8)
+def highlight_stylesheet(style: str) -> str:
+    """CSS for highlighted code blocks in the given Pygments style."""
+    return HtmlFormatter(style=style).get_style_defs(f".{HIGHLIGHT_CSS_CLASS}")
+
+
+@lru_cache(maxsize=8)
+def highlight_stylesheet_url(style: str) -> str:
+    """Versioned URL for the highlight stylesheet, safe to cache forever."""
+    digest = hashlib.sha256(highlight_stylesheet(style).encode("utf-8")).hexdigest()
+    return f"/assets/highlight.css?v={digest[:12]}"
+
+
+class RenderError(ValueError):
+    """Markdown could not be rendered."""
+
+
+class MarkdownRenderer:
+    """Render markdown off the event loop in a shared process pool.
+
+    Output is cached by a hash of the content and the renderer fingerprint,
+    in a local LRU backed by Redis, so unchanged content is never re-rendered.
+    """
+
+    _instance: Optional["MarkdownRenderer"] = None
+
+    def __init__(self, config: Optional[RenderConfig] = None):
+        """Initialize renderer configuration."""
+        self.config = config or RenderConfig()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Bounds in-flight conversions so timeouts measure work, not queueing
+        self._slots = asyncio.Semaphore(self.config.max_workers)
+        self._local = LRUCache(self.config.local_cache_size)
+        self._redis = RedisCache.get_instance()
+
+    @classmethod
+    def get_instance(cls, config: Optional[RenderConfig] = None) -> "MarkdownRenderer":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Replace ``executor``, terminating workers stuck on a conversion.
+
+        Does nothing if the pool was already replaced, so renders that fail
+        because another request recycled their pool don't tear down its
+        replacement as well.
+        """
+        if executor is not self._executor:
+            return
+        self._executor = None
+        # ProcessPoolExecutor offers no way to abort a running task
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def check_size(self, text: str) -> None:
+        """Reject content over the configured size cap."""
+        size = len(text.encode("utf-8"))
+        if size > self.config.max_content_bytes:
+            raise RenderError(
+                f"Content is {size} bytes; the limit is {self.config.max_content_bytes}"
+            )
+
+    @staticmethod
+    def cache_key(text: str) -> str:
+        """Cache key for the HTML of a markdown document."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"render:{RENDERER_FINGERPRINT}:{digest}"
+
+    async def render(self, text: str) -> str:
+        """Render markdown to HTML, reusing cached output for unchanged content."""
+        self.check_size(text)
+
+        key = self.cache_key(text)
+        html = self._local.get(key)
+        if html is not None:
+            return html
+
+        html = await self._redis.get(key)
+        if html is None:
+            html = await self._render_in_pool(text)
+            await self._redis.set(key, html, ttl=self.config.cache_ttl_seconds)
+
+        self._local.set(key, html)
+        return html
+
+    async def render_blocks(self, blocks: List[str]) -> List[str]:
+        """Render independent markdown fragments in a single pool task, uncached."""
+        if not blocks:
+            return []
+        return await self._render_in_pool(blocks)
+
+    async def _render_in_pool(self, text):
+        """Render markdown (one document or a list of them) in the process pool."""
+        convert = _convert_many if isinstance(text, list) else _convert
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            for attempt in range(2):
+                executor = self._get_executor()
+                future = loop.run_in_executor(executor, convert, text)
+                try:
+                    return await asyncio.wait_for(
+                        future, timeout=self.config.timeout_seconds
+                    )
+                except asyncio.TimeoutError as e:
+                    logger.error(
+                        "Markdown rendering timed out after "
+                        f"{self.config.timeout_seconds}s"
+                    )
+                    self._recycle(executor)
+                    raise RenderError("Rendering timed out") from e
+                except BrokenProcessPool as e:
+                    if executor is not self._executor and attempt == 0:
+                        # Another request recycled the pool; not this content's fault
+                        continue
+                    logger.error(f"Markdown render pool failed: {e}")
+                    self._recycle(executor)
+                    raise RenderError("Rendering failed") from e
+
+    def shutdown(self) -> None:
+        """Stop the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
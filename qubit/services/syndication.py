@@ -0,0 +1,282 @@
+"""Syndication feeds and sitemap."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+import orjson
+from pydantic import BaseModel
+
+from qubit.core.cache import LRUCache
+from qubit.models.config import AuthorConfig
+from qubit.models.feed import FeedEntry
+from qubit.models.post import PostSummary
+
+# File name in the URL -> feed format
+FEED_FORMATS = {"rss.xml": "rss", "atom.xml": "atom", "feed.json": "json"}
+
+MEDIA_TYPES = {
+    "rss": "application/rss+xml; charset=utf-8",
+    "atom": "application/atom+xml; charset=utf-8",
+    "json": "application/feed+json; charset=utf-8",
+    "sitemap": "application/xml; charset=utf-8",
+}
+
+FEED_LIMIT = 50
+TITLE_LENGTH = 80
+
+
+class FeedItem(BaseModel):
+    """One entry of a syndication feed."""
+
+    id: str
+    url: str
+    title: str
+    summary: str = ""
+    content_text: Optional[str] = None
+    published: datetime
+    updated: datetime
+    tags: List[str] = []
+
+
+def _utc(value: datetime) -> datetime:
+    """Treat naive database timestamps as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _iso(value: datetime) -> str:
+    """RFC 3339 timestamp, as Atom, JSON Feed and sitemaps expect."""
+    return _utc(value).isoformat(timespec="seconds")
+
+
+class SyndicationService:
+    """Render RSS, Atom and JSON feeds plus the sitemap.
+
+    Each entry is rendered to a fragment once per ``updated_at`` and kept in
+    process, so regenerating a feed after one post changes only renders that
+    post; the rest is string concatenation.
+    """
+
+    _fragments = LRUCache(maxsize=4096)
+
+    def __init__(self, author: AuthorConfig, base_url: str):
+        """Initialize with the site author and absolute base URL."""
+        self.author = author
+        self.base_url = base_url.rstrip("/")
+
+    def url(self, path: str) -> str:
+        """Absolute URL of a site path."""
+        return f"{self.base_url}{path}"
+
+    def post_items(self, posts: Iterable[PostSummary]) -> List[FeedItem]:
+        """Feed items for published post summaries."""
+        return [
+            FeedItem(
+                id=str(post.id),
+                url=self.url(f"/posts/{post.id}"),
+                title=post.title,
+                summary=post.excerpt,
+                published=post.published_at or post.created_at,
+                updated=post.updated_at,
+                tags=[tag for tag in post.tags if tag],
+            )
+            for post in posts
+        ]
+
+    def microblog_items(self, entries: Iterable[FeedEntry]) -> List[FeedItem]:
+        """Feed items for microblog posts, which are short enough to carry whole."""
+        items = []
+        for entry in entries:
+            first_line = next(iter(entry.content.strip().splitlines()), "")
+            title = first_line[:TITLE_LENGTH]
+            if len(first_line) > TITLE_LENGTH:
+                title = title.rstrip() + "…"
+            items.append(
+                FeedItem(
+                    id=str(entry.id),
+                    url=self.url(f"/feed#{entry.id}"),
+                    title=title,
+                    content_text=entry.content,
+                    published=entry.created_at,
+                    updated=entry.updated_at,
+                )
+            )
+        return items
+
+    def _fragment(
+        self, kind: str, key: str, updated: datetime, render: Callable
+    ) -> str:
+        """Render a fragment, reusing it until its source changes."""
+        cache_key = f"{kind}:{self.base_url}:{key}:{updated.isoformat()}"
+        fragment = self._fragments.get(cache_key)
+        if fragment is None:
+            fragment = render()
+            self._fragments.set(cache_key, fragment)
+        return fragment
+
+    def render(
+        self, fmt: str, title: str, path: str, feed_path: str, items: List[FeedItem]
+    ) -> bytes:
+        """Render a feed in one of ``FEED_FORMATS``."""
+        renderer = {"rss": self._rss, "atom": self._atom, "json": self._json}[fmt]
+        return renderer(title, self.url(path), self.url(feed_path), items)
+
+    def _rss(
+        self, title: str, home: str, feed_url: str, items: List[FeedItem]
+    ) -> bytes:
+        """RSS 2.0 document."""
+        entries = "".join(
+            self._fragment(
+                "rss", item.id, item.updated, lambda item=item: self._rss_item(item)
+            )
+            for item in items
+        )
+        updated = max(
+            (item.updated for item in items), default=datetime.now(timezone.utc)
+        )
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">'
+            "<channel>"
+            f"<title>{escape(title)}</title>"
+            f"<link>{escape(home)}</link>"
+            f"<description>{escape(self.author.bio.strip())}</description>"
+            f"<atom:link href={quoteattr(feed_url)} "
+            'rel="self" type="application/rss+xml"/>'
+            f"<lastBuildDate>{format_datetime(_utc(updated))}</lastBuildDate>"
+            f"{entries}"
+            "</channel></rss>\n"
+        ).encode("utf-8")
+
+    @staticmethod
+    def _rss_item(item: FeedItem) -> str:
+        """RSS <item> for one entry."""
+        categories = "".join(f"<category>{escape(tag)}</category>" for tag in item.tags)
+        return (
+            "<item>"
+            f"<title>{escape(item.title)}</title>"
+            f"<link>{escape(item.url)}</link>"
+            f'<guid isPermaLink="false">{escape(item.id)}</guid>'
+            f"<pubDate>{format_datetime(_utc(item.published))}</pubDate>"
+            f"<description>{escape(item.content_text or item.summary)}</description>"
+            f"{categories}"
+            "</item>"
+        )
+
+    def _atom(
+        self, title: str, home: str, feed_url: str, items: List[FeedItem]
+    ) -> bytes:
+        """Atom 1.0 document."""
+        entries = "".join(
+            self._fragment(
+                "atom", item.id, item.updated, lambda item=item: self._atom_entry(item)
+            )
+            for item in items
+        )
+        updated = max(
+            (item.updated for item in items), default=datetime.now(timezone.utc)
+        )
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<id>{escape(feed_url)}</id>"
+            f"<title>{escape(title)}</title>"
+            f"<updated>{_iso(updated)}</updated>"
+            f"<link href={quoteattr(home)}/>"
+            f'<link href={quoteattr(feed_url)} rel="self"/>'
+            f"<author><name>{escape(self.author.name)}</name>"
+            f"<uri>{escape(self.author.website)}</uri></author>"
+            f"{entries}"
+            "</feed>\n"
+        ).encode("utf-8")
+
+    @staticmethod
+    def _atom_entry(item: FeedItem) -> str:
+        """Atom <entry> for one item."""
+        categories = "".join(f"<category term={quoteattr(tag)}/>" for tag in item.tags)
+        body = (
+            f'<content type="text">{escape(item.content_text)}</content>'
+            if item.content_text is not None
+            else f'<summary type="text">{escape(item.summary)}</summary>'
+        )
+        return (
+            "<entry>"
+            f"<id>urn:uuid:{escape(item.id)}</id>"
+            f"<title>{escape(item.title)}</title>"
+            f"<link href={quoteattr(item.url)}/>"
+            f"<published>{_iso(item.published)}</published>"
+            f"<updated>{_iso(item.updated)}</updated>"
+            f"{categories}{body}"
+            "</entry>"
+        )
+
+    def _json(
+        self, title: str, home: str, feed_url: str, items: List[FeedItem]
+    ) -> bytes:
+        """JSON Feed 1.1 document."""
+        entries = b",".join(
+            self._fragment(
+                "json", item.id, item.updated, lambda item=item: self._json_item(item)
+            )
+            for item in items
+        )
+        header = orjson.dumps(
+            {
+                "version": "https://jsonfeed.org/version/1.1",
+                "title": title,
+                "home_page_url": home,
+                "feed_url": feed_url,
+                "authors": [{"name": self.author.name, "url": self.author.website}],
+            }
+        )
+        # Splice the cached item fragments into the top-level object
+        return header[:-1] + b',"items":[' + entries + b"]}"
+
+    @staticmethod
+    def _json_item(item: FeedItem) -> bytes:
+        """JSON Feed item for one entry."""
+        data: Dict[str, object] = {
+            "id": item.id,
+            "url": item.url,
+            "title": item.title,
+            "date_published": _iso(item.published),
+            "date_modified": _iso(item.updated),
+        }
+        if item.content_text is not None:
+            data["content_text"] = item.content_text
+        else:
+            data["summary"] = item.summary
+            data["content_text"] = item.summary
+        if item.tags:
+            data["tags"] = item.tags
+        return orjson.dumps(data)
+
+    def sitemap(self, pages: List[str], posts: List[dict]) -> bytes:
+        """Sitemap of the static pages and every published post."""
+        urls = "".join(
+            f"<url><loc>{escape(self.url(path))}</loc></url>" for path in pages
+        )
+        urls += "".join(
+            self._fragment(
+                "sitemap",
+                str(post["id"]),
+                post["updated_at"],
+                lambda post=post: self._sitemap_url(post),
+            )
+            for post in posts
+        )
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"{urls}"
+            "</urlset>\n"
+        ).encode("utf-8")
+
+    def _sitemap_url(self, post: dict) -> str:
+        """Sitemap <url> for one post."""
+        loc = self.url(f"/posts/{post['id']}")
+        return (
+            f"<url><loc>{escape(loc)}</loc>"
+            f"<lastmod>{_iso(post['updated_at'])}</lastmod></url>"
+        )
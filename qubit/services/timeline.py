@@ -0,0 +1,205 @@
+"""Timeline service."""
+
+import asyncio
+import base64
+import heapq
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from loguru import logger
+
+from qubit.core.cache import RedisCache
+from qubit.core.versions import ContentVersions
+from qubit.database.feed import FeedDB
+from qubit.database.posts import PostsDB
+
+
+TIMELINE_CACHE_TTL = 300
+
+# Position of a source whose rows have all been returned
+END = "end"
+
+Keyset = Tuple[datetime, UUID]
+Fetch = Callable[[Optional[Keyset], int], Awaitable[List[Any]]]
+
+
+class InvalidCursor(ValueError):
+    """Raised for a timeline cursor this service didn't issue."""
+
+
+def encode_cursor(positions: Dict[str, Any]) -> str:
+    """Opaque cursor holding each source's position."""
+    return base64.urlsafe_b64encode(orjson.dumps(positions)).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Read the positions back out of a cursor."""
+    try:
+        positions = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return {
+            name: (
+                position
+                if position in (None, END)
+                else (datetime.fromisoformat(position[0]), UUID(position[1]))
+            )
+            for name, position in positions.items()
+        }
+    except Exception:
+        raise InvalidCursor(cursor)
+
+
+def _encode_position(position: Any) -> Any:
+    if position in (None, END):
+        return position
+    created_at, item_id = position
+    return [created_at.isoformat(), str(item_id)]
+
+
+class _Source:
+    """One stream of the timeline, read newest first from a keyset position."""
+
+    def __init__(self, name: str, fetch: Fetch, position: Any):
+        self.name = name
+        self.fetch = fetch
+        # Last row handed out, which is where the next page starts
+        self.position = position
+        self.exhausted = position == END
+        self._fetched = None if position == END else position
+        self.buffer: Deque[Any] = deque()
+        self.rows_fetched = 0
+
+    async def fill(self, count: int) -> None:
+        """Fetch the next rows after everything fetched so far."""
+        if self.exhausted or count <= 0:
+            return
+        rows = await self.fetch(self._fetched, count)
+        self.rows_fetched += len(rows)
+        self.buffer.extend(rows)
+        if rows:
+            self._fetched = (rows[-1].created_at, rows[-1].id)
+        if len(rows) < count:
+            self.exhausted = True
+
+    def head_key(self) -> "_Newest":
+        """Heap key of the next row."""
+        row = self.buffer[0]
+        return _Newest((row.created_at, row.id))
+
+    def pop(self) -> Any:
+        """Take the next row."""
+        row = self.buffer.popleft()
+        self.position = (row.created_at, row.id)
+        return row
+
+    @property
+    def done(self) -> bool:
+        """Whether every row has been handed out."""
+        return self.exhausted and not self.buffer
+
+
+class _Newest:
+    """Heap key that pops the newest keyset position first."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Keyset):
+        self.key = key
+
+    def __lt__(self, other: "_Newest") -> bool:
+        return self.key > other.key
+
+
+class TimelineService:
+    """Merge posts and feed posts into one timeline, newest first.
+
+    Each source is read with its own keyset cursor and merged with a heap,
+    so a page reads only the rows it returns plus at most one batch of
+    look-ahead per source, however deep the page.
+    """
+
+    def __init__(self, posts_db: PostsDB, feed_db: FeedDB):
+        """Initialize timeline service."""
+        self.posts_db = posts_db
+        self.feed_db = feed_db
+        self._cache = RedisCache.get_instance()
+
+    def _sources(self, positions: Dict[str, Any]) -> List[_Source]:
+        return [
+            _Source(
+                "posts", self.posts_db.get_summaries_before, positions.get("posts")
+            ),
+            _Source("feed", self.feed_db.get_feed_posts_before, positions.get("feed")),
+        ]
+
+    async def _merge(self, sources: List[_Source], limit: int) -> List[Tuple[str, Any]]:
+        """K-way merge of the sources, fetching in batches as each runs dry."""
+        # Interleaved sources each supply about an even share of the page
+        batch = limit // len(sources) + 1
+        await asyncio.gather(*(source.fill(batch) for source in sources))
+
+        heap = [
+            (source.head_key(), index)
+            for index, source in enumerate(sources)
+            if source.buffer
+        ]
+        heapq.heapify(heap)
+        items: List[Tuple[str, Any]] = []
+        while heap and len(items) < limit:
+            _, index = heapq.heappop(heap)
+            source = sources[index]
+            items.append((source.name, source.pop()))
+            if not source.buffer:
+                # No source needs more than what is left of the page
+                await source.fill(limit - len(items))
+            if source.buffer:
+                heapq.heappush(heap, (source.head_key(), index))
+        return items
+
+    @staticmethod
+    def _item(name: str, row: Any) -> Dict[str, Any]:
+        """Timeline entry for a post summary or feed post."""
+        if name == "posts":
+            data = row.to_dict()
+        else:
+            data = row.model_dump(mode="json")
+        return {"type": name, "timestamp": row.created_at.isoformat(), **data}
+
+    async def get_page(self, limit: int = 20, cursor: Optional[str] = None) -> dict:
+        """Get one page of the timeline and the cursor for the next.
+
+        Pages are cached under the timeline's content version, which any
+        write to posts or feed posts moves, so stale pages are never read.
+        """
+        positions = decode_cursor(cursor) if cursor else {}
+        version = await ContentVersions.get_instance().get("timeline")
+        key = f"timeline:{version}:{limit}:{cursor or ''}"
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        sources = self._sources(positions)
+        items = await self._merge(sources, limit)
+        next_cursor = None
+        if not all(source.done for source in sources):
+            next_cursor = encode_cursor(
+                {
+                    source.name: _encode_position(
+                        END if source.done else source.position
+                    )
+                    for source in sources
+                }
+            )
+        logger.debug(
+            f"Timeline page: limit={limit} returned={len(items)} "
+            + " ".join(f"{s.name}_rows={s.rows_fetched}" for s in sources)
+        )
+
+        page = {
+            "items": [self._item(name, row) for name, row in items],
+            "next": next_cursor,
+        }
+        await self._cache.set(key, page, TIMELINE_CACHE_TTL)
+        return page
@@ -1,14 +1,25 @@
 """Web routes."""
 
+from typing import Optional
+
 from fastapi import Request, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from starlette import status
 from loguru import logger
 
 from qubit.services.auth import AuthService
-from qubit.services.post import PostService
-from qubit.core.common import get_users_db, get_posts_db
+from qubit.services.post import PostService, group_by_year
+from qubit.services.render import highlight_stylesheet
+from qubit.services.syndication import (
+    FEED_FORMATS,
+    FEED_LIMIT,
+    MEDIA_TYPES,
+    SyndicationService,
+)
+from qubit.core.common import get_users_db, get_posts_db, get_feed_db
 from qubit.core.dependencies import get_current_user
+from qubit.core.page_cache import PageCache, surrogate_keys
+from qubit.core.versions import ContentVersions
 
 
 LOGIN_ERROR_MESSAGES = {
@@ -24,6 +35,21 @@ async def get_admin_status(request: Request) -> bool:
     return await auth_service.check_admin_access()
 
 
+async def page_validators(
+    request: Request, collection: str, item: Optional[str] = None
+) -> dict:
+    """Validator headers for a public page, raising 304 if the visitor is current.
+
+    Signed-in visitors see per-user markup, so their pages get no validators.
+    """
+    if not PageCache.is_anonymous(request):
+        return {}
+    validators = await ContentVersions.get_instance().check(
+        request, collection, "id" if item else None, item
+    )
+    return validators.headers
+
+
 async def feed(request: Request) -> HTMLResponse:
     """Feed page."""
     templates = request.app.state.templates
@@ -33,31 +59,30 @@ async def feed(request: Request) -> HTMLResponse:
 
 async def list_posts(request: Request) -> HTMLResponse:
     """List all posts."""
+    validators = await page_validators(request, "posts")
     templates = request.app.state.templates
     db = get_posts_db(request)
     user = await get_current_user(request)
     post_service = PostService(db)
-    posts = await post_service.get_posts(
+    posts = await post_service.get_post_summaries(
         limit=100,
         offset=0,
         published_only=True,
     )
     logger.debug(f"Found {len(posts)} published posts for index")
 
-    years = {}
-    for post in posts:
-        year = post.created_at.strftime("%Y")
-        if year not in years:
-            years[year] = []
-        years[year].append(post)
+    years = group_by_year(posts)
 
     return templates.TemplateResponse(
-        "posts.html", {"request": request, "user": user, "posts": posts, "years": years}
+        "posts.html",
+        {"request": request, "user": user, "posts": posts, "years": years},
+        headers={**surrogate_keys("posts:list"), **validators},
     )
 
 
 async def view_post(request: Request, post_id: str) -> HTMLResponse:
     """View single post."""
+    validators = await page_validators(request, "posts", post_id)
     templates = request.app.state.templates
     db = get_posts_db(request)
     user = await get_current_user(request)
@@ -65,9 +90,22 @@ async def view_post(request: Request, post_id: str) -> HTMLResponse:
     post = await post_service.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
+    await ContentVersions.get_instance().seed("posts", "id", str(post.id))
+    related = await post_service.get_related_posts(post)
     return templates.TemplateResponse(
         "post.html",
-        {"request": request, "post_id": post_id, "user": user, "post": post},
+        {
+            "request": request,
+            "post_id": post_id,
+            "user": user,
+            "post": post,
+            "related": related,
+        },
+        # Drafts are never tagged, so the page cache won't keep them
+        headers={
+            **(surrogate_keys(f"post:{post.id}") if post.published else {}),
+            **validators,
+        },
     )
 
 
@@ -80,7 +118,7 @@ async def writer_hub(request: Request) -> HTMLResponse:
 
     db = get_posts_db(request)
     post_service = PostService(db)
-    drafts = await post_service.get_posts(
+    drafts = await post_service.get_post_summaries(
         limit=100,
         offset=0,
         published_only=False,
@@ -90,7 +128,7 @@ async def writer_hub(request: Request) -> HTMLResponse:
     drafts = [post for post in drafts if not post.published]
     logger.debug(f"Found {len(drafts)} drafts")
 
-    published = await post_service.get_posts(
+    published = await post_service.get_post_summaries(
         limit=100,
         offset=0,
         published_only=True,
@@ -135,11 +173,76 @@ async def hub_edit_post(request: Request, post_id: str) -> HTMLResponse:
 
 async def about(request: Request) -> HTMLResponse:
     """About page."""
+    # Only changes with the config, and versions restart with the app
+    validators = await page_validators(request, "site")
     templates = request.app.state.templates
     user = await get_current_user(request)
     return templates.TemplateResponse(
         "about.html",
         {"request": request, "author": request.app.state.config.author, "user": user},
+        headers={**surrogate_keys("about"), **validators},
+    )
+
+
+def syndication_service(request: Request) -> SyndicationService:
+    """Feed renderer with absolute URLs for this site."""
+    config = request.app.state.config
+    return SyndicationService(
+        config.author, config.server.base_url or str(request.base_url)
+    )
+
+
+async def posts_feed(request: Request) -> Response:
+    """RSS, Atom or JSON feed of published posts."""
+    validators = await page_validators(request, "posts")
+    fmt = FEED_FORMATS[request.url.path.rsplit("/", 1)[-1]]
+    posts = await PostService(get_posts_db(request)).get_post_summaries(
+        limit=FEED_LIMIT, offset=0, published_only=True
+    )
+    service = syndication_service(request)
+    body = service.render(
+        fmt,
+        request.app.state.config.author.name,
+        "/",
+        request.url.path,
+        service.post_items(posts),
+    )
+    return Response(
+        content=body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={**surrogate_keys("posts:list"), **validators},
+    )
+
+
+async def microblog_feed(request: Request) -> Response:
+    """RSS, Atom or JSON feed of microblog posts."""
+    validators = await page_validators(request, "feed")
+    fmt = FEED_FORMATS[request.url.path.rsplit("/", 1)[-1]]
+    entries = await get_feed_db(request).get_feed_posts(limit=FEED_LIMIT)
+    service = syndication_service(request)
+    body = service.render(
+        fmt,
+        f"{request.app.state.config.author.name} (feed)",
+        "/feed",
+        request.url.path,
+        service.microblog_items(entries),
+    )
+    return Response(
+        content=body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={**surrogate_keys("feed:list"), **validators},
+    )
+
+
+async def sitemap(request: Request) -> Response:
+    """Sitemap of public pages and published posts."""
+    validators = await page_validators(request, "posts")
+    posts = await get_posts_db(request).get_post_versions()
+    body = syndication_service(request).sitemap(["/", "/about", "/feed"], posts)
+    return Response(
+        content=body,
+        media_type=MEDIA_TYPES["sitemap"],
+        headers={**surrogate_keys("posts:list"), **validators},
     )
 
 
@@ -164,3 +267,13 @@ async def admin_settings(request: Request) -> HTMLResponse:
         "admin/settings.html",
         {"request": request, "config": request.app.state.config, "user": user},
     )
+
+
+async def highlight_css(request: Request) -> Response:
+    """Shared stylesheet for server-highlighted code blocks."""
+    style = request.app.state.config.render.highlight_style
+    return Response(
+        content=highlight_stylesheet(style),
+        media_type="text/css",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )